@@ -0,0 +1,126 @@
+"""
+Throughput of ArbitrageEngine: Decimal maths vs integer ticks vs batch evaluation
+
+Usage: python benchmarks/bench_arbitrage_engine.py [--matches N] [--rounds R]
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from clients.order_book import OrderBook
+from core.arbitrage_engine import ArbitrageEngine, np
+
+
+class DecimalEngine:
+    """The previous Decimal implementation of the per-match path, kept as the baseline"""
+    
+    def __init__(self, min_spread_pct: Decimal):
+        self.min_spread_pct = min_spread_pct
+        self._one = Decimal('1')
+        self._hundred = Decimal('100')
+        self._zero = Decimal('0')
+    
+    def calculate_spread(self, price1: Decimal, price2: Decimal) -> Decimal:
+        if not price1 or not price2 or price1 <= self._zero or price2 <= self._zero:
+            return self._zero
+        mid = (price1 + price2) / 2
+        return abs(price1 - price2) / mid * self._hundred
+    
+    def _evaluate(self, lim_price, poly_price) -> Optional[Tuple[Decimal, Decimal, Decimal]]:
+        if not lim_price or not poly_price:
+            return None
+        total_cost = lim_price + poly_price
+        if total_cost >= self._one:
+            return None
+        profit_pct = (self._one - total_cost) / total_cost * self._hundred
+        spread = self.calculate_spread(lim_price, self._one - poly_price)
+        if spread < self.min_spread_pct:
+            return None
+        return total_cost, spread, profit_pct
+    
+    @staticmethod
+    def _price(level: Optional[float]) -> Optional[Decimal]:
+        return Decimal(repr(level)) if level is not None else None
+    
+    def find_arbitrage(self, lim_book: OrderBook, poly_book: OrderBook):
+        found = [
+            opp for opp in (
+                self._evaluate(self._price(lim_book.yes_ask), self._price(poly_book.no_ask)),
+                self._evaluate(self._price(lim_book.no_ask), self._price(poly_book.yes_ask)),
+            ) if opp
+        ]
+        return max(found, key=lambda x: x[2]) if found else None
+
+
+def make_books(count: int, seed: int) -> List[Tuple[OrderBook, OrderBook]]:
+    """Random book pairs around fair value, a few percent of them crossed"""
+    rng = random.Random(seed)
+    pairs = []
+    for i in range(count):
+        fair = rng.uniform(0.05, 0.95)
+        edge = rng.uniform(-0.04, 0.06)
+        lim_yes = round(fair + edge / 2 + 0.01, 3)
+        poly_no = round(1 - fair + edge / 2 + 0.01, 3)
+        pairs.append((
+            OrderBook.from_levels(f"lim-{i}", yes_asks=[(lim_yes, 100.0)], no_asks=[(round(1 - fair + 0.02, 3), 100.0)]),
+            OrderBook.from_levels(f"poly-{i}", yes_asks=[(round(fair + 0.02, 3), 100.0)], no_asks=[(poly_no, 100.0)]),
+        ))
+    return pairs
+
+
+def bench(name: str, find, pairs, rounds: int) -> float:
+    found = 0
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for lim_book, poly_book in pairs:
+            if find(lim_book, poly_book) is not None:
+                found += 1
+    elapsed = time.perf_counter() - started
+    rate = len(pairs) * rounds / elapsed
+    print(f"{name:<14} {rate:>12,.0f} evals/s  ({found // rounds} opportunities per round)")
+    return rate
+
+
+def bench_batch(engine: ArbitrageEngine, pairs, rounds: int) -> float:
+    matches = list(range(len(pairs)))
+    found = 0
+    started = time.perf_counter()
+    for _ in range(rounds):
+        found += len(engine.evaluate_batch(matches, pairs))
+    elapsed = time.perf_counter() - started
+    rate = len(pairs) * rounds / elapsed
+    label = "batch (numpy)" if np is not None else "batch (no numpy)"
+    print(f"{label:<14} {rate:>12,.0f} evals/s  ({found // rounds} opportunities per round)")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--matches", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    # Opportunities are logged at INFO; keep the timing loop quiet
+    logging.disable(logging.INFO)
+    
+    min_spread = Decimal('3.0')
+    pairs = make_books(args.matches, args.seed)
+    engine = ArbitrageEngine(min_spread, Decimal('10'), Decimal('0.5'))
+    
+    print(f"{args.matches} matches x {args.rounds} rounds")
+    before = bench("Decimal", DecimalEngine(min_spread).find_arbitrage, pairs, args.rounds)
+    after = bench("integer ticks", engine.find_arbitrage, pairs, args.rounds)
+    batch = bench_batch(engine, pairs, args.rounds)
+    print(f"speed-up: {after / before:.1f}x integer ticks, {batch / before:.1f}x batch")
+
+
+if __name__ == "__main__":
+    main()
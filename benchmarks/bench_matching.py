@@ -0,0 +1,117 @@
+"""
+Cross-venue matching: nested loops per time slot vs the sorted-strike MatchIndex
+
+Usage: python benchmarks/bench_matching.py [--markets N] [--slots S] [--churn C]
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from clients.market_sync import MARKET_ADDED, MARKET_CHANGED, MarketEvent
+from core.market_registry import LIMITLESS, POLYMARKET, MarketRecord
+from core.match_index import MatchIndex
+
+
+def make_records(count: int, venue: str, slots: int, rng: random.Random) -> List[MarketRecord]:
+    """Hourly BTC markets spread over `slots` expiry slots and a $60k-$140k strike range"""
+    expiry = datetime.now(timezone.utc)
+    records = []
+    for i in range(count):
+        n = rng.randrange(slots)
+        slot = f"{n % 24:02d}:{n // 24 % 4 * 15:02d}"
+        records.append(MarketRecord(
+            venue=venue,
+            id=f"{venue}-{i}",
+            asset="BTC",
+            strike=Decimal(rng.randrange(6_000_000, 14_000_000)) / 100,
+            expiry=expiry,
+            slot=slot,
+            token_ids=(f"yes-{i}", f"no-{i}") if venue == POLYMARKET else None,
+            tick_size=0.01
+        ))
+    return records
+
+
+def nested_join(lim: List[MarketRecord], poly: List[MarketRecord], max_diff: Decimal) -> int:
+    """The previous approach: bucket by slot, then compare every strike pair"""
+    lim_map: Dict[str, List[MarketRecord]] = {}
+    poly_map: Dict[str, List[MarketRecord]] = {}
+    for record in lim:
+        lim_map.setdefault(record.slot, []).append(record)
+    for record in poly:
+        poly_map.setdefault(record.slot, []).append(record)
+    
+    found = 0
+    for slot, lim_records in lim_map.items():
+        for lim_record in lim_records:
+            for poly_record in poly_map.get(slot, ()):
+                if abs(lim_record.strike - poly_record.strike) <= max_diff:
+                    found += 1
+    return found
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--markets", type=int, default=10_000, help="markets per venue")
+    parser.add_argument("--slots", type=int, default=24, help="distinct expiry slots")
+    parser.add_argument("--churn", type=int, default=100, help="changed markets per steady-state scan")
+    parser.add_argument("--max-diff", type=Decimal, default=Decimal('200'))
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    # Every new match is logged at INFO; keep the timing loop quiet
+    logging.disable(logging.INFO)
+    
+    rng = random.Random(args.seed)
+    lim = make_records(args.markets, LIMITLESS, args.slots, rng)
+    poly = make_records(args.markets, POLYMARKET, args.slots, rng)
+    print(f"{args.markets} markets per venue, {args.slots} slots, max diff ${args.max_diff}")
+    
+    nested, nested_time = timed(lambda: nested_join(lim, poly, args.max_diff))
+    print(f"nested loops     {nested_time * 1000:>9.1f} ms  ({nested} matches)")
+    
+    index = MatchIndex(args.max_diff)
+    
+    def load() -> int:
+        for record in lim + poly:
+            index.apply(MarketEvent(MARKET_ADDED, record.id, record))
+        return len(index)
+    
+    indexed, index_time = timed(load)
+    print(f"sorted index     {index_time * 1000:>9.1f} ms  ({indexed} matches, full load)")
+    
+    # Steady state: only changed markets are re-matched
+    changed = rng.sample(lim, min(args.churn, len(lim)))
+    
+    def churn() -> None:
+        for record in changed:
+            moved = MarketRecord(
+                record.venue, record.id, record.asset, record.strike + 1,
+                record.expiry, record.slot, record.token_ids, record.tick_size
+            )
+            index.apply(MarketEvent(MARKET_CHANGED, moved.id, moved))
+    
+    _, churn_time = timed(churn)
+    print(f"incremental scan {churn_time * 1000:>9.1f} ms  ({len(changed)} changed markets)")
+    print(f"speed-up: {nested_time / index_time:.1f}x full load, {nested_time / churn_time:.0f}x per scan")
+    
+    if nested != indexed:
+        raise SystemExit(f"match count mismatch: nested {nested} vs index {indexed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Fast-path JSON decoding into compact, slotted venue records"""
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Pick the fastest available JSON backend: msgspec, then orjson, then stdlib
+try:
+    import msgspec
+    
+    _decoder = msgspec.json.Decoder()
+    loads = _decoder.decode
+    BACKEND = "msgspec"
+except ImportError:
+    try:
+        import orjson
+        
+        loads = orjson.loads
+        BACKEND = "orjson"
+    except ImportError:
+        loads = json.loads
+        BACKEND = "json"
+
+Level = Tuple[float, float]  # (price, size)
+
+
+def _levels(raw: Optional[Iterable[Dict]]) -> Tuple[Level, ...]:
+    """Keep only (price, size) per level"""
+    if not raw:
+        return ()
+    return tuple((float(level['price']), float(level['size'])) for level in raw)
+
+
+def _items(data: Any) -> List[Dict]:
+    """List payload, either bare or wrapped in {"data": [...]}"""
+    if isinstance(data, dict):
+        return data.get('data') or []
+    return data or []
+
+
+class PolymarketBook:
+    """Order book for one CLOB token"""
+    
+    __slots__ = ('asset_id', 'bids', 'asks')
+    
+    def __init__(self, asset_id: str, bids: Tuple[Level, ...], asks: Tuple[Level, ...]):
+        self.asset_id = asset_id
+        self.bids = bids
+        self.asks = asks
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PolymarketBook":
+        return cls(
+            data.get('asset_id'),
+            _levels(data.get('bids') or data.get('buys')),
+            _levels(data.get('asks') or data.get('sells'))
+        )
+
+
+class PolymarketMarket:
+    """CLOB market fields the bot actually reads"""
+    
+    __slots__ = ('condition_id', 'question', 'active', 'tokens', 'tick_size', 'end_date')
+    
+    def __init__(
+        self,
+        condition_id: str,
+        question: str,
+        active: bool,
+        tokens: Tuple[Tuple[str, str], ...],
+        tick_size: Optional[float] = None,
+        end_date: Optional[str] = None
+    ):
+        self.condition_id = condition_id
+        self.question = question
+        self.active = active
+        self.tokens = tokens  # ((token_id, outcome), ...)
+        self.tick_size = tick_size
+        self.end_date = end_date
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PolymarketMarket":
+        tick_size = data.get('minimum_tick_size')
+        return cls(
+            data.get('condition_id'),
+            data.get('question') or '',
+            bool(data.get('active', False)),
+            tuple(
+                (t.get('token_id'), str(t.get('outcome', '')))
+                for t in data.get('tokens') or ()
+            ),
+            float(tick_size) if tick_size is not None else None,
+            data.get('end_date_iso')
+        )
+
+
+class LimitlessBook:
+    """YES/NO ladders for one Limitless market"""
+    
+    __slots__ = ('yes_bids', 'yes_asks', 'no_bids', 'no_asks')
+    
+    def __init__(
+        self,
+        yes_bids: Tuple[Level, ...],
+        yes_asks: Tuple[Level, ...],
+        no_bids: Tuple[Level, ...],
+        no_asks: Tuple[Level, ...]
+    ):
+        self.yes_bids = yes_bids
+        self.yes_asks = yes_asks
+        self.no_bids = no_bids
+        self.no_asks = no_asks
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LimitlessBook":
+        yes, no = data.get('yes'), data.get('no')
+        if isinstance(yes, dict) or isinstance(no, dict):
+            yes, no = yes or {}, no or {}
+            return cls(
+                _levels(yes.get('bids')), _levels(yes.get('asks')),
+                _levels(no.get('bids')), _levels(no.get('asks'))
+            )
+        
+        # Single YES book: NO is its complement (buy NO = sell YES at 1 - p)
+        yes_bids = _levels(data.get('bids'))
+        yes_asks = _levels(data.get('asks'))
+        return cls(
+            yes_bids,
+            yes_asks,
+            tuple((round(1.0 - p, 6), s) for p, s in yes_asks),
+            tuple((round(1.0 - p, 6), s) for p, s in yes_bids)
+        )
+    
+    def __bool__(self) -> bool:
+        return bool(self.yes_bids or self.yes_asks or self.no_bids or self.no_asks)
+
+
+class LimitlessMarket:
+    """Limitless market fields the bot actually reads"""
+    
+    __slots__ = ('id', 'title', 'question', 'active', 'slug', 'expiration')
+    
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        question: str = '',
+        active: bool = True,
+        slug: Optional[str] = None,
+        expiration: Optional[Any] = None
+    ):
+        self.id = id
+        self.title = title
+        self.question = question
+        self.active = active
+        self.slug = slug
+        self.expiration = expiration
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LimitlessMarket":
+        market_id = data.get('id')
+        return cls(
+            str(market_id) if market_id is not None else None,
+            data.get('title') or '',
+            data.get('question') or '',
+            bool(data.get('active', True)),
+            data.get('slug'),
+            data.get('expirationTimestamp') or data.get('deadline')
+        )
+
+
+def record_key(record) -> Tuple:
+    """Value tuple of a slotted record, for hashing and change detection"""
+    return tuple(getattr(record, slot) for slot in record.__slots__)
+
+
+def decode_polymarket_book(body: bytes) -> Optional[PolymarketBook]:
+    data = loads(body) if body else None
+    return PolymarketBook.from_dict(data) if isinstance(data, dict) else None
+
+
+def decode_polymarket_books(body: bytes) -> Dict[str, PolymarketBook]:
+    data = loads(body) if body else None
+    books = (PolymarketBook.from_dict(b) for b in data or () if isinstance(b, dict))
+    return {book.asset_id: book for book in books}
+
+
+def decode_polymarket_markets(body: bytes) -> Tuple[List[PolymarketMarket], Optional[str]]:
+    """One cursor page of markets and the next cursor"""
+    data = loads(body) if body else None
+    next_cursor = data.get('next_cursor') if isinstance(data, dict) else None
+    return [PolymarketMarket.from_dict(m) for m in _items(data)], next_cursor
+
+
+def decode_polymarket_market(body: bytes) -> Optional[PolymarketMarket]:
+    data = loads(body) if body else None
+    return PolymarketMarket.from_dict(data) if isinstance(data, dict) else None
+
+
+def decode_limitless_book(body: bytes) -> Optional[LimitlessBook]:
+    data = loads(body) if body else None
+    return LimitlessBook.from_dict(data) if isinstance(data, dict) else None
+
+
+def decode_limitless_markets(body: bytes) -> List[LimitlessMarket]:
+    data = loads(body) if body else None
+    return [LimitlessMarket.from_dict(m) for m in _items(data)]
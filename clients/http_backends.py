@@ -0,0 +1,263 @@
+"""Pluggable HTTP client backends beneath HttpTransport"""
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import aiohttp
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+# (status, headers, body)
+RawResponse = Tuple[int, Mapping[str, str], bytes]
+
+
+class HttpBackend(ABC):
+    """
+    Raw request sender used by HttpTransport
+    
+    Backends raise asyncio.TimeoutError for timeouts and ConnectionError
+    (or an aiohttp connection error) for transport failures, so retry
+    classification is the same whichever backend is selected.
+    """
+    
+    name = "base"
+    
+    def __init__(
+        self,
+        *,
+        pool_size: int,
+        pool_per_host: int,
+        dns_cache_ttl: int,
+        keepalive_timeout: float,
+        connect_timeout: float,
+        default_timeout: float,
+        default_headers: Dict[str, str],
+        transport_name: str
+    ):
+        self.pool_size = pool_size
+        self.pool_per_host = pool_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.connect_timeout = connect_timeout
+        self.default_timeout = default_timeout
+        self.default_headers = default_headers
+        self.transport_name = transport_name
+        
+        # New connections (DNS + TCP + TLS) per operation, and pooled reuses
+        self.handshakes: Dict[str, int] = {}
+        self.reused = 0
+    
+    def _record_handshake(self, operation: str) -> None:
+        self.handshakes[operation] = self.handshakes.get(operation, 0) + 1
+    
+    @abstractmethod
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict],
+        headers: Optional[Dict[str, str]],
+        data: Optional[bytes],
+        json_body: Any,
+        timeout: float,
+        operation: str = "default"
+    ) -> RawResponse:
+        """Send one request and return (status, headers, body)"""
+    
+    def connection_stats(self) -> Dict[str, int]:
+        """Connections currently in use and idle in the pool"""
+        return {'in_use': 0, 'idle': 0}
+    
+    async def close(self) -> None:
+        pass
+
+
+class AiohttpBackend(HttpBackend):
+    """HTTP/1.1 keep-alive pool on aiohttp's TCPConnector"""
+    
+    name = "aiohttp"
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._timeouts: Dict[float, aiohttp.ClientTimeout] = {}
+        self._lock = asyncio.Lock()
+        
+        self._trace = aiohttp.TraceConfig()
+        self._trace.on_connection_create_end.append(self._on_connection_created)
+        self._trace.on_connection_reuseconn.append(self._on_connection_reused)
+    
+    async def _on_connection_created(self, session, context, params) -> None:
+        self._record_handshake((context.trace_request_ctx or {}).get('operation', 'default'))
+    
+    async def _on_connection_reused(self, session, context, params) -> None:
+        self.reused += 1
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazy initialization of the pooled session"""
+        if self._session is None or self._session.closed:
+            async with self._lock:
+                if self._session is None or self._session.closed:
+                    self._connector = aiohttp.TCPConnector(
+                        limit=self.pool_size,
+                        limit_per_host=self.pool_per_host,
+                        ttl_dns_cache=self.dns_cache_ttl,
+                        use_dns_cache=True,
+                        keepalive_timeout=self.keepalive_timeout,
+                        enable_cleanup_closed=True
+                    )
+                    self._session = aiohttp.ClientSession(
+                        connector=self._connector,
+                        timeout=self._timeout(self.default_timeout),
+                        headers=self.default_headers,
+                        trace_configs=[self._trace]
+                    )
+                    logger.info(
+                        f"{self.transport_name} aiohttp pool initialized "
+                        f"(pool={self.pool_size}, per_host={self.pool_per_host})"
+                    )
+        return self._session
+    
+    def _timeout(self, total: float) -> aiohttp.ClientTimeout:
+        """Cached ClientTimeout for a total budget"""
+        timeout = self._timeouts.get(total)
+        if timeout is None:
+            timeout = self._timeouts[total] = aiohttp.ClientTimeout(
+                total=total,
+                connect=min(self.connect_timeout, total)
+            )
+        return timeout
+    
+    async def send(
+        self, method, url, *, params, headers, data, json_body, timeout, operation="default"
+    ) -> RawResponse:
+        session = await self._get_session()
+        async with session.request(
+            method,
+            url,
+            params=params,
+            headers=headers,
+            data=data,
+            json=json_body,
+            timeout=self._timeout(timeout),
+            trace_request_ctx={'operation': operation}
+        ) as response:
+            return response.status, response.headers, await response.read()
+    
+    def connection_stats(self) -> Dict[str, int]:
+        connector = self._connector
+        if connector is None:
+            return {'in_use': 0, 'idle': 0}
+        return {
+            'in_use': len(getattr(connector, '_acquired', ())),
+            'idle': sum(len(conns) for conns in getattr(connector, '_conns', {}).values()),
+        }
+    
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._connector = None
+
+
+class Http2Backend(HttpBackend):
+    """
+    HTTP/2 multiplexed client on httpx
+    
+    Concurrent requests to one host share a single connection as separate
+    streams instead of each holding a pooled HTTP/1.1 connection. Requires
+    `pip install "httpx[http2]"`.
+    """
+    
+    name = "http2"
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if httpx is None:
+            logger.error('httpx not installed. Run: pip install "httpx[http2]"')
+            raise ImportError("httpx is required for the http2 backend")
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._lock = asyncio.Lock()
+    
+    async def _get_client(self) -> "httpx.AsyncClient":
+        if self._client is None or self._client.is_closed:
+            async with self._lock:
+                if self._client is None or self._client.is_closed:
+                    self._client = httpx.AsyncClient(
+                        http2=True,
+                        limits=httpx.Limits(
+                            max_connections=self.pool_size,
+                            max_keepalive_connections=self.pool_per_host,
+                            keepalive_expiry=self.keepalive_timeout
+                        ),
+                        timeout=httpx.Timeout(self.default_timeout, connect=self.connect_timeout),
+                        headers=self.default_headers
+                    )
+                    logger.info(f"{self.transport_name} HTTP/2 client initialized")
+        return self._client
+    
+    async def send(
+        self, method, url, *, params, headers, data, json_body, timeout, operation="default"
+    ) -> RawResponse:
+        client = await self._get_client()
+        connected = False
+        
+        async def trace(event: str, info) -> None:
+            nonlocal connected
+            if event == "connection.connect_tcp.complete":
+                connected = True
+                self._record_handshake(operation)
+        
+        try:
+            response = await client.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                content=data,
+                json=json_body,
+                timeout=httpx.Timeout(timeout, connect=min(self.connect_timeout, timeout)),
+                extensions={"trace": trace}
+            )
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        if not connected:
+            self.reused += 1
+        return response.status_code, response.headers, response.content
+    
+    def connection_stats(self) -> Dict[str, int]:
+        # httpx does not expose its pool; report open HTTP/2 connections if visible
+        pool = getattr(getattr(self._client, '_transport', None), '_pool', None)
+        connections = getattr(pool, 'connections', None) or ()
+        idle = sum(1 for conn in connections if getattr(conn, 'is_idle', lambda: False)())
+        return {'in_use': len(connections) - idle, 'idle': idle}
+    
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+
+BACKENDS = {
+    AiohttpBackend.name: AiohttpBackend,
+    Http2Backend.name: Http2Backend,
+}
+
+
+def create_backend(name: str, **kwargs) -> HttpBackend:
+    """Instantiate a backend by its config name ("aiohttp" or "http2")"""
+    try:
+        backend_cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown HTTP backend {name!r}; choose from {sorted(BACKENDS)}")
+    return backend_cls(**kwargs)
@@ -1,14 +1,18 @@
 """Optimized Limitless Exchange CLOB API client"""
 import asyncio
-import aiohttp
 import logging
-import hmac
-import hashlib
-import json
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Callable, Dict, FrozenSet, List, Optional
 from decimal import Decimal
-from tenacity import retry, stop_after_attempt, wait_exponential
-from datetime import datetime
+
+from clients.decoders import LimitlessBook, LimitlessMarket, decode_limitless_book, decode_limitless_markets
+from clients.limitless_signing import LimitlessRequestSigner, PreparedRequest
+from clients.limitless_stream import LimitlessOrderbookFeed
+from clients.order_book import OrderBook
+from clients.market_sync import MarketEvent, MarketTable, PageValidator, body_digest
+from clients.transport import TRANSIENT_ERRORS, HttpResponse, HttpTransport
+from utils.pagination import iter_numbered_pages
+from utils.hedging import RequestHedger
+from utils.retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -16,170 +20,398 @@ logger = logging.getLogger(__name__)
 class LimitlessClient:
     """High-performance async Limitless Exchange client"""
     
+    # Order POSTs are not idempotent: only retry statuses that mean "not accepted"
+    ORDER_RETRY_STATUSES = frozenset({429})
+    
     def __init__(
         self, 
         api_key: str,
         api_secret: str,
-        host: str = "https://api.limitless.exchange/api-v1"
+        host: str = "https://api.limitless.exchange/api-v1",
+        timeout: float = 8,
+        max_concurrent: int = 20,
+        transport: Optional[HttpTransport] = None,
+        discovery_page_size: int = 100,
+        discovery_prefetch: int = 3,
+        sync_mode: bool = False,
+        ws_url: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedger: Optional[RequestHedger] = None
     ):
         self.api_key = api_key
         self.api_secret = api_secret
         self.host = host
-        self._session: Optional[aiohttp.ClientSession] = None
-        self._lock = asyncio.Lock()
-    
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Lazy initialization of aiohttp session with thread safety"""
-        if self._session is None or self._session.closed:
-            async with self._lock:
-                if self._session is None or self._session.closed:
-                    self._session = aiohttp.ClientSession(
-                        timeout=aiohttp.ClientTimeout(total=30)
-                    )
-                    logger.info("Limitless client session initialized")
-        return self._session
-    
-    def _generate_signature(self, method: str, endpoint: str, params: Dict = None, body: Dict = None) -> str:
-        """Generate HMAC signature for authenticated requests"""
-        timestamp = str(int(datetime.utcnow().timestamp() * 1000))
-        
-        # Create signature payload (adjust based on actual Limitless requirements)
-        message = f"{timestamp}{method}{endpoint}"
-        if params:
-            message += json.dumps(params, sort_keys=True)
-        if body:
-            message += json.dumps(body, sort_keys=True)
+        self._signer = LimitlessRequestSigner(api_key, api_secret)
+        self._transport = transport or HttpTransport(
+            host,
+            request_timeout=timeout,
+            max_concurrent=max_concurrent,
+            name="limitless"
+        )
+        self._retry = retry_policy or RetryPolicy(
+            retryable_exceptions=TRANSIENT_ERRORS,
+            name="limitless"
+        )
+        self._hedger = hedger
+        self.discovery_page_size = discovery_page_size
+        self.discovery_prefetch = discovery_prefetch
+        # False while a discovery walk runs and after one that ended on a page error
+        self.discovery_complete = False
         
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        # Incremental market sync state
+        self.sync_mode = sync_mode
+        self._market_table = MarketTable()
+        self._page_validators: Dict[int, PageValidator] = {}
+        self._market_listeners: List[Callable[[MarketEvent], None]] = []
+        self._sync_lock = asyncio.Lock()
+        self._changed_pages = set()
+        self._synced_page_count = 0
+        self._synced = False
         
-        return signature, timestamp
+        # Optional push/poll order-book feed, started by subscribe_orderbooks()
+        self.ws_url = ws_url
+        self._feed: Optional[LimitlessOrderbookFeed] = None
+        # Market id -> slug of discovered markets; the socket feed is keyed by slug
+        self._slugs: Dict[str, str] = {}
+    
+    @property
+    def transport(self) -> HttpTransport:
+        return self._transport
+    
+    def pool_stats(self) -> Dict:
+        """Connection pool utilisation counters"""
+        return self._transport.pool_stats()
     
-    def _get_headers(self, method: str, endpoint: str, params: Dict = None, body: Dict = None, authenticated: bool = True) -> Dict:
-        """Generate request headers"""
+    def retry_stats(self) -> Dict:
+        """Retry attempt and give-up counters"""
+        return self._retry.snapshot()
+    
+    def hedge_stats(self) -> Dict:
+        """Hedge rate and hedge/win ratio for order-book reads"""
+        return self._hedger.snapshot() if self._hedger is not None else {}
+    
+    async def warm_connections(self, connections: int = 1) -> int:
+        """Open or refresh pooled connections with a one-item market listing"""
+        return await self._transport.warm(
+            "/markets", connections, params={"page": "1", "limit": "1"}
+        )
+    
+    def _get_headers(self, request: PreparedRequest, authenticated: bool = True) -> Dict:
+        """Generate request headers, signing the prepared body bytes"""
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
         
         if authenticated:
-            signature, timestamp = self._generate_signature(method, endpoint, params, body)
-            headers.update({
-                "X-API-Key": self.api_key,
-                "X-Timestamp": timestamp,
-                "X-Signature": signature
-            })
+            headers.update(self._signer.auth_headers(request))
         
         return headers
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8)
-    )
-    async def get_markets(self, active_only: bool = True) -> List[Dict]:
-        """Fetch all markets from Limitless Exchange"""
-        try:
-            session = await self._get_session()
-            endpoint = "/markets"
-            url = f"{self.host}{endpoint}"
-            
-            params = {"active": active_only} if active_only else {}
-            headers = self._get_headers("GET", endpoint, params=params, authenticated=False)
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        operation: str,
+        params: Optional[Dict] = None,
+        body: Optional[Dict] = None,
+        authenticated: bool = False,
+        extra_headers: Optional[Dict[str, str]] = None,
+        ok_statuses: FrozenSet[int] = frozenset(),
+        retry_statuses: Optional[FrozenSet[int]] = None,
+        idempotent: bool = True,
+        hedge_key: Optional[str] = None
+    ) -> HttpResponse:
+        """
+        Send a request under the client's retry policy
+        
+        The body is serialised once; every attempt re-signs (fresh timestamp)
+        and sends that same buffer.
+        """
+        request = PreparedRequest(method, endpoint, params, body)
+        
+        async def send() -> HttpResponse:
+            headers = self._get_headers(request, authenticated=authenticated)
+            if extra_headers:
+                headers.update(extra_headers)
             
-            async with session.get(url, params=params, headers=headers) as response:
+            return await self._transport.request(
+                method, endpoint, operation=operation, params=params, headers=headers, data=request.body,
+                hedger=self._hedger, hedge_key=hedge_key
+            )
+        
+        async def attempt() -> HttpResponse:
+            response = await send()
+            if response.status not in ok_statuses:
                 response.raise_for_status()
-                data = await response.json()
-                logger.info(f"Fetched {len(data)} markets from Limitless")
-                return data
+            return response
+        
+        return await self._retry.call(
+            attempt, operation=operation, statuses=retry_statuses, idempotent=idempotent
+        )
+    
+    async def get_markets(self, active_only: bool = True) -> List[LimitlessMarket]:
+        """Fetch all markets from Limitless Exchange"""
+        try:
+            params = {"active": "true"} if active_only else {}
+            response = await self._request("GET", "/markets", operation="discovery", params=params)
+            data = decode_limitless_markets(response.body)
+            logger.info(f"Fetched {len(data)} markets from Limitless")
+            return data
         except Exception as e:
             logger.error(f"Error fetching Limitless markets: {e}")
             return []
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8)
-    )
-    async def get_active_hourly_markets(self, asset: str = "BTC") -> List[Dict]:
-        """Fetch active hourly price prediction markets"""
-        try:
-            markets = await self.get_markets(active_only=True)
+    @staticmethod
+    def is_hourly_market(market: LimitlessMarket, asset: str = "BTC") -> bool:
+        """Active hourly price market for the given asset"""
+        title = market.title
+        return (
+            (asset in title or asset in market.question)
+            and ('hourly' in title.lower() or 'UTC' in title)
+            and market.active
+        )
+    
+    async def _request_markets_page(
+        self, 
+        page: int, 
+        extra_headers: Optional[Dict[str, str]] = None
+    ) -> HttpResponse:
+        """Request one page of active markets"""
+        params = {
+            "active": "true",
+            "page": str(page),
+            "limit": str(self.discovery_page_size)
+        }
+        return await self._request(
+            "GET",
+            "/markets",
+            operation="discovery",
+            params=params,
+            extra_headers=extra_headers,
+            ok_statuses=frozenset({304})
+        )
+    
+    async def _fetch_markets_page(self, page: int) -> List[LimitlessMarket]:
+        """Fetch one page of active markets"""
+        response = await self._request_markets_page(page)
+        return decode_limitless_markets(response.body)
+    
+    async def _sync_markets_page(self, page: int) -> List[LimitlessMarket]:
+        """Conditionally fetch one page, reusing the cached items when unchanged"""
+        validator = self._page_validators.setdefault(page, PageValidator())
+        response = await self._request_markets_page(page, validator.conditional_headers())
+        
+        if response.status == 304:
+            if validator.items is not None:
+                return validator.items
+            # Validators outlived the cached items: refetch unconditionally
+            response = await self._request_markets_page(page)
+        
+        validator.etag = response.headers.get('ETag')
+        validator.last_modified = response.headers.get('Last-Modified')
+        
+        # No validators from the server: skip parsing if the bytes are identical
+        digest = body_digest(response.body)
+        if digest == validator.body_digest and validator.items is not None:
+            return validator.items
+        
+        validator.body_digest = digest
+        validator.items = decode_limitless_markets(response.body)
+        self._changed_pages.add(page)
+        return validator.items
+    
+    def on_market_event(self, callback: Callable[[MarketEvent], None]) -> None:
+        """Register a listener for added/removed/changed market events"""
+        self._market_listeners.append(callback)
+    
+    @property
+    def market_table(self) -> MarketTable:
+        return self._market_table
+    
+    async def sync_markets(self) -> List[MarketEvent]:
+        """Bring the local market table up to date and return the changes"""
+        async with self._sync_lock:
+            pages: List[List[LimitlessMarket]] = []
+            previous_digest = None
             
-            # Filter for hourly markets (adjust filters based on actual market structure)
-            return [
-                m for m in markets
-                if asset in m.get('title', '') or asset in m.get('question', '')
-                and 'hourly' in m.get('title', '').lower() or 'UTC' in m.get('title', '')
-                and m.get('active', False)
-            ]
+            async for items in iter_numbered_pages(
+                self._sync_markets_page,
+                page_size=self.discovery_page_size,
+                prefetch=self.discovery_prefetch
+            ):
+                digest = self._page_validators[len(pages) + 1].body_digest
+                # Endpoint ignored the page parameter and repeated itself
+                if pages and digest == previous_digest:
+                    break
+                previous_digest = digest
+                pages.append(items)
+            
+            # Only pages inside the listing count; prefetch may run past the end
+            dirty = (
+                len(pages) != self._synced_page_count
+                or any(page <= len(pages) for page in self._changed_pages)
+            )
+            if self._synced and not dirty:
+                self._changed_pages.clear()
+                return []
+            
+            events = self._market_table.apply_snapshot(
+                market for items in pages for market in items
+            )
+            # Cleared only after a successful apply so a failed sync is retried in full
+            self._changed_pages.clear()
+            self._synced = True
+            self._synced_page_count = len(pages)
+        
+        if events:
+            logger.info(
+                f"Limitless market sync: {len(self._market_table)} markets, "
+                f"{len(events)} change(s)"
+            )
+        for event in events:
+            for listener in self._market_listeners:
+                try:
+                    listener(event)
+                except Exception as e:
+                    logger.error(f"Market event listener failed: {e}", exc_info=True)
+        return events
+    
+    async def iter_active_hourly_markets(self, asset: str = "BTC") -> AsyncIterator[LimitlessMarket]:
+        """Stream active hourly markets page by page as they arrive"""
+        self.discovery_complete = False
+        if self.sync_mode:
+            try:
+                await self.sync_markets()
+                synced = True
+            except Exception as e:
+                synced = False
+                logger.error(f"Limitless market sync failed, serving cached table: {e}")
+            for market in self._market_table.values():
+                if self.is_hourly_market(market, asset):
+                    self._remember_slug(market)
+                    yield market
+            self.discovery_complete = synced
+            return
+        
+        seen_ids = set()
+        fetched = 0
+        try:
+            async for page in iter_numbered_pages(
+                self._fetch_markets_page,
+                page_size=self.discovery_page_size,
+                prefetch=self.discovery_prefetch
+            ):
+                fetched += len(page)
+                new_ids = 0
+                for market in page:
+                    market_id = market.id
+                    if market_id in seen_ids:
+                        continue
+                    seen_ids.add(market_id)
+                    new_ids += 1
+                    if self.is_hourly_market(market, asset):
+                        self._remember_slug(market)
+                        yield market
+                
+                # Endpoint ignored the page parameter and repeated itself
+                if not new_ids:
+                    break
+            self.discovery_complete = True
         except Exception as e:
             logger.error(f"Error fetching hourly markets: {e}")
-            return []
+        
+        logger.info(f"Fetched {fetched} markets from Limitless")
+    
+    def _remember_slug(self, market: LimitlessMarket) -> None:
+        if market.slug:
+            self._slugs[market.id] = market.slug
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8)
-    )
-    async def get_orderbook(self, market_id: str) -> Dict:
-        """Get orderbook for a specific market"""
+    async def get_active_hourly_markets(self, asset: str = "BTC") -> List[LimitlessMarket]:
+        """Fetch active hourly price prediction markets"""
+        return [m async for m in self.iter_active_hourly_markets(asset)]
+    
+    async def get_orderbook(self, market_id: str) -> Optional[LimitlessBook]:
+        """Get orderbook for a specific market (None on error)"""
         try:
-            session = await self._get_session()
-            endpoint = f"/markets/{market_id}/orderbook"
-            url = f"{self.host}{endpoint}"
-            
-            headers = self._get_headers("GET", endpoint, authenticated=False)
-            
-            async with session.get(url, headers=headers) as response:
-                response.raise_for_status()
-                return await response.json()
+            response = await self._request(
+                "GET", 
+                f"/markets/{market_id}/orderbook", 
+                operation="orderbook", 
+                hedge_key="orderbook"
+            )
+            return decode_limitless_book(response.body)
         except Exception as e:
             logger.warning(f"Error fetching orderbook for {market_id}: {e}")
-            return {}
+            return None
+    
+    @staticmethod
+    def book_from_orderbook(market_id: str, orderbook: Optional[LimitlessBook]) -> Optional[OrderBook]:
+        """Full-depth OrderBook from a decoded Limitless book"""
+        if not orderbook:
+            return None
+        return OrderBook.from_levels(
+            market_id,
+            yes_bids=orderbook.yes_bids,
+            yes_asks=orderbook.yes_asks,
+            no_bids=orderbook.no_bids,
+            no_asks=orderbook.no_asks
+        )
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8)
-    )
-    async def get_market_prices(self, market_id: str) -> Dict:
-        """Get orderbook prices for a market"""
+    async def get_market_book(self, market_id: str) -> Optional[OrderBook]:
+        """Full-depth YES/NO book for a market"""
         try:
-            orderbook = await self.get_orderbook(market_id)
-            
-            # Parse orderbook structure (adjust based on actual API response)
-            yes_book = orderbook.get('yes', {}) or orderbook.get('bids', {})
-            no_book = orderbook.get('no', {}) or orderbook.get('asks', {})
+            streamed = self.get_cached_book(market_id)
+            if streamed is not None:
+                return streamed
             
-            return {
-                'yes_ask': Decimal(str(yes_book['asks'][0]['price'])) if yes_book.get('asks') else None,
-                'yes_bid': Decimal(str(yes_book['bids'][0]['price'])) if yes_book.get('bids') else None,
-                'no_ask': Decimal(str(no_book['asks'][0]['price'])) if no_book.get('asks') else None,
-                'no_bid': Decimal(str(no_book['bids'][0]['price'])) if no_book.get('bids') else None,
-                'market_id': market_id,
-                'timestamp': datetime.utcnow().isoformat()
-            }
+            orderbook = await self.get_orderbook(market_id)
+            return self.book_from_orderbook(market_id, orderbook)
         except Exception as e:
-            logger.warning(f"Error fetching prices for {market_id}: {e}")
-            return {}
+            logger.warning(f"Error fetching book for {market_id}: {e}")
+            return None
+    
+    def get_cached_book(self, market_id: str) -> Optional[OrderBook]:
+        """Local subscribed book without any I/O (None if unavailable)"""
+        if self._feed is None or not self._feed.running:
+            return None
+        return self._feed.get_book(market_id)
     
-    async def get_market_prices_batch(self, market_ids: List[str]) -> Dict[str, Dict]:
-        """Fetch prices for multiple markets concurrently"""
+    @property
+    def orderbook_feed(self) -> Optional[LimitlessOrderbookFeed]:
+        return self._feed
+    
+    async def subscribe_orderbooks(self, market_ids: List[str]) -> LimitlessOrderbookFeed:
+        """Keep local books for these markets via the socket feed or adaptive REST polling"""
+        if self._feed is None:
+            self._feed = LimitlessOrderbookFeed(
+                self.get_orderbook,
+                self.book_from_orderbook,
+                ws_url=self.ws_url
+            )
+        await self._feed.subscribe({mid: self._slugs.get(mid) for mid in market_ids})
+        await self._feed.start()
+        return self._feed
+    
+    async def release_orderbooks(self, market_ids: List[str]) -> None:
+        """Stop keeping local books for markets no longer matched"""
+        if self._feed is not None:
+            await self._feed.unsubscribe(market_ids)
+    
+    async def get_market_books_batch(self, market_ids: List[str]) -> Dict[str, OrderBook]:
+        """Fetch books for multiple markets concurrently"""
         if not market_ids:
             return {}
         
-        tasks = [self.get_market_prices(mid) for mid in market_ids]
+        tasks = [self.get_market_book(mid) for mid in market_ids]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         return {
             mid: res for mid, res in zip(market_ids, results)
-            if isinstance(res, dict) and res
+            if isinstance(res, OrderBook) and res
         }
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8)
-    )
     async def place_order(
         self, 
         market_id: str,
@@ -191,10 +423,6 @@ class LimitlessClient:
     ) -> Optional[Dict]:
         """Place order on Limitless Exchange"""
         try:
-            session = await self._get_session()
-            endpoint = "/orders"
-            url = f"{self.host}{endpoint}"
-            
             body = {
                 "market_id": market_id,
                 "outcome": outcome.lower(),
@@ -204,63 +432,76 @@ class LimitlessClient:
                 "type": order_type.lower()
             }
             
-            headers = self._get_headers("POST", endpoint, body=body, authenticated=True)
-            
-            async with session.post(url, json=body, headers=headers) as response:
-                response.raise_for_status()
-                result = await response.json()
-                logger.info(f"✓ Limitless order placed: {outcome.upper()} {side.upper()} ${amount} @ ${price}")
-                return result
+            # Only retry rejections that happen before the order is accepted
+            response = await self._request(
+                "POST",
+                "/orders",
+                operation="order",
+                body=body,
+                authenticated=True,
+                retry_statuses=self.ORDER_RETRY_STATUSES,
+                idempotent=False
+            )
+            result = response.json()
+            logger.info(f"✓ Limitless order placed: {outcome.upper()} {side.upper()} {amount} shares @ ${price}")
+            return result
         except Exception as e:
             logger.error(f"Limitless order failed: {e}")
             raise
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8)
-    )
+    async def place_orders_batch(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Place many orders at once, pipelined over the pooled keep-alive connections
+        
+        The API has no multi-order endpoint, so each order is its own signed
+        POST; they are all put on the wire together rather than one by one.
+        
+        Args:
+            orders: Dicts with market_id, outcome, side, amount, price
+                and optionally order_type
+        
+        Returns:
+            Per-order response, or None where that order failed, in the
+            same order as `orders`
+        """
+        if not orders:
+            return []
+        
+        results = await asyncio.gather(
+            *(self.place_order(**order) for order in orders),
+            return_exceptions=True
+        )
+        return [None if isinstance(r, BaseException) else r for r in results]
+    
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an existing order"""
         try:
-            session = await self._get_session()
-            endpoint = f"/orders/{order_id}"
-            url = f"{self.host}{endpoint}"
-            
-            headers = self._get_headers("DELETE", endpoint, authenticated=True)
-            
-            async with session.delete(url, headers=headers) as response:
-                response.raise_for_status()
-                logger.info(f"✓ Order {order_id} cancelled")
-                return True
+            await self._request(
+                "DELETE", f"/orders/{order_id}", operation="order", authenticated=True
+            )
+            logger.info(f"✓ Order {order_id} cancelled")
+            return True
         except Exception as e:
             logger.error(f"Failed to cancel order {order_id}: {e}")
             return False
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8)
-    )
     async def get_balance(self) -> Dict:
         """Get account balance"""
         try:
-            session = await self._get_session()
-            endpoint = "/account/balance"
-            url = f"{self.host}{endpoint}"
-            
-            headers = self._get_headers("GET", endpoint, authenticated=True)
-            
-            async with session.get(url, headers=headers) as response:
-                response.raise_for_status()
-                return await response.json()
+            response = await self._request(
+                "GET", "/account/balance", operation="default", authenticated=True
+            )
+            return response.json()
         except Exception as e:
             logger.error(f"Error fetching balance: {e}")
             return {}
     
     async def close(self):
-        """Close the aiohttp session"""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            logger.info("Limitless client session closed")
+        """Stop the order-book feed and close the pooled transport"""
+        if self._feed is not None:
+            await self._feed.stop()
+        await self._transport.close()
+        logger.info("Limitless client session closed")
     
     async def __aenter__(self):
         return self
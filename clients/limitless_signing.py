@@ -0,0 +1,63 @@
+"""Serialize-once request signing for authenticated Limitless calls"""
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict, Optional
+
+
+def canonical_json(value: Any) -> bytes:
+    """Canonical encoding used both for the signature and on the wire"""
+    return json.dumps(value, sort_keys=True).encode('utf-8')
+
+
+class PreparedRequest:
+    """
+    A request whose body has been encoded exactly once
+    
+    `body` is the buffer that gets signed and the buffer that gets sent, so
+    the venue always verifies the same bytes it receives. Everything in the
+    signed message except the timestamp is precomputed.
+    """
+    
+    __slots__ = ('method', 'endpoint', 'params', 'body', 'signed_tail')
+    
+    def __init__(self, method: str, endpoint: str, params: Optional[Dict] = None, body: Any = None):
+        self.method = method
+        self.endpoint = endpoint
+        self.params = params
+        self.body = canonical_json(body) if body is not None else None
+        
+        tail = f"{method}{endpoint}".encode('utf-8')
+        if params:
+            tail += canonical_json(params)
+        if self.body:
+            tail += self.body
+        self.signed_tail = tail
+
+
+class LimitlessRequestSigner:
+    """HMAC-SHA256 signer keyed once; each signature copies the keyed state"""
+    
+    __slots__ = ('api_key', '_template')
+    
+    def __init__(self, api_key: str, api_secret: str):
+        self.api_key = api_key
+        self._template = hmac.new(api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+    
+    def sign(self, request: PreparedRequest, timestamp: Optional[str] = None):
+        """Return (signature, timestamp) over timestamp + method + endpoint + params + body"""
+        if timestamp is None:
+            timestamp = str(int(time.time() * 1000))
+        mac = self._template.copy()
+        mac.update(timestamp.encode('ascii'))
+        mac.update(request.signed_tail)
+        return mac.hexdigest(), timestamp
+    
+    def auth_headers(self, request: PreparedRequest) -> Dict[str, str]:
+        signature, timestamp = self.sign(request)
+        return {
+            "X-API-Key": self.api_key,
+            "X-Timestamp": timestamp,
+            "X-Signature": signature
+        }
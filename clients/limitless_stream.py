@@ -0,0 +1,267 @@
+"""Limitless order-book feed: Socket.IO push with adaptive REST polling fallback"""
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, Iterable, Mapping, Optional, Set
+
+import aiohttp
+
+from clients.decoders import LimitlessBook, loads
+from clients.order_book import OrderBook
+
+logger = logging.getLogger(__name__)
+
+
+class _MarketState:
+    """Local book and polling schedule for one market"""
+    
+    __slots__ = ('book', 'updated_at', 'interval', 'next_poll')
+    
+    def __init__(self, interval: float):
+        self.book: Optional[OrderBook] = None
+        self.updated_at = 0.0
+        self.interval = interval
+        self.next_poll = 0.0
+
+
+class LimitlessOrderbookFeed:
+    """
+    Keeps a local order book per Limitless market
+    
+    Pushes arrive over the venue's Socket.IO feed when `ws_url` is set and
+    reachable. The socket addresses markets by slug while books are kept by
+    market id, so pushes are mapped back through the slugs given to
+    `subscribe`. Markets without a slug, or any market while the socket is
+    down, are polled over REST with an interval
+    that shrinks when its book moves and grows while it stays unchanged.
+    Reads (`get_book`) are synchronous and never do I/O.
+    """
+    
+    NAMESPACE = "/markets"
+    
+    def __init__(
+        self,
+        fetch_orderbook: Callable[[str], Awaitable[Optional[LimitlessBook]]],
+        build_book: Callable[[str, LimitlessBook], Optional[OrderBook]],
+        ws_url: Optional[str] = None,
+        min_poll_interval: float = 1.0,
+        max_poll_interval: float = 10.0,
+        backoff_factor: float = 1.5,
+        stale_after: float = 30.0
+    ):
+        self._fetch_orderbook = fetch_orderbook
+        self._build_book = build_book
+        self.ws_url = ws_url
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
+        self.stale_after = stale_after
+        
+        self._markets: Dict[str, _MarketState] = {}
+        self._slugs: Dict[str, str] = {}  # market id -> slug
+        self._ids_by_slug: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._running = False
+        self.streaming = False
+        self.stats = {'pushes': 0, 'polls': 0, 'poll_changes': 0, 'reconnects': 0}
+    
+    @property
+    def running(self) -> bool:
+        return self._running
+    
+    @property
+    def market_ids(self) -> Set[str]:
+        return set(self._markets)
+    
+    def _fresh_state(self, market_id: str) -> Optional[_MarketState]:
+        state = self._markets.get(market_id)
+        if state is None or state.book is None:
+            return None
+        if time.monotonic() - state.updated_at > self.stale_after:
+            return None
+        return state
+    
+    def get_book(self, market_id: str) -> Optional[OrderBook]:
+        """Latest full-depth book, None if unknown or stale"""
+        state = self._fresh_state(market_id)
+        return state.book if state is not None else None
+    
+    async def subscribe(self, markets: Mapping[str, Optional[str]]) -> None:
+        """Track markets, given as {market id: slug or None}"""
+        new_ids = [mid for mid in markets if mid and mid not in self._markets]
+        for mid in new_ids:
+            self._markets[mid] = _MarketState(self.min_poll_interval)
+            slug = markets[mid]
+            if slug:
+                self._slugs[mid] = slug
+                self._ids_by_slug[slug] = mid
+        
+        if new_ids and self._ws is not None and not self._ws.closed:
+            await self._emit_subscribe(self._ws)
+    
+    async def unsubscribe(self, market_ids: Iterable[str]) -> None:
+        """
+        Stop tracking markets; a connected socket is re-sent the remaining
+        slugs, which replaces its subscription, so it stops pushing them
+        """
+        dropped_slugs = False
+        for mid in market_ids:
+            self._markets.pop(mid, None)
+            slug = self._slugs.pop(mid, None)
+            if slug is not None:
+                self._ids_by_slug.pop(slug, None)
+                dropped_slugs = True
+        
+        if dropped_slugs and self._ws is not None and not self._ws.closed:
+            await self._emit_subscribe(self._ws)
+    
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        self._running = False
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _apply(self, market_id: str, orderbook: Optional[LimitlessBook]) -> bool:
+        """Store a new book; returns True if the top of book moved"""
+        state = self._markets.get(market_id)
+        if state is None or not orderbook:
+            return False
+        
+        book = self._build_book(market_id, orderbook)
+        if book is None:
+            return False
+        changed = state.book is None or book.top() != state.book.top()
+        state.book = book
+        state.updated_at = time.monotonic()
+        return changed
+    
+    async def _run(self) -> None:
+        attempt = 0
+        while self._running:
+            if self.ws_url:
+                try:
+                    await self._run_socket()
+                    attempt = 0
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Limitless feed unavailable, polling REST: {e}")
+                finally:
+                    self.streaming = False
+                    self._ws = None
+            
+            # Poll until the next socket attempt (or forever without one)
+            attempt += 1
+            self.stats['reconnects'] += 1
+            retry_in = min(60.0, 2.0 ** attempt) * random.uniform(0.5, 1.0)
+            await self._poll_for(retry_in if self.ws_url else None)
+    
+    async def _poll_for(self, duration: Optional[float], pushed: bool = True) -> None:
+        """Poll due markets for `duration` seconds (forever if None); pushed=False skips slugged markets"""
+        deadline = time.monotonic() + duration if duration is not None else None
+        while self._running and (deadline is None or time.monotonic() < deadline):
+            now = time.monotonic()
+            polled = [
+                (mid, st) for mid, st in self._markets.items()
+                if pushed or mid not in self._slugs
+            ]
+            due = [mid for mid, st in polled if st.next_poll <= now]
+            if due:
+                await asyncio.gather(*(self._poll_market(mid) for mid in due))
+            
+            next_due = min((st.next_poll for _, st in polled), default=now + self.min_poll_interval)
+            wake_at = next_due if deadline is None else min(next_due, deadline)
+            await asyncio.sleep(max(0.05, wake_at - time.monotonic()))
+    
+    async def _poll_market(self, market_id: str) -> None:
+        try:
+            orderbook = await self._fetch_orderbook(market_id)
+        except Exception as e:
+            logger.debug(f"Limitless poll failed for {market_id}: {e}")
+            orderbook = None
+        
+        state = self._markets.get(market_id)
+        if state is None:
+            return
+        
+        self.stats['polls'] += 1
+        if self._apply(market_id, orderbook):
+            self.stats['poll_changes'] += 1
+            state.interval = self.min_poll_interval
+        else:
+            state.interval = min(self.max_poll_interval, state.interval * self.backoff_factor)
+        state.next_poll = time.monotonic() + state.interval
+    
+    async def _emit(self, ws: aiohttp.ClientWebSocketResponse, event: str, data: Dict) -> None:
+        await ws.send_str(f"42{self.NAMESPACE},{json.dumps([event, data])}")
+    
+    async def _emit_subscribe(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        await self._emit(ws, "subscribe_market_prices", {"marketSlugs": sorted(self._ids_by_slug)})
+    
+    async def _run_socket(self) -> None:
+        """Minimal Engine.IO v4 / Socket.IO client for the market namespace"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        
+        url = f"{self.ws_url.rstrip('/')}/socket.io/?EIO=4&transport=websocket"
+        async with self._session.ws_connect(url) as ws:
+            self._ws = ws
+            # Markets without a slug cannot be pushed; keep polling them meanwhile
+            poller = asyncio.create_task(self._poll_for(None, pushed=False))
+            try:
+                await self._read_socket(ws)
+            finally:
+                poller.cancel()
+                await asyncio.gather(poller, return_exceptions=True)
+    
+    async def _read_socket(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        async for msg in ws:
+            if msg.type != aiohttp.WSMsgType.TEXT:
+                if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+                continue
+            
+            data = msg.data
+            if data.startswith('0'):
+                # Engine.IO open -> join the namespace
+                await ws.send_str(f"40{self.NAMESPACE},")
+            elif data == '2':
+                await ws.send_str('3')
+            elif data.startswith(f"40{self.NAMESPACE}"):
+                self.streaming = True
+                logger.info(f"Limitless feed connected ({len(self._markets)} markets)")
+                await self._emit_subscribe(ws)
+            elif data.startswith(f"42{self.NAMESPACE},"):
+                self._handle_event(loads(data[len(self.NAMESPACE) + 3:]))
+            elif data.startswith('41') or data.startswith('44'):
+                raise ConnectionError(f"Limitless feed rejected namespace: {data}")
+    
+    def _handle_event(self, event) -> None:
+        if not isinstance(event, list) or len(event) < 2:
+            return
+        name, payload = event[0], event[1]
+        if name != 'orderbookUpdate' or not isinstance(payload, dict):
+            return
+        
+        market_id = self._ids_by_slug.get(payload.get('marketSlug'))
+        if market_id is None:
+            market_id = payload.get('marketId')
+        orderbook = payload.get('orderbook', payload)
+        if market_id in self._markets and isinstance(orderbook, dict):
+            self.stats['pushes'] += 1
+            self._apply(market_id, LimitlessBook.from_dict(orderbook))
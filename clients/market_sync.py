@@ -0,0 +1,101 @@
+"""Local market table with conditional-request validators and diff events"""
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from clients.decoders import record_key
+
+logger = logging.getLogger(__name__)
+
+MARKET_ADDED = 'added'
+MARKET_REMOVED = 'removed'
+MARKET_CHANGED = 'changed'
+
+
+@dataclass(frozen=True)
+class MarketEvent:
+    """Change to the local market table"""
+    kind: str
+    market_id: str
+    market: Optional[Any] = None
+
+
+@dataclass
+class PageValidator:
+    """Cache validators and content digest for one listing page"""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    body_digest: Optional[bytes] = None
+    items: Optional[List[Any]] = None
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+def body_digest(body: bytes) -> bytes:
+    """Cheap digest used to skip parsing an unchanged payload"""
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+class MarketTable:
+    """Slotted market records keyed by id, diffed by per-record field hash"""
+    
+    def __init__(self, id_key: str = 'id'):
+        self.id_key = id_key
+        self._markets: Dict[str, Any] = {}
+        self._hashes: Dict[str, int] = {}
+    
+    @staticmethod
+    def _market_hash(market) -> int:
+        return hash(record_key(market))
+    
+    def apply_snapshot(self, markets: Iterable[Any]) -> List[MarketEvent]:
+        """Replace the table with a full listing and return what changed"""
+        events: List[MarketEvent] = []
+        seen = set()
+        
+        for market in markets:
+            market_id = getattr(market, self.id_key, None)
+            if market_id is None:
+                continue
+            market_id = str(market_id)
+            if market_id in seen:
+                continue
+            seen.add(market_id)
+            
+            digest = self._market_hash(market)
+            previous = self._hashes.get(market_id)
+            if previous is None:
+                events.append(MarketEvent(MARKET_ADDED, market_id, market))
+            elif previous != digest:
+                events.append(MarketEvent(MARKET_CHANGED, market_id, market))
+            else:
+                continue
+            
+            self._markets[market_id] = market
+            self._hashes[market_id] = digest
+        
+        for market_id in [mid for mid in self._markets if mid not in seen]:
+            market = self._markets.pop(market_id)
+            self._hashes.pop(market_id, None)
+            events.append(MarketEvent(MARKET_REMOVED, market_id, market))
+        
+        return events
+    
+    def get(self, market_id: str) -> Optional[Any]:
+        return self._markets.get(market_id)
+    
+    def values(self) -> List[Any]:
+        return list(self._markets.values())
+    
+    def __len__(self) -> int:
+        return len(self._markets)
+    
+    def __contains__(self, market_id: str) -> bool:
+        return market_id in self._markets
@@ -0,0 +1,160 @@
+"""Full-depth L2 order book shared by both venues and the arbitrage engine"""
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, Optional, Tuple
+
+Level = Tuple[float, float]  # (price, size)
+
+
+class BookSide:
+    """
+    One side of a book as two parallel arrays sorted by ascending price
+    
+    Levels are located by binary search, so updates are O(log n) plus a
+    small memmove. Asks are best at the front, bids best at the back.
+    """
+    
+    __slots__ = ('prices', 'sizes', 'is_bid')
+    
+    def __init__(self, is_bid: bool, levels: Iterable[Level] = ()):
+        self.is_bid = is_bid
+        self.prices = array('d')
+        self.sizes = array('d')
+        self.replace(levels)
+    
+    def replace(self, levels: Iterable[Level]) -> None:
+        """Load a full snapshot (any order; zero-size levels dropped)"""
+        merged = {}
+        for price, size in levels:
+            if size > 0:
+                merged[price] = size
+        ordered = sorted(merged.items())
+        self.prices = array('d', (price for price, _ in ordered))
+        self.sizes = array('d', (size for _, size in ordered))
+    
+    def set(self, price: float, size: float) -> None:
+        """Apply a level delta; size 0 removes the level"""
+        prices = self.prices
+        i = bisect_left(prices, price)
+        exists = i < len(prices) and prices[i] == price
+        if size > 0:
+            if exists:
+                self.sizes[i] = size
+            else:
+                prices.insert(i, price)
+                self.sizes.insert(i, size)
+        elif exists:
+            del prices[i]
+            del self.sizes[i]
+    
+    def clear(self) -> None:
+        del self.prices[:]
+        del self.sizes[:]
+    
+    def __len__(self) -> int:
+        return len(self.prices)
+    
+    def __bool__(self) -> bool:
+        return len(self.prices) > 0
+    
+    def best(self) -> Optional[Level]:
+        if not self.prices:
+            return None
+        i = -1 if self.is_bid else 0
+        return self.prices[i], self.sizes[i]
+    
+    @property
+    def best_price(self) -> Optional[float]:
+        if not self.prices:
+            return None
+        return self.prices[-1] if self.is_bid else self.prices[0]
+    
+    def levels(self) -> Iterator[Level]:
+        """Levels best first"""
+        indices = range(len(self.prices) - 1, -1, -1) if self.is_bid else range(len(self.prices))
+        prices, sizes = self.prices, self.sizes
+        for i in indices:
+            yield prices[i], sizes[i]
+    
+    def depth_at(self, limit_price: float) -> float:
+        """Cumulative size at prices no worse than `limit_price`"""
+        if self.is_bid:
+            return sum(self.sizes[bisect_left(self.prices, limit_price):])
+        return sum(self.sizes[:bisect_right(self.prices, limit_price)])
+    
+    def depth(self, levels: int) -> float:
+        """Cumulative size of the best `levels` levels"""
+        if self.is_bid:
+            return sum(self.sizes[max(0, len(self.sizes) - levels):])
+        return sum(self.sizes[:levels])
+
+
+class OrderBook:
+    """YES and NO ladders for one market on one venue"""
+    
+    __slots__ = ('market_id', 'yes_bids', 'yes_asks', 'no_bids', 'no_asks', 'updated_at')
+    
+    def __init__(
+        self,
+        market_id: str,
+        yes_bids: Optional[BookSide] = None,
+        yes_asks: Optional[BookSide] = None,
+        no_bids: Optional[BookSide] = None,
+        no_asks: Optional[BookSide] = None
+    ):
+        self.market_id = market_id
+        self.yes_bids = yes_bids if yes_bids is not None else BookSide(True)
+        self.yes_asks = yes_asks if yes_asks is not None else BookSide(False)
+        self.no_bids = no_bids if no_bids is not None else BookSide(True)
+        self.no_asks = no_asks if no_asks is not None else BookSide(False)
+        self.updated_at = time.monotonic()
+    
+    @classmethod
+    def from_levels(
+        cls,
+        market_id: str,
+        yes_bids: Iterable[Level] = (),
+        yes_asks: Iterable[Level] = (),
+        no_bids: Iterable[Level] = (),
+        no_asks: Iterable[Level] = ()
+    ) -> "OrderBook":
+        return cls(
+            market_id,
+            BookSide(True, yes_bids),
+            BookSide(False, yes_asks),
+            BookSide(True, no_bids),
+            BookSide(False, no_asks)
+        )
+    
+    @property
+    def yes_ask(self) -> Optional[float]:
+        return self.yes_asks.best_price
+    
+    @property
+    def yes_bid(self) -> Optional[float]:
+        return self.yes_bids.best_price
+    
+    @property
+    def no_ask(self) -> Optional[float]:
+        return self.no_asks.best_price
+    
+    @property
+    def no_bid(self) -> Optional[float]:
+        return self.no_bids.best_price
+    
+    def top(self) -> Tuple[Optional[float], ...]:
+        """(yes_bid, yes_ask, no_bid, no_ask), cheap to compare for changes"""
+        return self.yes_bid, self.yes_ask, self.no_bid, self.no_ask
+    
+    def asks(self, outcome: str) -> BookSide:
+        return self.yes_asks if outcome.upper() == 'YES' else self.no_asks
+    
+    def __bool__(self) -> bool:
+        return bool(self.yes_bids or self.yes_asks or self.no_bids or self.no_asks)
+    
+    def __repr__(self) -> str:
+        return (
+            f"OrderBook({self.market_id!r}, yes {self.yes_bid}/{self.yes_ask}, "
+            f"no {self.no_bid}/{self.no_ask})"
+        )
@@ -0,0 +1,211 @@
+"""Background pre-signing of Polymarket BUY orders around the best ask"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# sign(token_id, side, size, price) -> signed order
+SignFn = Callable[[str, str, Decimal, Decimal], Awaitable[Any]]
+# size_for(pair_ask, price) -> shares the sizing would buy at that price
+SizeFn = Callable[[Decimal, Decimal], Decimal]
+
+
+@dataclass
+class PresignStats:
+    """Ladder hit/miss and signing counters"""
+    signed: int = 0
+    hits: int = 0
+    misses: int = 0
+    evicted: int = 0
+    sign_errors: int = 0
+
+
+class _Ladder:
+    """Signed orders for one token, keyed by price in ticks"""
+    
+    __slots__ = ('tick', 'anchor', 'pair_ask', 'orders')
+    
+    def __init__(self, tick: Decimal):
+        self.tick = tick
+        self.anchor: Optional[int] = None  # best ask in ticks
+        self.pair_ask: Optional[Decimal] = None  # ask of the matched Limitless leg
+        self.orders: Dict[int, Tuple[Any, Decimal, float]] = {}  # ticks -> (signed order, size, signed_at)
+
+
+class PolymarketOrderPresigner:
+    """
+    Keeps a ladder of ready-to-post signed BUY orders per token
+    
+    Each tracked token holds orders at the best ask and `ticks` price
+    ticks either side of it. Sizes are in shares: each rung is signed for
+    `size_for(pair_ask, rung price)`, the size the engine's sizing gives
+    when both top levels are deep enough, so an order sized that way is
+    a hit; partial-depth and multi-level fills are signed on demand.
+    `update()` moves a ladder when its book or paired ask moves; a worker
+    task signs the missing rungs
+    nearest the ask first and drops rungs that left the window. Signed
+    orders are single-use, expire after `ttl` seconds, and are all dropped
+    by `invalidate()` (e.g. after a nonce change).
+    """
+    
+    def __init__(
+        self,
+        sign: SignFn,
+        size_for: SizeFn,
+        ticks: int = 2,
+        ttl: float = 600.0,
+        default_tick: Decimal = Decimal('0.01')
+    ):
+        self._sign = sign
+        self.size_for = size_for
+        self.ticks = ticks
+        self.ttl = ttl
+        self.default_tick = default_tick
+        self.stats = PresignStats()
+        
+        self._ladders: Dict[str, _Ladder] = {}
+        self._dirty: Set[str] = set()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    @staticmethod
+    def _to_ticks(price: Decimal, tick: Decimal) -> int:
+        return int((price / tick).to_integral_value())
+    
+    def update(
+        self,
+        token_id: str,
+        best_ask: Optional[Decimal],
+        pair_ask: Optional[Decimal],
+        tick: Optional[Decimal] = None
+    ) -> None:
+        """Re-centre a token's ladder on its best ask and the matched leg's ask"""
+        if not token_id or best_ask is None or pair_ask is None:
+            return
+        tick = tick or self.default_tick
+        ladder = self._ladders.get(token_id)
+        if ladder is None or ladder.tick != tick:
+            ladder = self._ladders[token_id] = _Ladder(tick)
+        
+        anchor = self._to_ticks(best_ask, tick)
+        now = time.monotonic()
+        if (
+            anchor != ladder.anchor
+            or pair_ask != ladder.pair_ask
+            or len(ladder.orders) < 2 * self.ticks + 1
+            or any(now - signed_at > self.ttl for _, _, signed_at in ladder.orders.values())
+        ):
+            ladder.anchor = anchor
+            ladder.pair_ask = pair_ask
+            self._dirty.add(token_id)
+            self._ensure_worker()
+            self._wakeup.set()
+    
+    def untrack(self, token_id: str) -> None:
+        self._ladders.pop(token_id, None)
+        self._dirty.discard(token_id)
+    
+    def invalidate(self) -> None:
+        """Drop every signed order, e.g. after the account nonce changed"""
+        for token_id, ladder in self._ladders.items():
+            self.stats.evicted += len(ladder.orders)
+            ladder.orders.clear()
+            self._dirty.add(token_id)
+        if self._dirty:
+            self._ensure_worker()
+            self._wakeup.set()
+    
+    def take(self, token_id: str, price: Decimal, size: Decimal) -> Optional[Any]:
+        """Pop a ready signed BUY order for exactly this price and size"""
+        ladder = self._ladders.get(token_id)
+        if ladder is None:
+            self.stats.misses += 1
+            return None
+        
+        ticks = self._to_ticks(price, ladder.tick)
+        entry = ladder.orders.get(ticks)
+        if entry is None or entry[1] != size or time.monotonic() - entry[2] > self.ttl:
+            self.stats.misses += 1
+            return None
+        
+        del ladder.orders[ticks]
+        self.stats.hits += 1
+        # The rung was spent; sign a replacement in the background
+        self._dirty.add(token_id)
+        self._ensure_worker()
+        self._wakeup.set()
+        return entry[0]
+    
+    def _ensure_worker(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def _run(self) -> None:
+        while True:
+            if not self._dirty:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            
+            token_id = self._dirty.pop()
+            ladder = self._ladders.get(token_id)
+            if ladder is not None and ladder.anchor is not None:
+                await self._refresh(token_id, ladder)
+    
+    async def _refresh(self, token_id: str, ladder: _Ladder) -> None:
+        now = time.monotonic()
+        anchor, pair_ask = ladder.anchor, ladder.pair_ask
+        wanted = {
+            t: self.size_for(pair_ask, t * ladder.tick)
+            for t in range(anchor - self.ticks, anchor + self.ticks + 1)
+        }
+        
+        for ticks in [t for t, (_, size, signed_at) in ladder.orders.items()
+                      if wanted.get(t) != size or now - signed_at > self.ttl]:
+            del ladder.orders[ticks]
+            self.stats.evicted += 1
+        
+        # Nearest the ask first; bail out early if the ladder moved meanwhile
+        for ticks in sorted(wanted, key=lambda t: abs(t - anchor)):
+            if (
+                self._ladders.get(token_id) is not ladder
+                or ladder.anchor != anchor
+                or ladder.pair_ask != pair_ask
+            ):
+                return
+            price = ticks * ladder.tick
+            size = wanted[ticks]
+            if ticks in ladder.orders or not 0 < price < 1 or size <= 0:
+                continue
+            try:
+                signed = await self._sign(token_id, 'BUY', size, price)
+            except Exception as e:
+                self.stats.sign_errors += 1
+                logger.warning(f"Pre-signing {token_id} @ {price} failed: {e}")
+                return
+            ladder.orders[ticks] = (signed, size, time.monotonic())
+            self.stats.signed += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        stats = self.stats
+        taken = stats.hits + stats.misses
+        return {
+            'tokens': len(self._ladders),
+            'ready': sum(len(ladder.orders) for ladder in self._ladders.values()),
+            'signed': stats.signed,
+            'hits': stats.hits,
+            'misses': stats.misses,
+            'hit_rate': stats.hits / taken if taken else 0.0,
+            'evicted': stats.evicted,
+            'sign_errors': stats.sign_errors,
+        }
+    
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
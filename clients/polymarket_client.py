@@ -1,9 +1,27 @@
 """Optimized Polymarket CLOB API client"""
 import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from decimal import Decimal
-from tenacity import retry, stop_after_attempt, wait_exponential
+
+from clients.decoders import (
+    PolymarketBook,
+    PolymarketMarket,
+    decode_polymarket_book,
+    decode_polymarket_books,
+    decode_polymarket_market,
+    decode_polymarket_markets,
+    loads,
+)
+from clients.order_book import OrderBook
+from clients.order_presigner import PolymarketOrderPresigner
+from clients.polymarket_stream import PolymarketMarketStream
+from clients.signing_service import PolymarketSigningService
+from clients.transport import TRANSIENT_ERRORS, HttpTransport
+from utils.pagination import iter_cursor_pages
+from utils.hedging import RequestHedger
+from utils.rate_limiter import Priority
+from utils.retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -11,20 +29,152 @@ logger = logging.getLogger(__name__)
 class PolymarketClient:
     """High-performance async Polymarket client"""
     
+    # Cursor value the CLOB returns after the last page
+    END_CURSOR = "LTE="
+    
+    # Order posts are not idempotent: only retry statuses that mean "not accepted"
+    ORDER_RETRY_STATUSES = frozenset({429})
+    
+    # Most orders the CLOB accepts in one multi-order POST
+    MAX_BATCH_ORDERS = 15
+    
     def __init__(
         self, 
         private_key: str, 
         chain_id: int = 137,
-        host: str = "https://clob.polymarket.com"
+        host: str = "https://clob.polymarket.com",
+        transport: Optional[HttpTransport] = None,
+        max_book_chunk_size: int = 100,
+        discovery_prefetch: int = 3,
+        ws_url: str = PolymarketMarketStream.WS_URL,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedger: Optional[RequestHedger] = None,
+        signing_service: Optional[PolymarketSigningService] = None
     ):
         self.private_key = private_key
         self.chain_id = chain_id
         self.host = host
         self._client = None
         self._lock = asyncio.Lock()
+        self._transport = transport or HttpTransport(host, name="polymarket")
+        self._retry = retry_policy or RetryPolicy(
+            retryable_exceptions=TRANSIENT_ERRORS,
+            name="polymarket"
+        )
+        self._hedger = hedger
+        self._signing_service = signing_service
+        
+        # condition_id -> (yes_token_id, no_token_id), token_id -> price tick
+        self._token_ids: Dict[str, Tuple[str, str]] = {}
+        self._tick_sizes: Dict[str, Decimal] = {}
+        
+        # Adaptive chunk size for multi-token book requests
+        self.max_book_chunk_size = max_book_chunk_size
+        self._book_chunk_size = max_book_chunk_size
+        self.discovery_prefetch = discovery_prefetch
+        # False while a discovery walk runs and after one that ended on a page error
+        self.discovery_complete = False
+        
+        # Optional market-channel stream, started by start_stream()
+        self.ws_url = ws_url
+        self._stream: Optional[PolymarketMarketStream] = None
+        
+        # Optional ladder of pre-signed BUY orders, enabled by enable_presigning()
+        self._presigner: Optional[PolymarketOrderPresigner] = None
+    
+    @property
+    def transport(self) -> HttpTransport:
+        return self._transport
+    
+    def pool_stats(self) -> Dict:
+        """Connection pool utilisation counters"""
+        return self._transport.pool_stats()
+    
+    def retry_stats(self) -> Dict:
+        """Retry attempt and give-up counters"""
+        return self._retry.snapshot()
+    
+    def hedge_stats(self) -> Dict:
+        """Hedge rate and hedge/win ratio for order-book reads"""
+        return self._hedger.snapshot() if self._hedger is not None else {}
+    
+    async def _get(
+        self, 
+        path: str, 
+        operation: str, 
+        params: Optional[Dict] = None,
+        hedge_key: Optional[str] = None,
+        decode: Callable[[bytes], Any] = loads
+    ):
+        """GET a CLOB read endpoint over the pooled transport and decode the body"""
+        async def attempt():
+            response = await self._transport.request(
+                "GET", path, operation=operation, params=params,
+                hedger=self._hedger, hedge_key=hedge_key
+            )
+            response.raise_for_status()
+            return decode(response.body)
+        
+        return await self._retry.call(attempt, operation=operation)
+    
+    @staticmethod
+    def resolve_token_ids(market: PolymarketMarket) -> Optional[Tuple[str, str]]:
+        """Extract (yes_token_id, no_token_id) from a CLOB market"""
+        tokens = market.tokens
+        if len(tokens) < 2:
+            return None
+        
+        by_outcome = {outcome.upper(): token_id for token_id, outcome in tokens}
+        if by_outcome.get('YES') and by_outcome.get('NO'):
+            return by_outcome['YES'], by_outcome['NO']
+        
+        # Fall back to positional convention: YES = 1, NO = 0
+        return tokens[1][0], tokens[0][0]
+    
+    def _remember_tokens(self, market: PolymarketMarket) -> None:
+        condition_id = market.condition_id
+        if condition_id and condition_id not in self._token_ids:
+            token_ids = self.resolve_token_ids(market)
+            if token_ids:
+                self._token_ids[condition_id] = token_ids
+                if market.tick_size:
+                    tick = Decimal(repr(market.tick_size))
+                    for token_id in token_ids:
+                        self._tick_sizes[token_id] = tick
+    
+    async def _get_token_ids(self, condition_id: str) -> Optional[Tuple[str, str]]:
+        """Token ids for a condition, fetching the market once if unseen"""
+        token_ids = self._token_ids.get(condition_id)
+        if token_ids is None:
+            market = await self._get(
+                f"/markets/{condition_id}", "discovery", decode=decode_polymarket_market
+            )
+            if market is not None:
+                self._remember_tokens(market)
+            token_ids = self._token_ids.get(condition_id)
+        return token_ids
+    
+    async def get_order_book(self, token_id: str) -> Optional[PolymarketBook]:
+        """Fetch the CLOB order book for a single token"""
+        return await self._get(
+            "/book", 
+            "orderbook", 
+            params={"token_id": token_id}, 
+            hedge_key="book", 
+            decode=decode_polymarket_book
+        )
+    
+    async def warm_connections(self, connections: int = 1) -> int:
+        """
+        Open or refresh pooled read connections
+        
+        Order posts go out through py_clob_client, which opens a fresh
+        `requests` connection per call, so the order path cannot be warmed.
+        """
+        return await self._transport.warm("/time", connections)
     
     async def _get_client(self):
-        """Lazy initialization with thread safety"""
+        """Lazy initialization of the signing client with thread safety"""
         if self._client is None:
             async with self._lock:
                 if self._client is None:
@@ -44,72 +194,234 @@ class PolymarketClient:
                         raise
         return self._client
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8)
-    )
-    async def get_active_hourly_markets(self) -> List[Dict]:
-        """Fetch active hourly BTC markets"""
+    @staticmethod
+    def is_hourly_market(market: PolymarketMarket) -> bool:
+        """Active hourly BTC market"""
+        question = market.question
+        return (
+            'BTC above' in question
+            and 'UTC' in question
+            and market.active
+        )
+    
+    async def _fetch_markets_page(
+        self, 
+        cursor: Optional[str]
+    ) -> Tuple[List[PolymarketMarket], Optional[str]]:
+        """Fetch one cursor page of markets"""
+        params = {"next_cursor": cursor} if cursor else None
+        markets, next_cursor = await self._get(
+            "/markets", "discovery", params=params, decode=decode_polymarket_markets
+        )
+        if next_cursor == self.END_CURSOR:
+            next_cursor = None
+        return markets, next_cursor
+    
+    async def iter_active_hourly_markets(self) -> AsyncIterator[PolymarketMarket]:
+        """Stream active hourly BTC markets across all cursor pages"""
+        self.discovery_complete = False
+        fetched = 0
         try:
-            client = await self._get_client()
-            markets = await asyncio.to_thread(client.get_markets)
-            
-            # Filter for hourly BTC markets
-            return [
-                m for m in markets
-                if 'BTC above' in m.get('question', '')
-                and 'UTC' in m.get('question', '')
-                and m.get('active', False)
-            ]
+            async for page in iter_cursor_pages(
+                self._fetch_markets_page,
+                prefetch=self.discovery_prefetch
+            ):
+                fetched += len(page)
+                for market in page:
+                    if self.is_hourly_market(market):
+                        self._remember_tokens(market)
+                        yield market
+            self.discovery_complete = True
         except Exception as e:
             logger.error(f"Error fetching Polymarket markets: {e}")
-            return []
+        
+        logger.debug(f"Scanned {fetched} Polymarket markets")
+    
+    async def get_active_hourly_markets(self) -> List[PolymarketMarket]:
+        """Fetch active hourly BTC markets"""
+        return [m async for m in self.iter_active_hourly_markets()]
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8)
-    )
-    async def get_market_prices(self, condition_id: str) -> Dict:
-        """Get orderbook prices for a condition"""
+    async def get_market_book(self, condition_id: str) -> Optional[OrderBook]:
+        """Full-depth YES/NO book for a condition"""
         try:
-            client = await self._get_client()
-            orderbook = await asyncio.to_thread(
-                client.get_order_book, 
-                condition_id
-            )
+            token_ids = await self._get_token_ids(condition_id)
+            if not token_ids:
+                logger.warning(f"No token ids known for {condition_id}")
+                return None
             
-            # Token IDs: '1' = YES, '0' = NO
-            yes_book = orderbook.get('1', {})
-            no_book = orderbook.get('0', {})
+            streamed = self._streamed_book(condition_id, token_ids)
+            if streamed is not None:
+                return streamed
             
-            return {
-                'yes_ask': Decimal(yes_book['asks'][0]['price']) if yes_book.get('asks') else None,
-                'yes_bid': Decimal(yes_book['bids'][0]['price']) if yes_book.get('bids') else None,
-                'no_ask': Decimal(no_book['asks'][0]['price']) if no_book.get('asks') else None,
-                'no_bid': Decimal(no_book['bids'][0]['price']) if no_book.get('bids') else None,
-                'condition_id': condition_id
-            }
+            yes_book, no_book = await asyncio.gather(
+                self.get_order_book(token_ids[0]),
+                self.get_order_book(token_ids[1])
+            )
+            return self._book_from_tokens(condition_id, yes_book, no_book)
         except Exception as e:
-            logger.warning(f"Error fetching prices for {condition_id}: {e}")
+            logger.warning(f"Error fetching book for {condition_id}: {e}")
+            return None
+    
+    @staticmethod
+    def _book_from_tokens(
+        condition_id: str, 
+        yes_book: Optional[PolymarketBook], 
+        no_book: Optional[PolymarketBook]
+    ) -> OrderBook:
+        """Combine the YES and NO token books of a condition"""
+        return OrderBook.from_levels(
+            condition_id,
+            yes_bids=yes_book.bids if yes_book is not None else (),
+            yes_asks=yes_book.asks if yes_book is not None else (),
+            no_bids=no_book.bids if no_book is not None else (),
+            no_asks=no_book.asks if no_book is not None else ()
+        )
+    
+    async def _post_books(self, token_ids: List[str]) -> Dict[str, PolymarketBook]:
+        """Fetch many books in one request via the multi-token endpoint"""
+        body = [{"token_id": tid} for tid in token_ids]
+        
+        async def attempt():
+            response = await self._transport.request(
+                "POST", "/books", operation="orderbook", json_body=body,
+                hedger=self._hedger, hedge_key="books"
+            )
+            response.raise_for_status()
+            return response
+        
+        response = await self._retry.call(attempt, operation="orderbook")
+        return decode_polymarket_books(response.body)
+    
+    async def _fetch_book_chunk(self, token_ids: List[str]) -> Dict[str, PolymarketBook]:
+        """Fetch one chunk of books, shrinking the chunk size and falling back per token on failure"""
+        books: Dict[str, PolymarketBook] = {}
+        try:
+            books = await self._post_books(token_ids)
+            self._book_chunk_size = min(
+                self.max_book_chunk_size, 
+                self._book_chunk_size + max(1, len(token_ids) // 2)
+            )
+        except Exception as e:
+            self._book_chunk_size = max(1, min(self._book_chunk_size, len(token_ids)) // 2)
+            logger.warning(
+                f"Batch book fetch of {len(token_ids)} tokens failed ({e}); "
+                f"chunk size now {self._book_chunk_size}"
+            )
+        
+        missing = [tid for tid in token_ids if tid not in books]
+        if missing:
+            results = await asyncio.gather(
+                *(self.get_order_book(tid) for tid in missing),
+                return_exceptions=True
+            )
+            for tid, book in zip(missing, results):
+                if isinstance(book, PolymarketBook):
+                    books[tid] = book
+        return books
+    
+    async def get_order_books_batch(self, token_ids: List[str]) -> Dict[str, PolymarketBook]:
+        """Fetch order books for many tokens in as few round trips as possible"""
+        if not token_ids:
             return {}
+        
+        chunk_size = self._book_chunk_size
+        chunks = [token_ids[i:i + chunk_size] for i in range(0, len(token_ids), chunk_size)]
+        results = await asyncio.gather(*(self._fetch_book_chunk(c) for c in chunks))
+        
+        books: Dict[str, PolymarketBook] = {}
+        for chunk_books in results:
+            books.update(chunk_books)
+        return books
     
-    async def get_market_prices_batch(self, condition_ids: List[str]) -> Dict[str, Dict]:
-        """Fetch prices for multiple markets concurrently"""
+    async def get_market_books_batch(self, condition_ids: List[str]) -> Dict[str, OrderBook]:
+        """Fetch books for multiple markets with chunked multi-token book requests"""
         if not condition_ids:
             return {}
         
-        tasks = [self.get_market_prices(cid) for cid in condition_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        return {
-            cid: res for cid, res in zip(condition_ids, results)
-            if isinstance(res, dict) and res
+        unique_ids = list(dict.fromkeys(condition_ids))
+        resolved = await asyncio.gather(
+            *(self._get_token_ids(cid) for cid in unique_ids),
+            return_exceptions=True
+        )
+        token_map = {
+            cid: ids for cid, ids in zip(unique_ids, resolved)
+            if isinstance(ids, tuple)
         }
+        
+        # Streamed books are served locally; only the rest go over REST
+        market_books: Dict[str, OrderBook] = {}
+        for cid, ids in list(token_map.items()):
+            streamed = self._streamed_book(cid, ids)
+            if streamed is not None:
+                market_books[cid] = streamed
+                del token_map[cid]
+        
+        token_ids = list(dict.fromkeys(tid for ids in token_map.values() for tid in ids))
+        books = await self.get_order_books_batch(token_ids)
+        
+        for cid, (yes_token, no_token) in token_map.items():
+            if yes_token in books or no_token in books:
+                market_books[cid] = self._book_from_tokens(cid, books.get(yes_token), books.get(no_token))
+        return market_books
+    
+    async def sign_order(self, token_id: str, side: str, amount: Decimal, price: Decimal):
+        """Build and EIP-712 sign an order off the event loop"""
+        if self._signing_service is not None:
+            return await self._signing_service.sign(token_id, side, amount, price)
+        
+        client = await self._get_client()
+        from py_clob_client.clob_types import OrderArgs
+        from py_clob_client.order_builder.constants import BUY, SELL
+        
+        order_args = OrderArgs(
+            token_id=token_id,
+            price=float(price),
+            size=float(amount),
+            side=BUY if side.upper() == 'BUY' else SELL,
+            fee_rate_bps=0
+        )
+        return await asyncio.to_thread(client.create_order, order_args)
+    
+    async def post_signed_order(self, signed_order) -> Optional[Dict]:
+        """Submit a signed order, retrying only rejections that happen before acceptance"""
+        client = await self._get_client()
+        from py_clob_client.clob_types import OrderType
+        
+        async def submit():
+            # The sync client bypasses the transport, so take the order-lane token here
+            if self._transport.rate_limiter is not None:
+                await self._transport.rate_limiter.acquire(Priority.ORDER)
+            return await asyncio.to_thread(client.post_order, signed_order, OrderType.GTC)
+        
+        try:
+            response = await self._retry.call(
+                submit,
+                operation="order",
+                statuses=self.ORDER_RETRY_STATUSES,
+                idempotent=False
+            )
+        except Exception as e:
+            self._check_nonce_rejection(e)
+            raise
+        self._check_nonce_rejection(response)
+        return response
+    
+    def _check_nonce_rejection(self, reply) -> None:
+        """
+        Drop every pre-signed order when the venue rejects one for its
+        nonce (an exception, or an errorMsg in a single or batch reply)
+        """
+        if self._presigner is None:
+            return
+        if isinstance(reply, BaseException):
+            errors = [str(reply)]
+        else:
+            items = reply if isinstance(reply, list) else [reply]
+            errors = [str(item.get('errorMsg') or '') for item in items if isinstance(item, dict)]
+        if any('nonce' in error.lower() for error in errors):
+            logger.warning("Polymarket rejected an order nonce, dropping pre-signed orders")
+            self._presigner.invalidate()
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=8)
-    )
     async def place_order(
         self, 
         token_id: str, 
@@ -117,35 +429,206 @@ class PolymarketClient:
         amount: Decimal, 
         price: Decimal
     ) -> Optional[Dict]:
-        """Place order on Polymarket"""
+        """Place order on Polymarket, using a pre-signed order when one is ready"""
         try:
-            client = await self._get_client()
-            from py_clob_client.clob_types import OrderArgs
-            from py_clob_client.order_builder.constants import BUY, SELL
-            
-            order_args = OrderArgs(
-                token_id=token_id,
-                price=float(price),
-                size=float(amount),
-                side=BUY if side.upper() == 'BUY' else SELL,
-                fee_rate_bps=0
-            )
-            
-            # Create and sign order
-            signed_order = await asyncio.to_thread(
-                client.create_order,
-                order_args
+            signed_order = await self._signed_for(
+                {'token_id': token_id, 'side': side, 'amount': amount, 'price': price}
             )
+            response = await self.post_signed_order(signed_order)
             
-            # Submit order
-            response = await asyncio.to_thread(
-                client.post_order,
-                signed_order,
-                OrderType.GTC
-            )
-            
-            logger.info(f"✓ Polymarket order placed: {side} ${amount} @ ${price}")
+            logger.info(f"✓ Polymarket order placed: {side} {amount} shares @ ${price}")
             return response
         except Exception as e:
             logger.error(f"Polymarket order failed: {e}")
             raise
+    
+    async def _signed_for(self, order: Dict):
+        """Ready pre-signed order if one matches, else sign now"""
+        signed_order = None
+        if self._presigner is not None and order['side'].upper() == 'BUY':
+            signed_order = self._presigner.take(order['token_id'], order['price'], order['amount'])
+        if signed_order is None:
+            signed_order = await self.sign_order(
+                order['token_id'], order['side'], order['amount'], order['price']
+            )
+        return signed_order
+    
+    async def _post_signed_batch(self, signed_orders: List) -> List:
+        """One multi-order POST for up to MAX_BATCH_ORDERS signed orders"""
+        client = await self._get_client()
+        from py_clob_client.clob_types import OrderType, PostOrdersArgs
+        
+        args = [PostOrdersArgs(order=o, orderType=OrderType.GTC) for o in signed_orders]
+        
+        async def submit():
+            if self._transport.rate_limiter is not None:
+                await self._transport.rate_limiter.acquire(Priority.ORDER)
+            return await asyncio.to_thread(client.post_orders, args)
+        
+        try:
+            response = await self._retry.call(
+                submit,
+                operation="order",
+                statuses=self.ORDER_RETRY_STATUSES,
+                idempotent=False
+            )
+        except Exception as e:
+            self._check_nonce_rejection(e)
+            raise
+        self._check_nonce_rejection(response)
+        if not isinstance(response, list) or len(response) != len(signed_orders):
+            # An error body or a short reply cannot be attributed to orders
+            raise ValueError(
+                f"unexpected batch reply for {len(signed_orders)} order(s): {str(response)[:200]}"
+            )
+        return response
+    
+    @staticmethod
+    def _accepted(response) -> Optional[Dict]:
+        if not response or (isinstance(response, dict) and response.get('success') is False):
+            return None
+        return response
+    
+    async def place_orders_batch(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Place many orders with as few POSTs as possible
+        
+        Args:
+            orders: Dicts with token_id, side, amount and price
+        
+        Returns:
+            Per-order venue response, or None where that order failed,
+            in the same order as `orders`
+        """
+        if not orders:
+            return []
+        
+        signed = await asyncio.gather(
+            *(self._signed_for(order) for order in orders),
+            return_exceptions=True
+        )
+        results: List[Optional[Dict]] = [None] * len(orders)
+        ready = []
+        for i, signed_order in enumerate(signed):
+            if isinstance(signed_order, BaseException):
+                logger.error(f"Polymarket order signing failed: {signed_order}")
+            else:
+                ready.append(i)
+        
+        chunks = [ready[i:i + self.MAX_BATCH_ORDERS] for i in range(0, len(ready), self.MAX_BATCH_ORDERS)]
+        responses = await asyncio.gather(
+            *(self._post_signed_batch([signed[i] for i in chunk]) for chunk in chunks),
+            return_exceptions=True
+        )
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, BaseException):
+                logger.error(f"Polymarket batch of {len(chunk)} order(s) failed: {response}")
+                continue
+            for i, item in zip(chunk, response):
+                results[i] = self._accepted(item)
+        
+        placed = sum(1 for r in results if r is not None)
+        logger.info(f"✓ Polymarket batch: {placed}/{len(orders)} order(s) placed")
+        return results
+    
+    def enable_presigning(
+        self,
+        size_for: Callable[[Decimal, Decimal], Decimal],
+        ticks: int = 2,
+        ttl: float = 600.0
+    ) -> PolymarketOrderPresigner:
+        """
+        Keep signed BUY orders ready around each tracked token's best ask
+        
+        Args:
+            size_for: (matched Limitless ask, price) -> shares per order,
+                e.g. ArbitrageEngine.shares_for
+        """
+        if self._presigner is None:
+            self._presigner = PolymarketOrderPresigner(self.sign_order, size_for, ticks=ticks, ttl=ttl)
+        self._presigner.size_for = size_for
+        return self._presigner
+    
+    def refresh_presigned(self, books: Dict[str, OrderBook], pair_books: Dict[str, OrderBook]) -> None:
+        """
+        Move pre-signed ladders to the latest asks
+        
+        Args:
+            books: {condition_id: Polymarket book}
+            pair_books: {condition_id: matched Limitless book}; a YES token
+                is bought alongside Limitless NO and a NO token alongside YES
+        """
+        if self._presigner is None:
+            return
+        for condition_id, book in books.items():
+            token_ids = self._token_ids.get(condition_id)
+            pair = pair_books.get(condition_id)
+            if not token_ids or pair is None:
+                continue
+            for token_id, ask, pair_ask in zip(
+                token_ids, (book.yes_ask, book.no_ask), (pair.no_ask, pair.yes_ask)
+            ):
+                if ask is not None and pair_ask is not None:
+                    self._presigner.update(
+                        token_id, Decimal(repr(ask)), Decimal(repr(pair_ask)), self._tick_sizes.get(token_id)
+                    )
+    
+    def signing_stats(self) -> Dict:
+        """Signing pool queue depth and latency"""
+        return self._signing_service.snapshot() if self._signing_service is not None else {}
+    
+    def presign_stats(self) -> Dict:
+        """Pre-signed ladder hit rate and signing counters"""
+        return self._presigner.snapshot() if self._presigner is not None else {}
+    
+    def _streamed_book(self, condition_id: str, token_ids: Tuple[str, str]) -> Optional[OrderBook]:
+        """Local streamed book, None if not streaming or not yet synced"""
+        if self._stream is None or not self._stream.running:
+            return None
+        return self._stream.get_market_book(condition_id, *token_ids)
+    
+    @property
+    def stream(self) -> Optional[PolymarketMarketStream]:
+        return self._stream
+    
+    async def start_stream(self, condition_ids: List[str]) -> None:
+        """Stream the market channel for every token of the given conditions"""
+        resolved = await asyncio.gather(
+            *(self._get_token_ids(cid) for cid in condition_ids),
+            return_exceptions=True
+        )
+        token_ids = [tid for ids in resolved if isinstance(ids, tuple) for tid in ids]
+        
+        if self._stream is None:
+            self._stream = PolymarketMarketStream(self.ws_url)
+        await self._stream.subscribe(token_ids)
+        await self._stream.start()
+    
+    async def release_markets(self, condition_ids: List[str]) -> None:
+        """Stop streaming and pre-signing for conditions no longer matched"""
+        token_ids = [tid for cid in condition_ids for tid in self._token_ids.get(cid, ())]
+        if self._presigner is not None:
+            for token_id in token_ids:
+                self._presigner.untrack(token_id)
+        if self._stream is not None:
+            await self._stream.unsubscribe(token_ids)
+    
+    async def stop_stream(self) -> None:
+        if self._stream is not None:
+            await self._stream.stop()
+    
+    async def close(self):
+        """Close the stream, the pre-signer and the pooled transport"""
+        await self.stop_stream()
+        if self._presigner is not None:
+            await self._presigner.close()
+        if self._signing_service is not None:
+            await self._signing_service.close()
+        await self._transport.close()
+        logger.info("Polymarket client session closed")
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
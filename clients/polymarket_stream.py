@@ -0,0 +1,253 @@
+"""Polymarket CLOB market-channel WebSocket feed with local order books"""
+import asyncio
+import logging
+import random
+import time
+from typing import Dict, Iterable, Optional, Set
+
+import aiohttp
+
+from clients.decoders import loads
+from clients.order_book import BookSide, OrderBook
+
+logger = logging.getLogger(__name__)
+
+
+class LocalBook:
+    """Price-level book for a single token, fed by snapshots and deltas"""
+    
+    __slots__ = ('bids', 'asks', 'ready', 'updated_at')
+    
+    def __init__(self):
+        self.bids = BookSide(True)
+        self.asks = BookSide(False)
+        self.ready = False
+        self.updated_at = 0.0
+    
+    @staticmethod
+    def _levels(levels):
+        return ((float(level['price']), float(level['size'])) for level in levels or ())
+    
+    def apply_snapshot(self, bids, asks) -> None:
+        self.bids.replace(self._levels(bids))
+        self.asks.replace(self._levels(asks))
+        self.ready = True
+        self.updated_at = time.monotonic()
+    
+    def apply_change(self, side: str, price, size) -> None:
+        levels = self.bids if side.upper() == 'BUY' else self.asks
+        levels.set(float(price), float(size))
+        self.updated_at = time.monotonic()
+    
+    def reset(self) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self.ready = False
+    
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self.bids.best_price
+    
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self.asks.best_price
+
+
+class PolymarketMarketStream:
+    """
+    Subscribes to the CLOB market channel and maintains local books
+    
+    Reconnects with jittered backoff and resubscribes every tracked token.
+    A connection that has delivered no frame (not even a PONG to the
+    heartbeat PING) for `stale_after` seconds is treated as dead: its
+    books stop being served and the socket is dropped and reconnected.
+    """
+    
+    WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+    
+    def __init__(
+        self,
+        url: str = WS_URL,
+        heartbeat_interval: float = 10.0,
+        reconnect_min_wait: float = 0.5,
+        reconnect_max_wait: float = 10.0,
+        stale_after: Optional[float] = None
+    ):
+        self.url = url
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after if stale_after is not None else 2 * heartbeat_interval
+        self.reconnect_min_wait = reconnect_min_wait
+        self.reconnect_max_wait = reconnect_max_wait
+        
+        self._books: Dict[str, LocalBook] = {}
+        self._token_ids: Set[str] = set()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._last_frame_at = 0.0
+        self.connected = asyncio.Event()
+        self.stats = {'messages': 0, 'reconnects': 0, 'errors': 0, 'silent_drops': 0}
+    
+    @property
+    def running(self) -> bool:
+        return self._running
+    
+    @property
+    def live(self) -> bool:
+        """Connected and heard from within `stale_after` seconds"""
+        return self.connected.is_set() and time.monotonic() - self._last_frame_at <= self.stale_after
+    
+    def get_book(self, token_id: str) -> Optional[LocalBook]:
+        """Synced local book, None while the connection is down or silent"""
+        if not self.live:
+            return None
+        book = self._books.get(token_id)
+        return book if book is not None and book.ready else None
+    
+    def get_market_book(self, condition_id: str, yes_token: str, no_token: str) -> Optional[OrderBook]:
+        """Live book for a condition; its sides are the streamed token books, not copies"""
+        yes_book = self.get_book(yes_token)
+        no_book = self.get_book(no_token)
+        if yes_book is None or no_book is None:
+            return None
+        
+        book = OrderBook(condition_id, yes_book.bids, yes_book.asks, no_book.bids, no_book.asks)
+        book.updated_at = min(yes_book.updated_at, no_book.updated_at)
+        return book
+    
+    async def subscribe(self, token_ids: Iterable[str]) -> None:
+        """Track more tokens, subscribing immediately if connected"""
+        new_ids = [tid for tid in token_ids if tid and tid not in self._token_ids]
+        if not new_ids:
+            return
+        
+        self._token_ids.update(new_ids)
+        for tid in new_ids:
+            self._books.setdefault(tid, LocalBook())
+        
+        if self._ws is not None and not self._ws.closed:
+            try:
+                await self._ws.send_json({"assets_ids": new_ids, "operation": "subscribe"})
+            except Exception as e:
+                logger.warning(f"Polymarket stream subscribe failed, will resubscribe on reconnect: {e}")
+    
+    async def unsubscribe(self, token_ids: Iterable[str]) -> None:
+        """Stop tracking tokens and drop their local books"""
+        old_ids = [tid for tid in token_ids if tid in self._token_ids]
+        if not old_ids:
+            return
+        
+        self._token_ids.difference_update(old_ids)
+        for tid in old_ids:
+            self._books.pop(tid, None)
+        
+        if self._ws is not None and not self._ws.closed:
+            try:
+                await self._ws.send_json({"assets_ids": old_ids, "operation": "unsubscribe"})
+            except Exception as e:
+                logger.debug(f"Polymarket stream unsubscribe failed: {e}")
+    
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        self._running = False
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _run(self) -> None:
+        attempt = 0
+        while self._running:
+            try:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession()
+                
+                async with self._session.ws_connect(self.url, autoping=True) as ws:
+                    self._ws = ws
+                    await ws.send_json({"assets_ids": sorted(self._token_ids), "type": "market"})
+                    self._last_frame_at = time.monotonic()
+                    self.connected.set()
+                    attempt = 0
+                    logger.info(f"Polymarket stream connected ({len(self._token_ids)} tokens)")
+                    await self._read_loop(ws)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.warning(f"Polymarket stream error: {e}")
+            finally:
+                self._ws = None
+                self.connected.clear()
+                # Books are stale until the next snapshot after resubscribing
+                for book in self._books.values():
+                    book.reset()
+            
+            if self._running:
+                attempt += 1
+                self.stats['reconnects'] += 1
+                wait = min(self.reconnect_max_wait, self.reconnect_min_wait * 2 ** (attempt - 1))
+                await asyncio.sleep(wait * random.uniform(0.5, 1.0))
+    
+    async def _read_loop(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat(ws))
+        try:
+            while True:
+                try:
+                    msg = await ws.receive(timeout=self.stale_after)
+                except asyncio.TimeoutError:
+                    # Not even a PONG: half-open socket, drop it and reconnect
+                    self.stats['silent_drops'] += 1
+                    raise ConnectionError(f"no frames for {self.stale_after:.0f}s")
+                
+                self._last_frame_at = time.monotonic()
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    if msg.data in ('PONG', 'PING'):
+                        continue
+                    self.handle_message(loads(msg.data))
+                elif msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING,
+                                  aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                    break
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+    
+    async def _heartbeat(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        # PINGs more often than stale_after, so a live server always answers in time
+        interval = min(self.heartbeat_interval, self.stale_after / 2)
+        while not ws.closed:
+            await asyncio.sleep(interval)
+            await ws.send_str("PING")
+    
+    def handle_message(self, payload) -> None:
+        """Apply one decoded market-channel payload (single event or list)"""
+        events = payload if isinstance(payload, list) else [payload]
+        for event in events:
+            if not isinstance(event, dict):
+                continue
+            self.stats['messages'] += 1
+            event_type = event.get('event_type')
+            
+            if event_type == 'book':
+                book = self._books.get(event.get('asset_id'))
+                if book is not None:
+                    book.apply_snapshot(
+                        event.get('bids', event.get('buys')),
+                        event.get('asks', event.get('sells'))
+                    )
+            
+            elif event_type == 'price_change':
+                default_asset = event.get('asset_id')
+                for change in event.get('price_changes') or event.get('changes') or ():
+                    book = self._books.get(change.get('asset_id', default_asset))
+                    if book is not None and book.ready:
+                        book.apply_change(change['side'], change['price'], change['size'])
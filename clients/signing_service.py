@@ -0,0 +1,137 @@
+"""Process-pool order signing, keeping EIP-712 hashing and ECDSA off the event loop"""
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from utils.hedging import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+# Signing client built once per worker process by _init_worker
+_worker_client = None
+
+
+def _init_worker(private_key: str, chain_id: int, host: str) -> None:
+    global _worker_client
+    from py_clob_client.client import ClobClient
+    _worker_client = ClobClient(key=private_key, chain_id=chain_id, host=host)
+
+
+def _warm_up() -> bool:
+    return _worker_client is not None
+
+
+def _sign_in_worker(token_id: str, side: str, size: float, price: float):
+    from py_clob_client.clob_types import OrderArgs
+    from py_clob_client.order_builder.constants import BUY, SELL
+    
+    order_args = OrderArgs(
+        token_id=token_id,
+        price=price,
+        size=size,
+        side=BUY if side.upper() == 'BUY' else SELL,
+        fee_rate_bps=0
+    )
+    return _worker_client.create_order(order_args)
+
+
+@dataclass
+class SigningStats:
+    """Signing throughput counters"""
+    submitted: int = 0
+    completed: int = 0
+    errors: int = 0
+    peak_queue_depth: int = 0
+
+
+class PolymarketSigningService:
+    """
+    Signs Polymarket orders in worker processes
+    
+    Each worker loads the key and builds its signing client once, so a
+    request only ships the order arguments over and the signed order
+    back. Queue depth and signing latency (submit to result) are tracked.
+    """
+    
+    def __init__(
+        self,
+        private_key: str,
+        chain_id: int = 137,
+        host: str = "https://clob.polymarket.com",
+        workers: int = 2
+    ):
+        self.workers = max(1, workers)
+        self._init_args = (private_key, chain_id, host)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._queue_depth = 0
+        self.latency = LatencyTracker(window=500, min_samples=1)
+        self.stats = SigningStats()
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                # Spawned workers never inherit the running loop, threads or locks
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=self._init_args
+            )
+        return self._pool
+    
+    async def start(self) -> None:
+        """Start the workers and load the key ahead of the first order"""
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        await asyncio.gather(*(loop.run_in_executor(pool, _warm_up) for _ in range(self.workers)))
+        logger.info(f"Polymarket signing pool ready ({self.workers} workers)")
+    
+    async def sign(self, token_id: str, side: str, amount: Decimal, price: Decimal):
+        """Signed order for the given arguments, produced in a worker process"""
+        loop = asyncio.get_running_loop()
+        stats = self.stats
+        stats.submitted += 1
+        self._queue_depth += 1
+        stats.peak_queue_depth = max(stats.peak_queue_depth, self._queue_depth)
+        started = time.perf_counter()
+        try:
+            signed = await loop.run_in_executor(
+                self._get_pool(), _sign_in_worker, token_id, side, float(amount), float(price)
+            )
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            self._queue_depth -= 1
+        stats.completed += 1
+        self.latency.record('sign', time.perf_counter() - started)
+        return signed
+    
+    @property
+    def queue_depth(self) -> int:
+        """Signing requests submitted and not yet returned"""
+        return self._queue_depth
+    
+    def snapshot(self) -> Dict[str, Any]:
+        stats = self.stats
+        p50 = self.latency.percentile('sign', 0.5)
+        p90 = self.latency.percentile('sign', 0.9)
+        return {
+            'workers': self.workers,
+            'queue_depth': self._queue_depth,
+            'peak_queue_depth': stats.peak_queue_depth,
+            'submitted': stats.submitted,
+            'completed': stats.completed,
+            'errors': stats.errors,
+            'p50_ms': round(p50 * 1000, 2) if p50 is not None else None,
+            'p90_ms': round(p90 * 1000, 2) if p90 is not None else None,
+        }
+    
+    async def close(self) -> None:
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
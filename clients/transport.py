@@ -0,0 +1,347 @@
+"""Pooled, config-driven async HTTP transport shared by the exchange clients"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+import aiohttp
+
+from clients.decoders import loads
+from clients.http_backends import HttpBackend, create_backend
+from utils.hedging import LatencyTracker, RequestHedger
+from utils.rate_limiter import Priority, PriorityRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Failures worth retrying: the request may never have reached the venue
+TRANSIENT_ERRORS = (
+    asyncio.TimeoutError,
+    ConnectionError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpStatusError(Exception):
+    """Raised when a venue answers with a non-2xx/3xx status"""
+    
+    def __init__(self, status: int, url: str, body: bytes = b'', retry_after: Optional[float] = None):
+        self.status = status
+        self.url = url
+        self.body = body
+        self.retry_after = retry_after
+        super().__init__(f"HTTP {status} for {url}")
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """Fully-read HTTP response, detached from the pooled connection"""
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+    url: str
+    elapsed: float
+    
+    def json(self) -> Any:
+        """Decode the body as JSON (None for an empty body)"""
+        return loads(self.body) if self.body else None
+    
+    @property
+    def retry_after(self) -> Optional[float]:
+        return parse_retry_after(self.headers.get('Retry-After'))
+    
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise HttpStatusError(self.status, self.url, self.body, self.retry_after)
+
+
+@dataclass
+class PoolStats:
+    """Pool utilisation counters"""
+    requests: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    waiting: int = 0
+    peak_waiting: int = 0
+    by_operation: Dict[str, int] = field(default_factory=dict)
+
+
+class HttpTransport:
+    """
+    Keep-alive connection pool with per-host limits, DNS caching,
+    a concurrency semaphore and per-operation timeouts
+    
+    The wire client is a pluggable backend (aiohttp HTTP/1.1 or httpx
+    HTTP/2); rate limiting, concurrency, timeouts and metrics live here so
+    they behave the same whichever backend is selected.
+    """
+    
+    DEFAULT_OPERATION = "default"
+    
+    # Rate-limiter lane per operation class
+    OPERATION_PRIORITY = {
+        "order": Priority.ORDER,
+        "orderbook": Priority.PRICE,
+        "discovery": Priority.DISCOVERY,
+        "keepalive": Priority.DISCOVERY,
+    }
+    
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        pool_size: int = 50,
+        pool_per_host: int = 30,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 60.0,
+        max_concurrent: int = 20,
+        request_timeout: float = 8.0,
+        connect_timeout: float = 3.0,
+        operation_timeouts: Optional[Dict[str, float]] = None,
+        default_headers: Optional[Dict[str, str]] = None,
+        rate_limiter: Optional[PriorityRateLimiter] = None,
+        backend: str = "aiohttp",
+        name: str = "http"
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.name = name
+        self.pool_size = pool_size
+        self.pool_per_host = pool_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.max_concurrent = max_concurrent
+        self.request_timeout = request_timeout
+        self.connect_timeout = connect_timeout
+        self.operation_timeouts = dict(operation_timeouts or {})
+        self.default_headers = dict(default_headers or {})
+        self.rate_limiter = rate_limiter
+        self.stats = PoolStats()
+        self.latency = LatencyTracker(window=500, min_samples=1)
+        
+        self._backend = create_backend(
+            backend,
+            pool_size=pool_size,
+            pool_per_host=pool_per_host,
+            dns_cache_ttl=dns_cache_ttl,
+            keepalive_timeout=keepalive_timeout,
+            connect_timeout=connect_timeout,
+            default_timeout=request_timeout,
+            default_headers=self.default_headers,
+            transport_name=name
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+    
+    @classmethod
+    def from_config(
+        cls, 
+        config, 
+        base_url: str, 
+        name: str = "http",
+        rate_limiter: Optional[PriorityRateLimiter] = None,
+        backend: str = "aiohttp"
+    ) -> "HttpTransport":
+        """Build a transport from BotConfig network settings"""
+        return cls(
+            base_url,
+            pool_size=config.POOL_SIZE,
+            pool_per_host=config.POOL_PER_HOST,
+            dns_cache_ttl=config.DNS_CACHE_TTL,
+            keepalive_timeout=config.KEEPALIVE_TIMEOUT,
+            max_concurrent=config.MAX_CONCURRENT_REQUESTS,
+            request_timeout=config.REQUEST_TIMEOUT,
+            connect_timeout=config.CONNECT_TIMEOUT,
+            operation_timeouts={
+                "discovery": config.DISCOVERY_TIMEOUT,
+                "orderbook": config.ORDERBOOK_TIMEOUT,
+                "order": config.ORDER_TIMEOUT,
+            },
+            rate_limiter=rate_limiter,
+            backend=backend,
+            name=name
+        )
+    
+    @property
+    def backend(self) -> HttpBackend:
+        return self._backend
+    
+    def _timeout_for(self, operation: str) -> float:
+        """Total timeout for an operation class"""
+        return self.operation_timeouts.get(operation, self.request_timeout)
+    
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        operation: str = DEFAULT_OPERATION,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[bytes] = None,
+        json_body: Any = None,
+        hedger: Optional[RequestHedger] = None,
+        hedge_key: Optional[str] = None
+    ) -> HttpResponse:
+        """
+        Send a request through the pool and read the full body
+        
+        With a hedger and hedge_key, the request is hedged only once it has
+        been admitted (rate limit and concurrency gate): latency samples are
+        wire time, a duplicate goes straight to another pooled connection,
+        and a >= 400 reply raises HttpStatusError so it loses the race.
+        """
+        url = path if path.startswith('http') else f"{self.base_url}{path}"
+        priority = self.OPERATION_PRIORITY.get(operation, Priority.PRICE)
+        
+        async def send_once() -> HttpResponse:
+            return await self._send(method, url, operation, params, headers, data, json_body)
+        
+        async def send_checked() -> HttpResponse:
+            response = await send_once()
+            response.raise_for_status()
+            return response
+        
+        async def send() -> HttpResponse:
+            if hedger is None or not hedge_key:
+                return await send_once()
+            return await hedger.run(hedge_key, send_checked)
+        
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(priority)
+        
+        # Orders skip the concurrency gate so they never queue behind market data
+        if priority == Priority.ORDER:
+            return await send()
+        
+        stats = self.stats
+        stats.waiting += 1
+        stats.peak_waiting = max(stats.peak_waiting, stats.waiting)
+        async with self._semaphore:
+            stats.waiting -= 1
+            return await send()
+    
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        operation: str,
+        params: Optional[Dict],
+        headers: Optional[Dict[str, str]],
+        data: Optional[bytes],
+        json_body: Any
+    ) -> HttpResponse:
+        stats = self.stats
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        stats.requests += 1
+        stats.by_operation[operation] = stats.by_operation.get(operation, 0) + 1
+        started = time.perf_counter()
+        try:
+            status, response_headers, body = await self._backend.send(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                data=data,
+                json_body=json_body,
+                timeout=self._timeout_for(operation),
+                operation=operation
+            )
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise
+        except (ConnectionError, aiohttp.ClientError):
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+        
+        elapsed = time.perf_counter() - started
+        self.latency.record(operation, elapsed)
+        result = HttpResponse(
+            status=status,
+            headers=response_headers,
+            body=body,
+            url=url,
+            elapsed=elapsed
+        )
+        
+        if result.status == 429 and self.rate_limiter is not None:
+            retry_after = result.retry_after
+            self.rate_limiter.pause(retry_after if retry_after is not None else 1.0)
+        return result
+    
+    async def warm(self, path: str, connections: int = 1, params: Optional[Dict] = None) -> int:
+        """
+        Open (or touch) up to `connections` pooled connections with cheap GETs
+        
+        Returns how many of the requests got a response.
+        """
+        results = await asyncio.gather(
+            *(self.request("GET", path, operation="keepalive", params=params) for _ in range(max(1, connections))),
+            return_exceptions=True
+        )
+        return sum(1 for r in results if isinstance(r, HttpResponse))
+    
+    def _latency_ms(self, operation: str, q: float) -> Optional[float]:
+        value = self.latency.percentile(operation, q)
+        return round(value * 1000, 1) if value is not None else None
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """Snapshot of pool utilisation"""
+        connections = self._backend.connection_stats()
+        return {
+            'name': self.name,
+            'backend': self._backend.name,
+            'pool_size': self.pool_size,
+            'connections_in_use': connections['in_use'],
+            'connections_idle': connections['idle'],
+            'utilisation': connections['in_use'] / self.pool_size if self.pool_size else 0.0,
+            'handshakes': sum(self._backend.handshakes.values()),
+            'handshakes_by_operation': dict(self._backend.handshakes),
+            'reused_connections': self._backend.reused,
+            'in_flight': self.stats.in_flight,
+            'peak_in_flight': self.stats.peak_in_flight,
+            'waiting': self.stats.waiting,
+            'peak_waiting': self.stats.peak_waiting,
+            'requests': self.stats.requests,
+            'errors': self.stats.errors,
+            'timeouts': self.stats.timeouts,
+            'by_operation': dict(self.stats.by_operation),
+            'latency_ms': {
+                operation: {'p50': self._latency_ms(operation, 0.5), 'p90': self._latency_ms(operation, 0.9)}
+                for operation in self.stats.by_operation
+            },
+            'rate_limiter': self.rate_limiter.snapshot() if self.rate_limiter else None,
+        }
+    
+    async def close(self):
+        """Close the backend's connections"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.close()
+        await self._backend.close()
+        logger.info(f"{self.name} transport closed")
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -18,20 +18,53 @@ class BotConfig:
     POLL_INTERVAL: Final[int] = 12  # seconds
     CACHE_TTL: Final[int] = 8  # seconds
     MARKET_CACHE_TTL: Final[int] = 5  # seconds
+    DISCOVERY_PAGE_SIZE: Final[int] = 100
+    DISCOVERY_PREFETCH: Final[int] = 3  # pages fetched ahead of the matcher
+    MARKET_SYNC_MODE: Final[bool] = True  # conditional, diffed Limitless discovery
     
     # Network Settings
     MAX_CONCURRENT_REQUESTS: Final[int] = 20
     REQUEST_TIMEOUT: Final[int] = 8
+    CONNECT_TIMEOUT: Final[float] = 3.0
+    DISCOVERY_TIMEOUT: Final[float] = 8.0
+    ORDERBOOK_TIMEOUT: Final[float] = 3.0
+    ORDER_TIMEOUT: Final[float] = 5.0
     MAX_RETRIES: Final[int] = 3
-    RETRY_MIN_WAIT: Final[float] = 1.0
-    RETRY_MAX_WAIT: Final[float] = 8.0
+    RETRY_MIN_WAIT: Final[float] = 0.2
+    RETRY_MAX_WAIT: Final[float] = 2.0
+    RETRY_DEADLINE: Final[float] = 6.0  # total budget per call, kept under POLL_INTERVAL
+    HEDGE_REQUESTS: Final[bool] = True  # duplicate slow order-book reads
+    HEDGE_PERCENTILE: Final[float] = 0.9
+    HEDGE_BUDGET_RATIO: Final[float] = 0.05  # max fraction of reads hedged
     
     # API Endpoints
     LIMITLESS_API_URL: Final[str] = "https://api.limitless.exchange/api-v1"
+    LIMITLESS_WS_URL: Final[str] = "wss://ws.limitless.exchange"
     POLYMARKET_HOST: Final[str] = "https://clob.polymarket.com"
     POLYMARKET_CHAIN_ID: Final[int] = 137
+    POLYMARKET_WS_URL: Final[str] = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+    STREAM_MARKET_DATA: Final[bool] = True
     
     # Connection Pool
     POOL_SIZE: Final[int] = 50
     POOL_PER_HOST: Final[int] = 30
     DNS_CACHE_TTL: Final[int] = 300
+    KEEPALIVE_TIMEOUT: Final[float] = 60.0
+    WARM_CONNECTIONS: Final[int] = 4  # connections opened per venue when priming
+    KEEPALIVE_PING_INTERVAL: Final[float] = 20.0  # kept under KEEPALIVE_TIMEOUT
+    REPRIME_LEAD: Final[float] = 30.0  # seconds before each hour to re-prime pools
+    LIMITLESS_HTTP_BACKEND: Final[str] = "aiohttp"  # "aiohttp" (HTTP/1.1) or "http2"
+    POLYMARKET_HTTP_BACKEND: Final[str] = "aiohttp"
+    
+    # Rate Limits (requests/second and bucket size per venue)
+    LIMITLESS_RATE_LIMIT: Final[float] = 10.0
+    LIMITLESS_RATE_BURST: Final[int] = 20
+    POLYMARKET_RATE_LIMIT: Final[float] = 50.0
+    POLYMARKET_RATE_BURST: Final[int] = 100
+    RATE_LIMIT_ORDER_RESERVE: Final[int] = 2  # tokens only orders may spend
+    
+    # Order Pre-signing (Polymarket)
+    PRESIGN_ORDERS: Final[bool] = True
+    PRESIGN_LADDER_TICKS: Final[int] = 2  # signed rungs either side of the best ask
+    PRESIGN_TTL: Final[float] = 600.0  # seconds before a signed order is re-signed
+    SIGNING_WORKERS: Final[int] = 2  # signing processes; 0 signs on a thread in-process
@@ -1,23 +1,78 @@
 """Arbitrage opportunity detection and calculation"""
 import logging
-from typing import Optional, List
+from typing import Any, Optional, List, Sequence, Tuple
 from decimal import Decimal
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from clients.order_book import OrderBook
+
 logger = logging.getLogger(__name__)
 
+# Prices are held as integer ticks of 1e-4 (0.5325 -> 5325); $1 payout = TICK_SCALE
+TICK_SCALE = 10_000
+# Spread thresholds are held in hundredths of a percent (3.0% -> 300)
+PCT_SCALE = 100
+
+
+# (type, limitless side, polymarket side); order matches evaluate_batch columns
+SCENARIOS = (
+    ('YES_LIMITLESS_NO_POLYMARKET', 'YES', 'NO'),
+    ('NO_LIMITLESS_YES_POLYMARKET', 'NO', 'YES'),
+)
+
+
+def to_ticks(price: Optional[float]) -> Optional[int]:
+    """Book price (float) to integer ticks, None passes through"""
+    return round(price * TICK_SCALE) if price is not None else None
+
+
+def _hundredths(size: float) -> int:
+    """Level size in whole hundredths of a share, rounded down"""
+    return int(size * 100 + 1e-9)
+
+
+def ticks_to_decimal(ticks: int) -> Decimal:
+    """Integer ticks to an exact Decimal price, for order placement"""
+    return Decimal(ticks).scaleb(-4).normalize()
+
 
 @dataclass(frozen=True)
 class Opportunity:
-    """Immutable arbitrage opportunity"""
+    """Immutable arbitrage opportunity, priced in integer ticks"""
     type: str
     limitless_side: str
-    limitless_price: Decimal
+    limitless_ticks: int
     polymarket_side: str
-    polymarket_price: Decimal
-    total_cost: Decimal
-    spread_pct: Decimal
-    profit_pct: Decimal
+    polymarket_ticks: int
+    total_ticks: int
+    
+    @property
+    def limitless_price(self) -> Decimal:
+        return ticks_to_decimal(self.limitless_ticks)
+    
+    @property
+    def polymarket_price(self) -> Decimal:
+        return ticks_to_decimal(self.polymarket_ticks)
+    
+    @property
+    def total_cost(self) -> Decimal:
+        return ticks_to_decimal(self.total_ticks)
+    
+    @property
+    def profit_pct(self) -> float:
+        return (TICK_SCALE - self.total_ticks) * 100 / self.total_ticks
+    
+    @property
+    def spread_pct(self) -> float:
+        # Limitless price against the complement of the Polymarket price
+        return ArbitrageEngine.calculate_spread(
+            self.limitless_ticks, TICK_SCALE - self.polymarket_ticks
+        )
     
     def __str__(self) -> str:
         return (
@@ -27,8 +82,25 @@ class Opportunity:
         )
 
 
+@dataclass(frozen=True)
+class Sizing:
+    """Depth-aware fill plan for both legs of an opportunity"""
+    size: Decimal  # shares bought on each leg
+    limitless_vwap: Decimal
+    polymarket_vwap: Decimal
+    limitless_limit: Decimal  # worst level reached, used as the order price
+    polymarket_limit: Decimal
+    expected_profit: Decimal
+    levels: int  # level pairs walked
+
+
 class ArbitrageEngine:
-    """Fast arbitrage detection with optimized calculations"""
+    """
+    Fast arbitrage detection with optimized calculations
+    
+    The per-match path compares integer ticks only; Decimal appears when
+    an opportunity is sized, logged or turned into orders.
+    """
     
     def __init__(
         self, 
@@ -43,65 +115,61 @@ class ArbitrageEngine:
         # Pre-calculate constants
         self._one = Decimal('1')
         self._hundred = Decimal('100')
-        self._zero = Decimal('0')
-    
-    def calculate_spread(self, price1: Decimal, price2: Decimal) -> Decimal:
-        """Calculate percentage spread between two prices"""
-        if not price1 or not price2 or price1 <= self._zero or price2 <= self._zero:
-            return self._zero
         
-        mid = (price1 + price2) / 2
-        if mid == self._zero:
-            return self._zero
+        # Spread threshold as an integer, scaled so the check needs no division
+        self._min_spread = int(min_spread_pct * PCT_SCALE)
         
-        return abs(price1 - price2) / mid * self._hundred
+        # Budget in ticks x hundredths of a share, the unit of the sizing walk
+        self._budget_units = int(self.bet_budget() * TICK_SCALE * 100)
+    
+    @staticmethod
+    def calculate_spread(ticks1: int, ticks2: int) -> float:
+        """Calculate percentage spread between two tick prices"""
+        if ticks1 <= 0 or ticks2 <= 0:
+            return 0.0
+        return abs(ticks1 - ticks2) * 200 / (ticks1 + ticks2)
     
     def _evaluate_scenario(
         self,
-        lim_price: Optional[Decimal],
-        poly_price: Optional[Decimal],
+        lim_ticks: Optional[int],
+        poly_ticks: Optional[int],
         scenario_type: str,
         lim_side: str,
         poly_side: str
     ) -> Optional[Opportunity]:
         """Evaluate a specific arbitrage scenario"""
-        if not lim_price or not poly_price:
+        if not lim_ticks or not poly_ticks:
             return None
         
-        total_cost = lim_price + poly_price
-        
-        # Arbitrage exists when total cost < 1.00
-        if total_cost >= self._one:
-            return None
-        
-        # Calculate profit and spread
-        profit_pct = (self._one - total_cost) / total_cost * self._hundred
-        
-        # For spread, compare complementary probabilities
-        poly_implied = self._one - poly_price
-        spread = self.calculate_spread(lim_price, poly_implied)
-        
-        # Check if spread meets minimum threshold
-        if spread < self.min_spread_pct:
+        if not self._clears(lim_ticks, poly_ticks):
             return None
         
         return Opportunity(
             type=scenario_type,
             limitless_side=lim_side,
-            limitless_price=lim_price,
+            limitless_ticks=lim_ticks,
             polymarket_side=poly_side,
-            polymarket_price=poly_price,
-            total_cost=total_cost,
-            spread_pct=spread,
-            profit_pct=profit_pct
+            polymarket_ticks=poly_ticks,
+            total_ticks=lim_ticks + poly_ticks
         )
     
+    def _clears(self, lim_ticks: int, poly_ticks: int) -> bool:
+        """True if buying both legs at these prices is an arbitrage above the spread threshold"""
+        # Arbitrage exists when total cost < 1.00
+        if lim_ticks + poly_ticks >= TICK_SCALE:
+            return False
+        
+        # For spread, compare complementary probabilities:
+        # |a - b| / ((a + b) / 2) * 100 >= min_spread, cross-multiplied
+        poly_implied = TICK_SCALE - poly_ticks
+        return abs(lim_ticks - poly_implied) * 200 * PCT_SCALE >= self._min_spread * (lim_ticks + poly_implied)
+    
     def find_arbitrage(
         self, 
-        lim_prices: dict, 
-        poly_prices: dict
+        lim_book: OrderBook, 
+        poly_book: OrderBook
     ) -> Optional[Opportunity]:
-        """Detect arbitrage opportunities from price data"""
+        """Detect arbitrage opportunities from both venues' books"""
         opportunities: List[Opportunity] = []
         
         # Scenario 1: Buy YES on Limitless + Buy NO on Polymarket
@@ -109,8 +177,8 @@ class ArbitrageEngine:
         # Win if outcome is NO: Polymarket pays $1, lose Limitless YES stake
         # Both outcomes guaranteed if total_cost < $1
         opp1 = self._evaluate_scenario(
-            lim_prices.get('yes_ask'),
-            poly_prices.get('no_ask'),
+            to_ticks(lim_book.yes_ask),
+            to_ticks(poly_book.no_ask),
             'YES_LIMITLESS_NO_POLYMARKET',
             'YES',
             'NO'
@@ -120,8 +188,8 @@ class ArbitrageEngine:
         
         # Scenario 2: Buy NO on Limitless + Buy YES on Polymarket
         opp2 = self._evaluate_scenario(
-            lim_prices.get('no_ask'),
-            poly_prices.get('yes_ask'),
+            to_ticks(lim_book.no_ask),
+            to_ticks(poly_book.yes_ask),
             'NO_LIMITLESS_YES_POLYMARKET',
             'NO',
             'YES'
@@ -132,31 +200,173 @@ class ArbitrageEngine:
         if not opportunities:
             return None
         
-        # Return the best opportunity by profit percentage
-        best = max(opportunities, key=lambda x: x.profit_pct)
+        # Return the best opportunity by profit percentage (lowest total cost)
+        best = min(opportunities, key=lambda x: x.total_ticks)
         
         logger.info(f"💰 Arbitrage found: {best}")
         return best
     
-    def calculate_bet_size(self, opportunity: Opportunity) -> Decimal:
-        """Calculate optimal bet size with slippage protection"""
+    def evaluate_batch(
+        self,
+        matches: Sequence[Any],
+        books: Sequence[Tuple[Optional[OrderBook], Optional[OrderBook]]]
+    ) -> List[Tuple[Any, Opportunity]]:
+        """
+        Evaluate both scenarios for every match at once, best candidate first
+        
+        `books` holds the (limitless, polymarket) book pair for each match.
+        With NumPy the cost and spread checks are a few vector ops over all
+        matches, and only surviving rows become Opportunity objects.
+        """
+        if not matches:
+            return []
+        if np is None:
+            return self._evaluate_batch_python(matches, books)
+        
+        # Best asks as floats (None -> NaN), converted to ticks in one pass
+        tops = np.array([
+            (
+                lim.yes_ask if lim is not None else None,
+                lim.no_ask if lim is not None else None,
+                poly.yes_ask if poly is not None else None,
+                poly.no_ask if poly is not None else None
+            )
+            for lim, poly in books
+        ], dtype=np.float64)
+        ticks = np.rint(np.nan_to_num(tops * TICK_SCALE)).astype(np.int64)
+        # One column per scenario: Limitless YES + Polymarket NO, Limitless NO + Polymarket YES
+        lim = ticks[:, [0, 1]]
+        poly = ticks[:, [3, 2]]
+        total = lim + poly
+        implied = TICK_SCALE - poly
+        valid = (
+            (lim > 0) & (poly > 0) & (total < TICK_SCALE)
+            & (np.abs(lim - implied) * (200 * PCT_SCALE) >= self._min_spread * (lim + implied))
+        )
+        
+        # Best scenario per match is the valid one with the lowest total cost
+        masked = np.where(valid, total, TICK_SCALE)
+        scenario = masked.argmin(axis=1)
+        best = masked[np.arange(len(masked)), scenario]
+        rows = np.flatnonzero(best < TICK_SCALE)
+        ranked = rows[np.argsort(best[rows], kind='stable')]
+        
+        candidates = []
+        for i in ranked.tolist():
+            s = int(scenario[i])
+            scenario_type, lim_side, poly_side = SCENARIOS[s]
+            opportunity = Opportunity(
+                type=scenario_type,
+                limitless_side=lim_side,
+                limitless_ticks=int(lim[i, s]),
+                polymarket_side=poly_side,
+                polymarket_ticks=int(poly[i, s]),
+                total_ticks=int(best[i])
+            )
+            logger.info(f"💰 Arbitrage found: {opportunity}")
+            candidates.append((matches[i], opportunity))
+        return candidates
+    
+    def _evaluate_batch_python(
+        self,
+        matches: Sequence[Any],
+        books: Sequence[Tuple[Optional[OrderBook], Optional[OrderBook]]]
+    ) -> List[Tuple[Any, Opportunity]]:
+        """evaluate_batch without NumPy: one find_arbitrage per match"""
+        candidates = []
+        for match, (lim_book, poly_book) in zip(matches, books):
+            if not lim_book or not poly_book:
+                continue
+            opportunity = self.find_arbitrage(lim_book, poly_book)
+            if opportunity is not None:
+                candidates.append((match, opportunity))
+        candidates.sort(key=lambda candidate: candidate[1].total_ticks)
+        return candidates
+    
+    def size_opportunity(
+        self,
+        opportunity: Opportunity,
+        lim_book: OrderBook,
+        poly_book: OrderBook
+    ) -> Optional[Sizing]:
+        """
+        Size an opportunity against the depth on both ask ladders
+        
+        The two ladders are walked together, best level first, filling the
+        smaller remaining level each step; it stops at the first level pair
+        whose combined price no longer clears the spread threshold, or once
+        the cost of both legs reaches bet_budget(). Shares are counted in
+        hundredths and costs in ticks, so the walk is exact integer math.
+        O(levels on both sides).
+        """
+        budget = self._budget_units
+        lim_levels = lim_book.asks(opportunity.limitless_side).levels()
+        poly_levels = poly_book.asks(opportunity.polymarket_side).levels()
+        
+        filled = spent = lim_cost = poly_cost = 0
+        lim_left = poly_left = 0
+        lim_ticks = poly_ticks = 0
+        lim_limit = poly_limit = 0
+        steps = 0
+        while True:
+            while lim_left <= 0:
+                level = next(lim_levels, None)
+                if level is None:
+                    break
+                lim_ticks, lim_left = to_ticks(level[0]), _hundredths(level[1])
+            while poly_left <= 0:
+                level = next(poly_levels, None)
+                if level is None:
+                    break
+                poly_ticks, poly_left = to_ticks(level[0]), _hundredths(level[1])
+            if lim_left <= 0 or poly_left <= 0 or not self._clears(lim_ticks, poly_ticks):
+                break
+            
+            pair_ticks = lim_ticks + poly_ticks
+            take = min(lim_left, poly_left, (budget - spent) // pair_ticks)
+            if take <= 0:
+                break
+            filled += take
+            spent += take * pair_ticks
+            lim_cost += take * lim_ticks
+            poly_cost += take * poly_ticks
+            lim_left -= take
+            poly_left -= take
+            lim_limit, poly_limit = lim_ticks, poly_ticks
+            steps += 1
+        
+        if filled <= 0:
+            return None
+        
+        size = Decimal(filled).scaleb(-2)
+        tick = Decimal(1).scaleb(-4)
+        lim_vwap = (Decimal(lim_cost) / filled).scaleb(-4).quantize(tick)
+        poly_vwap = (Decimal(poly_cost) / filled).scaleb(-4).quantize(tick)
+        return Sizing(
+            size=size,
+            limitless_vwap=lim_vwap,
+            polymarket_vwap=poly_vwap,
+            limitless_limit=ticks_to_decimal(lim_limit),
+            polymarket_limit=ticks_to_decimal(poly_limit),
+            expected_profit=(size * (self._one - lim_vwap - poly_vwap)).quantize(Decimal('0.01')),
+            levels=steps
+        )
+    
+    def shares_for(self, limitless_price: Decimal, polymarket_price: Decimal) -> Decimal:
+        """
+        Shares per leg that size_opportunity gives when both top levels
+        are deep enough to absorb the whole budget
+        """
+        pair_ticks = to_ticks(limitless_price) + to_ticks(polymarket_price)
+        if pair_ticks <= 0:
+            return Decimal(0)
+        return Decimal(self._budget_units // pair_ticks).scaleb(-2)
+    
+    def bet_budget(self) -> Decimal:
+        """Dollars deployed across both legs of one opportunity"""
         # Apply slippage tolerance to max bet
         slippage_factor = self._one - (self.slippage / self._hundred)
         adjusted_max = self.max_bet * slippage_factor
         
-        # Bet size per side (since we're placing two orders)
-        bet_per_side = adjusted_max / 2
-        
         # Round to 2 decimal places for currency
-        return bet_per_side.quantize(Decimal('0.01'))
-    
-    def estimate_profit(
-        self, 
-        opportunity: Opportunity, 
-        bet_size: Decimal
-    ) -> Decimal:
-        """Calculate expected profit after fees"""
-        total_invested = bet_size * 2  # Two sides
-        total_payout = bet_size * 2 / opportunity.total_cost
-        
-        return (total_payout - total_invested).quantize(Decimal('0.01'))
+        return adjusted_max.quantize(Decimal('0.01'))
@@ -1,40 +1,22 @@
 """Optimized market monitoring with intelligent matching"""
 import asyncio
 import logging
-import re
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Callable, List, Optional
 from decimal import Decimal
-from dataclasses import dataclass
-from functools import lru_cache
-
-logger = logging.getLogger(__name__)
 
+from core.market_registry import LIMITLESS, POLYMARKET, MarketRegistry, market_id
+from core.match_index import MarketMatch, MatchEvent, MatchIndex
 
-@dataclass(frozen=True)
-class MarketMatch:
-    """Immutable market match data structure"""
-    limitless: Dict
-    polymarket: Dict
-    strike_limitless: Decimal
-    strike_polymarket: Decimal
-    strike_diff: Decimal
-    time: str
-    
-    @property
-    def limitless_id(self) -> str:
-        return self.limitless['id']
-    
-    @property
-    def polymarket_condition_id(self) -> str:
-        return self.polymarket['condition_id']
+logger = logging.getLogger(__name__)
 
 
 class MarketMonitor:
-    """High-performance market monitoring with caching"""
+    """
+    High-performance market monitoring with caching
     
-    # Pre-compiled regex patterns (class-level for efficiency)
-    STRIKE_REGEX = re.compile(r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)')
-    TIME_REGEX = re.compile(r'(\d{1,2}:\d{2})\s*UTC')
+    Discovery feeds the MarketRegistry, whose change events keep the
+    MatchIndex current; a scan re-matches only markets that changed.
+    """
     
     def __init__(
         self, 
@@ -45,101 +27,57 @@ class MarketMonitor:
         self.limitless = limitless_client
         self.polymarket = polymarket_client
         self.max_strike_diff = max_strike_diff
-    
-    @lru_cache(maxsize=200)
-    def parse_strike_and_time(self, title: str) -> Optional[Tuple[Decimal, str]]:
-        """Parse strike price and time from market title (cached)"""
-        strike_match = self.STRIKE_REGEX.search(title)
-        time_match = self.TIME_REGEX.search(title)
         
-        if not (strike_match and time_match):
-            return None
-        
-        try:
-            strike_str = strike_match.group(1).replace(',', '')
-            strike = Decimal(strike_str)
-            time_str = time_match.group(1)
-            return (strike, time_str)
-        except (ValueError, IndexError) as e:
-            logger.debug(f"Parse error for '{title}': {e}")
-            return None
+        # Venue markets normalized once, shared by matching and execution
+        self.registry = MarketRegistry(token_resolver=polymarket_client.resolve_token_ids)
+        self.index = MatchIndex(max_strike_diff)
+        self.registry.on_market_event(self.index.apply)
     
-    def _build_time_strike_map(
-        self, 
-        markets: List[Dict], 
-        title_key: str
-    ) -> Dict[str, List[Tuple[Decimal, Dict]]]:
-        """Build efficient lookup map: time -> [(strike, market)]"""
-        time_map = {}
+    def on_match_event(self, callback: Callable[[MatchEvent], None]) -> None:
+        """Register a listener for match added/removed deltas"""
+        self.index.on_match_event(callback)
+    
+    def market_metadata(self, venue: str, market_id: str) -> Optional[Any]:
+        """Full decoded venue record for a market id"""
+        return self.registry.raw(venue, market_id)
+    
+    async def _consume_markets(self, client, venue: str) -> int:
+        """Register markets while discovery pages are still arriving"""
+        seen = []
         
-        for market in markets:
-            title = market.get(title_key, '')
-            parsed = self.parse_strike_and_time(title)
-            
-            if parsed:
-                strike, time_slot = parsed
-                if time_slot not in time_map:
-                    time_map[time_slot] = []
-                time_map[time_slot].append((strike, market))
+        async for market in client.iter_active_hourly_markets():
+            seen.append(market_id(venue, market))
+            self.registry.upsert(venue, market)
         
-        return time_map
+        # Only a walk that reached the last page can delist; a partial or
+        # empty listing is a failed discovery, not a mass delisting
+        if seen and client.discovery_complete:
+            self.registry.retain(venue, seen)
+        elif seen:
+            logger.warning(f"{venue} discovery ended early, keeping previously listed markets")
+        return len(seen)
     
     async def find_matching_markets(self) -> List[MarketMatch]:
-        """Find matching markets across platforms with parallel fetching"""
+        """Find matching markets across platforms with streamed, parallel discovery"""
         try:
-            # Fetch from both platforms concurrently
-            lim_task = asyncio.create_task(self.limitless.get_active_hourly_markets())
-            poly_task = asyncio.create_task(self.polymarket.get_active_hourly_markets())
-            
-            lim_markets, poly_markets = await asyncio.gather(
-                lim_task, 
-                poly_task,
+            # Stream from both platforms concurrently
+            lim_result, poly_result = await asyncio.gather(
+                self._consume_markets(self.limitless, LIMITLESS),
+                self._consume_markets(self.polymarket, POLYMARKET),
                 return_exceptions=True
             )
             
             # Handle exceptions
-            if isinstance(lim_markets, Exception):
-                logger.error(f"Limitless fetch failed: {lim_markets}")
+            if isinstance(lim_result, Exception):
+                logger.error(f"Limitless fetch failed: {lim_result}")
                 return []
-            if isinstance(poly_markets, Exception):
-                logger.error(f"Polymarket fetch failed: {poly_markets}")
+            if isinstance(poly_result, Exception):
+                logger.error(f"Polymarket fetch failed: {poly_result}")
                 return []
             
-            logger.debug(f"Found {len(lim_markets)} Limitless, {len(poly_markets)} Polymarket markets")
-            
-            # Build lookup maps for O(1) matching
-            lim_map = self._build_time_strike_map(lim_markets, 'title')
-            poly_map = self._build_time_strike_map(poly_markets, 'question')
-            
-            # Match markets by time, then by strike proximity
-            matches = []
-            
-            for time_slot in lim_map:
-                if time_slot not in poly_map:
-                    continue
-                
-                # Match all combinations within strike threshold
-                for lim_strike, lim_market in lim_map[time_slot]:
-                    for poly_strike, poly_market in poly_map[time_slot]:
-                        strike_diff = abs(lim_strike - poly_strike)
-                        
-                        if strike_diff <= self.max_strike_diff:
-                            match = MarketMatch(
-                                limitless=lim_market,
-                                polymarket=poly_market,
-                                strike_limitless=lim_strike,
-                                strike_polymarket=poly_strike,
-                                strike_diff=strike_diff,
-                                time=time_slot
-                            )
-                            matches.append(match)
-                            
-                            logger.info(
-                                f"✓ Match: {time_slot} UTC | "
-                                f"Limitless ${lim_strike} vs Polymarket ${poly_strike} "
-                                f"(diff: ${strike_diff})"
-                            )
+            logger.debug(f"Found {lim_result} Limitless, {poly_result} Polymarket markets")
             
+            matches = self.index.matches()
             logger.info(f"Total matches found: {len(matches)}")
             return matches
         
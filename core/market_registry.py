@@ -0,0 +1,226 @@
+"""Normalized market registry: each venue market is parsed once, when first seen or changed"""
+import logging
+import re
+import sys
+from datetime import datetime, time, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from clients.decoders import record_key
+from clients.market_sync import MARKET_ADDED, MARKET_CHANGED, MARKET_REMOVED, MarketEvent
+
+logger = logging.getLogger(__name__)
+
+LIMITLESS = "limitless"
+POLYMARKET = "polymarket"
+
+# Title field and id field of each venue's decoded market record
+_VENUE_FIELDS = {
+    LIMITLESS: ('title', 'id'),
+    POLYMARKET: ('question', 'condition_id'),
+}
+
+def market_id(venue: str, market: Any) -> Optional[str]:
+    """Id of a decoded venue market record"""
+    return getattr(market, _VENUE_FIELDS[venue][1], None)
+
+
+ASSET_ALIASES = {
+    'BTC': 'BTC', 'BITCOIN': 'BTC',
+    'ETH': 'ETH', 'ETHEREUM': 'ETH',
+    'SOL': 'SOL', 'SOLANA': 'SOL',
+}
+
+
+class MarketRecord:
+    """Venue-neutral, typed view of one market"""
+    
+    __slots__ = (
+        'venue', 'id', 'asset', 'strike', 'expiry', 'slot', 'token_ids', 'tick_size', 'status'
+    )
+    
+    def __init__(
+        self,
+        venue: str,
+        id: str,
+        asset: Optional[str],
+        strike: Decimal,
+        expiry: datetime,
+        slot: str,
+        token_ids: Optional[Tuple[str, str]] = None,
+        tick_size: Optional[float] = None,
+        status: str = "active"
+    ):
+        self.venue = venue
+        self.id = sys.intern(id)
+        self.asset = asset
+        self.strike = strike
+        self.expiry = expiry  # tz-aware UTC
+        self.slot = sys.intern(slot)  # "HH:MM" UTC expiry time, the matching bucket
+        self.token_ids = token_ids  # (yes, no) on Polymarket
+        self.tick_size = tick_size
+        self.status = status
+    
+    @property
+    def active(self) -> bool:
+        return self.status == "active"
+    
+    def __repr__(self) -> str:
+        return f"MarketRecord({self.venue}, {self.id!r}, {self.asset} ${self.strike} @ {self.expiry:%Y-%m-%d %H:%M} UTC)"
+
+
+class MarketRegistry:
+    """
+    Markets of both venues by id, normalized once at ingestion
+    
+    `upsert` fingerprints the decoded venue record and only re-parses the
+    title, strike and expiry when that fingerprint changes, so a steady
+    universe costs one hash per market per scan. Listeners receive a
+    MarketEvent (carrying the MarketRecord) whenever a record appears,
+    changes or goes away.
+    """
+    
+    STRIKE_REGEX = re.compile(r'\$(\d+(?:,\d{3})*(?:\.\d{2})?)')
+    TIME_REGEX = re.compile(r'(\d{1,2}:\d{2})\s*UTC')
+    ASSET_REGEX = re.compile(r'\b(' + '|'.join(ASSET_ALIASES) + r')\b', re.IGNORECASE)
+    
+    def __init__(self, token_resolver: Optional[Callable[[Any], Optional[Tuple[str, str]]]] = None):
+        # Resolves (yes, no) token ids from a Polymarket record
+        self._token_resolver = token_resolver
+        
+        # (venue, id) -> record (None if the market could not be normalized)
+        self._records: Dict[Tuple[str, str], Optional[MarketRecord]] = {}
+        self._raw: Dict[Tuple[str, str], Any] = {}
+        self._fingerprints: Dict[Tuple[str, str], int] = {}
+        self._listeners: List[Callable[[MarketEvent], None]] = []
+        self.stats = {'parsed': 0, 'unchanged': 0, 'rejected': 0, 'removed': 0}
+    
+    def on_market_event(self, callback: Callable[[MarketEvent], None]) -> None:
+        """Register a listener for added/removed/changed record events"""
+        self._listeners.append(callback)
+    
+    def _emit(self, event: MarketEvent) -> None:
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"Market event listener failed: {e}", exc_info=True)
+    
+    def upsert(self, venue: str, market: Any) -> Optional[MarketRecord]:
+        """Normalized record for a decoded venue market, re-parsed only if it changed"""
+        mid = market_id(venue, market)
+        if not mid:
+            return None
+        
+        key = (venue, mid)
+        fingerprint = hash(record_key(market))
+        if self._fingerprints.get(key) == fingerprint:
+            self.stats['unchanged'] += 1
+            return self._records.get(key)
+        
+        title = getattr(market, _VENUE_FIELDS[venue][0], '') or ''
+        record = self._normalize(venue, mid, market, title)
+        previous = self._records.get(key)
+        self._fingerprints[key] = fingerprint
+        self._records[key] = record
+        self._raw[key] = market
+        self.stats['parsed'] += 1
+        
+        if record is None:
+            self.stats['rejected'] += 1
+            if previous is not None:
+                self._emit(MarketEvent(MARKET_REMOVED, mid, previous))
+        else:
+            self._emit(MarketEvent(MARKET_ADDED if previous is None else MARKET_CHANGED, mid, record))
+        return record
+    
+    def remove(self, venue: str, market_id: str) -> Optional[MarketRecord]:
+        key = (venue, market_id)
+        self._fingerprints.pop(key, None)
+        self._raw.pop(key, None)
+        record = self._records.pop(key, None)
+        self.stats['removed'] += 1
+        if record is not None:
+            self._emit(MarketEvent(MARKET_REMOVED, market_id, record))
+        return record
+    
+    def retain(self, venue: str, market_ids: Iterable[str]) -> None:
+        """Drop the venue's markets that are no longer listed"""
+        keep = set(market_ids)
+        for key in [k for k in self._records if k[0] == venue and k[1] not in keep]:
+            self.remove(*key)
+    
+    def get(self, venue: str, market_id: str) -> Optional[MarketRecord]:
+        return self._records.get((venue, market_id))
+    
+    def raw(self, venue: str, market_id: str) -> Optional[Any]:
+        """Full decoded venue record for a market id"""
+        return self._raw.get((venue, market_id))
+    
+    def records(self, venue: str) -> Iterator[MarketRecord]:
+        return (r for (v, _), r in self._records.items() if v == venue and r is not None)
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def _normalize(self, venue: str, market_id: str, market: Any, title: str) -> Optional[MarketRecord]:
+        strike_match = self.STRIKE_REGEX.search(title)
+        time_match = self.TIME_REGEX.search(title)
+        if not (strike_match and time_match):
+            return None
+        
+        try:
+            strike = Decimal(strike_match.group(1).replace(',', ''))
+            hour, minute = (int(part) for part in time_match.group(1).split(':'))
+            slot_time = time(hour, minute)
+        except (InvalidOperation, ValueError) as e:
+            logger.debug(f"Parse error for '{title}': {e}")
+            return None
+        
+        asset_match = self.ASSET_REGEX.search(title)
+        token_ids = None
+        tick_size = None
+        if venue == POLYMARKET:
+            token_ids = self._token_resolver(market) if self._token_resolver else None
+            tick_size = market.tick_size
+            raw_expiry = market.end_date
+        else:
+            raw_expiry = market.expiration
+        
+        return MarketRecord(
+            venue=venue,
+            id=market_id,
+            asset=ASSET_ALIASES[asset_match.group(1).upper()] if asset_match else None,
+            strike=strike,
+            expiry=self._expiry(raw_expiry, slot_time),
+            slot=f"{hour:02d}:{minute:02d}",
+            token_ids=token_ids,
+            tick_size=tick_size,
+            status="active" if market.active else "closed"
+        )
+    
+    @staticmethod
+    def _expiry(value: Any, slot_time: time) -> datetime:
+        """
+        Expiry from the venue field (epoch s/ms or ISO string); a date-only
+        or missing value is combined with the title's UTC time
+        """
+        if isinstance(value, str) and value.isdigit():
+            value = int(value)
+        if isinstance(value, (int, float)) and value > 0:
+            seconds = value / 1000 if value > 1e11 else value
+            return datetime.fromtimestamp(seconds, tz=timezone.utc)
+        
+        day = datetime.now(timezone.utc).date()
+        if isinstance(value, str) and value:
+            try:
+                parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                parsed = None
+            if parsed is not None:
+                if len(value) > 10:
+                    if parsed.tzinfo is None:
+                        parsed = parsed.replace(tzinfo=timezone.utc)
+                    return parsed.astimezone(timezone.utc)
+                day = parsed.date()
+        return datetime.combine(day, slot_time, tzinfo=timezone.utc)
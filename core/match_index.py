@@ -0,0 +1,285 @@
+"""Incremental cross-venue match index fed by market registry events"""
+import logging
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from clients.market_sync import MARKET_REMOVED, MarketEvent
+from core.market_registry import LIMITLESS, POLYMARKET, MarketRecord
+
+logger = logging.getLogger(__name__)
+
+MATCH_ADDED = 'added'
+MATCH_REMOVED = 'removed'
+
+MatchKey = Tuple[str, str]  # (limitless_id, polymarket_condition_id)
+
+
+class MarketMatch:
+    """
+    Compact match between one Limitless and one Polymarket market
+    
+    Holds only what pricing and execution read; the full market records
+    live in the monitor's MarketRegistry. Hashing and equality use the interned
+    id pair, so matches are cheap dict and set keys.
+    """
+    
+    __slots__ = (
+        'limitless_id', 'polymarket_condition_id', 'yes_token_id', 'no_token_id',
+        'strike_limitless', 'strike_polymarket', 'time', 'tick_size', '_hash'
+    )
+    
+    def __init__(
+        self,
+        limitless_id: str,
+        polymarket_condition_id: str,
+        yes_token_id: str,
+        no_token_id: str,
+        strike_limitless: Decimal,
+        strike_polymarket: Decimal,
+        time: str,
+        tick_size: Optional[float] = None
+    ):
+        self.limitless_id = sys.intern(limitless_id)
+        self.polymarket_condition_id = sys.intern(polymarket_condition_id)
+        self.yes_token_id = sys.intern(yes_token_id)
+        self.no_token_id = sys.intern(no_token_id)
+        self.strike_limitless = strike_limitless
+        self.strike_polymarket = strike_polymarket
+        self.time = sys.intern(time)  # expiry slot, "HH:MM" UTC
+        self.tick_size = tick_size
+        self._hash = hash((self.limitless_id, self.polymarket_condition_id))
+    
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.limitless_id, self.polymarket_condition_id
+    
+    @property
+    def strike_diff(self) -> Decimal:
+        return abs(self.strike_limitless - self.strike_polymarket)
+    
+    def token_id(self, side: str) -> str:
+        """Polymarket token bought for an outcome side"""
+        return self.yes_token_id if side.upper() == 'YES' else self.no_token_id
+    
+    def __hash__(self) -> int:
+        return self._hash
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MarketMatch):
+            return NotImplemented
+        return self._hash == other._hash and self.key == other.key
+    
+    def __repr__(self) -> str:
+        return (
+            f"MarketMatch({self.limitless_id!r}, {self.polymarket_condition_id!r}, "
+            f"{self.time} UTC, ${self.strike_limitless} vs ${self.strike_polymarket})"
+        )
+
+
+@dataclass(frozen=True)
+class MatchEvent:
+    """Change to the set of live matches"""
+    kind: str
+    match: MarketMatch
+
+
+# Float window slack; candidates are re-checked exactly with Decimal strikes
+_STRIKE_EPSILON = 1e-6
+
+
+class SortedStrikes:
+    """One venue's markets in a slot, ordered by strike with an array('d') search key"""
+    
+    __slots__ = ('strikes', 'records')
+    
+    def __init__(self):
+        self.strikes = array('d')
+        self.records: List[MarketRecord] = []
+    
+    def add(self, record: MarketRecord) -> None:
+        i = bisect_right(self.strikes, float(record.strike))
+        self.strikes.insert(i, float(record.strike))
+        self.records.insert(i, record)
+    
+    def remove(self, record: MarketRecord) -> None:
+        i = bisect_left(self.strikes, float(record.strike))
+        records = self.records
+        while i < len(records) and records[i].strike == record.strike:
+            if records[i].id == record.id:
+                del self.strikes[i]
+                del records[i]
+                return
+            i += 1
+    
+    def within(self, strike: Decimal, max_diff: Decimal) -> Iterator[MarketRecord]:
+        """Markets whose strike is within max_diff of `strike`, O(log n + k)"""
+        lo = bisect_left(self.strikes, float(strike - max_diff) - _STRIKE_EPSILON)
+        hi = bisect_right(self.strikes, float(strike + max_diff) + _STRIKE_EPSILON)
+        for record in self.records[lo:hi]:
+            if abs(record.strike - strike) <= max_diff:
+                yield record
+    
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+class _Bucket:
+    """Active markets of both venues expiring in one time slot"""
+    
+    __slots__ = ('markets',)
+    
+    def __init__(self):
+        self.markets: Dict[str, SortedStrikes] = {LIMITLESS: SortedStrikes(), POLYMARKET: SortedStrikes()}
+    
+    def __bool__(self) -> bool:
+        return bool(self.markets[LIMITLESS] or self.markets[POLYMARKET])
+
+
+class MatchIndex:
+    """
+    Live Limitless/Polymarket matches, maintained from market events
+    
+    A market event only re-matches that market against the other venue's
+    markets in its own time slot, found by a bisect range search over the
+    slot's sorted strikes, so steady-state cost follows churn, not
+    universe size. Listeners get a MatchEvent per match added or removed.
+    """
+    
+    def __init__(self, max_strike_diff: Decimal):
+        self.max_strike_diff = max_strike_diff
+        
+        self._buckets: Dict[str, _Bucket] = {}
+        # Where each market currently sits: (venue, id) -> record
+        self._placed: Dict[Tuple[str, str], MarketRecord] = {}
+        self._matches: Dict[MatchKey, MarketMatch] = {}
+        self._by_market: Dict[Tuple[str, str], Set[MatchKey]] = {}
+        self._listeners: List[Callable[[MatchEvent], None]] = []
+        self.stats = {'market_events': 0, 'comparisons': 0, 'added': 0, 'removed': 0}
+    
+    def on_match_event(self, callback: Callable[[MatchEvent], None]) -> None:
+        """Register a listener for match added/removed events"""
+        self._listeners.append(callback)
+    
+    def matches(self) -> List[MarketMatch]:
+        return list(self._matches.values())
+    
+    def __len__(self) -> int:
+        return len(self._matches)
+    
+    def __contains__(self, key: MatchKey) -> bool:
+        return key in self._matches
+    
+    def apply(self, event: MarketEvent) -> None:
+        """Market registry listener: re-match only the market that changed"""
+        record: MarketRecord = event.market
+        if record is None:
+            return
+        self.stats['market_events'] += 1
+        if event.kind == MARKET_REMOVED or not record.active:
+            self._place(record.venue, record.id, None)
+        else:
+            self._place(record.venue, record.id, record)
+    
+    def _place(self, venue: str, market_id: str, record: Optional[MarketRecord]) -> None:
+        market_key = (venue, market_id)
+        previous = self._placed.pop(market_key, None)
+        if previous is not None:
+            bucket = self._buckets.get(previous.slot)
+            if bucket is not None:
+                bucket.markets[venue].remove(previous)
+                if not bucket:
+                    del self._buckets[previous.slot]
+        
+        found: Dict[MatchKey, MarketMatch] = {}
+        if record is not None:
+            self._placed[market_key] = record
+            bucket = self._buckets.setdefault(record.slot, _Bucket())
+            bucket.markets[venue].add(record)
+            found = self._match_market(record, bucket)
+        
+        old_keys = self._by_market.get(market_key, set())
+        for key in old_keys - found.keys():
+            self._remove_match(key)
+        for key, match in found.items():
+            existing = self._matches.get(key)
+            if existing is not None:
+                if self._terms(existing) == self._terms(match):
+                    continue
+                self._remove_match(key)
+            self._add_match(match)
+    
+    def _match_market(self, record: MarketRecord, bucket: _Bucket) -> Dict[MatchKey, MarketMatch]:
+        """Matches between one market and the other venue's markets in its slot"""
+        other_venue = POLYMARKET if record.venue == LIMITLESS else LIMITLESS
+        
+        found = {}
+        for other in bucket.markets[other_venue].within(record.strike, self.max_strike_diff):
+            self.stats['comparisons'] += 1
+            lim, poly = (record, other) if record.venue == LIMITLESS else (other, record)
+            match = self._build(lim, poly)
+            if match is not None:
+                found[match.key] = match
+        return found
+    
+    @staticmethod
+    def _build(lim: MarketRecord, poly: MarketRecord) -> Optional[MarketMatch]:
+        if not poly.token_ids:
+            return None
+        return MarketMatch(
+            limitless_id=lim.id,
+            polymarket_condition_id=poly.id,
+            yes_token_id=poly.token_ids[0],
+            no_token_id=poly.token_ids[1],
+            strike_limitless=lim.strike,
+            strike_polymarket=poly.strike,
+            time=lim.slot,
+            tick_size=poly.tick_size
+        )
+    
+    @staticmethod
+    def _terms(match: MarketMatch) -> Tuple:
+        return (
+            match.time, match.strike_limitless, match.strike_polymarket,
+            match.yes_token_id, match.no_token_id, match.tick_size
+        )
+    
+    def _add_match(self, match: MarketMatch) -> None:
+        self._matches[match.key] = match
+        self._by_market.setdefault((LIMITLESS, match.limitless_id), set()).add(match.key)
+        self._by_market.setdefault((POLYMARKET, match.polymarket_condition_id), set()).add(match.key)
+        self.stats['added'] += 1
+        logger.info(
+            f"✓ Match: {match.time} UTC | "
+            f"Limitless ${match.strike_limitless} vs Polymarket ${match.strike_polymarket} "
+            f"(diff: ${match.strike_diff})"
+        )
+        self._emit(MatchEvent(MATCH_ADDED, match))
+    
+    def _remove_match(self, key: MatchKey) -> None:
+        match = self._matches.pop(key, None)
+        if match is None:
+            return
+        for market_key in ((LIMITLESS, match.limitless_id), (POLYMARKET, match.polymarket_condition_id)):
+            keys = self._by_market.get(market_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_market[market_key]
+        self.stats['removed'] += 1
+        logger.info(f"✗ Match removed: {match.time} UTC | {match.limitless_id} / {match.polymarket_condition_id}")
+        self._emit(MatchEvent(MATCH_REMOVED, match))
+    
+    def is_matched(self, venue: str, market_id: str) -> bool:
+        """True if the market is part of any live match"""
+        return (venue, market_id) in self._by_market
+    
+    def _emit(self, event: MatchEvent) -> None:
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"Match event listener failed: {e}", exc_info=True)
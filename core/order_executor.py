@@ -1,10 +1,12 @@
 """Parallel order execution with rollback capabilities"""
 import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from decimal import Decimal
 from dataclasses import dataclass
 
+from core.arbitrage_engine import Sizing
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,82 +25,43 @@ class ExecutionResult:
         return bool(self.limitless_order and self.polymarket_order)
 
 
+@dataclass
+class _PendingArbitrage:
+    """Both legs of one arbitrage waiting for the next batch submission"""
+    limitless_order: Dict
+    polymarket_order: Dict
+    bet_size: Decimal
+    future: asyncio.Future
+
+
 class OrderExecutor:
-    """High-performance parallel order execution"""
+    """
+    High-performance parallel order execution
+    
+    Arbitrages requested in the same event-loop tick are grouped: all
+    their legs go out as one batch submission per venue, in parallel, and
+    each venue's per-order results are mapped back to their arbitrage.
+    """
     
     def __init__(
         self, 
         limitless_client, 
         polymarket_client,
-        execution_timeout: int = 12
+        execution_timeout: int = 12,
+        batch_window: float = 0.0
     ):
         self.limitless = limitless_client
         self.polymarket = polymarket_client
         self.execution_timeout = execution_timeout
-    
-    async def _execute_limitless_order(
-        self,
-        market_id: str,
-        side: str,
-        bet_size: Decimal,
-        price: Decimal
-    ) -> Optional[Dict]:
-        """Execute Limitless order with error handling"""
-        try:
-            result = await self.limitless.place_order(
-                market_id, 
-                side, 
-                bet_size, 
-                price
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Limitless order failed: {e}")
-            return None
-    
-    async def _execute_polymarket_order(
-        self,
-        token_id: str,
-        side: str,
-        bet_size: Decimal,
-        price: Decimal
-    ) -> Optional[Dict]:
-        """Execute Polymarket order with error handling"""
-        try:
-            result = await self.polymarket.place_order(
-                token_id,
-                side,
-                bet_size,
-                price
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Polymarket order failed: {e}")
-            return None
-    
-    def _get_polymarket_token_id(
-        self, 
-        polymarket_market: Dict, 
-        side: str
-    ) -> Optional[str]:
-        """Extract correct token ID based on side"""
-        try:
-            tokens = polymarket_market.get('tokens', [])
-            if not tokens or len(tokens) < 2:
-                logger.error("Invalid Polymarket market structure")
-                return None
-            
-            # Token index: YES = 1, NO = 0
-            token_idx = 1 if side.upper() == 'YES' else 0
-            return tokens[token_idx].get('token_id')
-        except (KeyError, IndexError) as e:
-            logger.error(f"Error getting token ID: {e}")
-            return None
+        self.batch_window = batch_window
+        
+        self._pending: List[_PendingArbitrage] = []
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def execute_arbitrage(
         self,
         opportunity,
-        bet_size: Decimal,
+        sizing: Sizing,
         match
     ) -> ExecutionResult:
         """
@@ -106,7 +69,7 @@ class OrderExecutor:
         
         Args:
             opportunity: Opportunity dataclass
-            bet_size: Amount to bet per side
+            sizing: Depth-aware size and limit prices for both legs
             match: MarketMatch containing market data
         
         Returns:
@@ -115,15 +78,13 @@ class OrderExecutor:
         logger.info("=" * 60)
         logger.info(f"🎯 EXECUTING ARBITRAGE")
         logger.info(f"Strategy: {opportunity.type}")
-        logger.info(f"Bet Size: ${bet_size} per side (${bet_size * 2} total)")
+        bet_size = sizing.size
+        logger.info(f"Size: {bet_size} shares per side ({sizing.levels} levels)")
         logger.info(f"Expected Profit: {opportunity.profit_pct:.2f}%")
         logger.info("=" * 60)
         
         # Get Polymarket token ID
-        poly_token_id = self._get_polymarket_token_id(
-            match.polymarket,
-            opportunity.polymarket_side
-        )
+        poly_token_id = match.token_id(opportunity.polymarket_side)
         
         if not poly_token_id:
             return ExecutionResult(
@@ -133,72 +94,112 @@ class OrderExecutor:
                 error="Invalid Polymarket token ID"
             )
         
-        # Create order tasks
-        lim_task = asyncio.create_task(
-            self._execute_limitless_order(
-                match.limitless_id,
-                opportunity.limitless_side,
-                bet_size,
-                opportunity.limitless_price
-            )
+        pending = _PendingArbitrage(
+            limitless_order={
+                'market_id': match.limitless_id,
+                'outcome': opportunity.limitless_side,
+                'side': 'buy',
+                'amount': bet_size,
+                'price': sizing.limitless_limit
+            },
+            polymarket_order={
+                'token_id': poly_token_id,
+                'side': 'BUY',  # Always buying on Polymarket
+                'amount': bet_size,
+                'price': sizing.polymarket_limit
+            },
+            bet_size=bet_size,
+            future=asyncio.get_running_loop().create_future()
         )
+        self._pending.append(pending)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
         
-        poly_task = asyncio.create_task(
-            self._execute_polymarket_order(
-                poly_token_id,
-                'BUY',  # Always buying on Polymarket
-                bet_size,
-                opportunity.polymarket_price
-            )
-        )
+        return await pending.future
+    
+    async def _flush(self) -> None:
+        """Submit every arbitrage queued this tick as one batch per venue"""
+        await asyncio.sleep(self.batch_window)
+        batch, self._pending = self._pending, []
+        self._flush_task = None
+        
+        if len(batch) > 1:
+            logger.info(f"Submitting {len(batch)} arbitrages as one batch per venue")
         
         try:
-            # Execute both orders concurrently with timeout
-            lim_result, poly_result = await asyncio.wait_for(
-                asyncio.gather(lim_task, poly_task, return_exceptions=False),
+            await self._submit(batch)
+        except Exception as e:
+            logger.error(f"❌ EXECUTION ERROR: {e}", exc_info=True)
+            self._resolve_failed(batch, str(e))
+        finally:
+            # Never leave a caller waiting: cancellation, short result lists, ...
+            self._resolve_failed(batch, "No result for this arbitrage")
+    
+    async def _submit(self, batch: List[_PendingArbitrage]) -> None:
+        """Place both venues' batches concurrently and resolve each arbitrage"""
+        try:
+            lim_results, poly_results = await asyncio.wait_for(
+                asyncio.gather(
+                    self.limitless.place_orders_batch([p.limitless_order for p in batch]),
+                    self.polymarket.place_orders_batch([p.polymarket_order for p in batch])
+                ),
                 timeout=self.execution_timeout
             )
-            
-            success = bool(lim_result and poly_result)
-            
-            if success:
-                logger.info("✅ ARBITRAGE EXECUTED SUCCESSFULLY!")
-                logger.info(f"   Limitless Order ID: {lim_result.get('id', 'N/A')}")
-                logger.info(f"   Polymarket Order ID: {poly_result.get('orderID', 'N/A')}")
-            else:
-                logger.warning("⚠️  PARTIAL EXECUTION - One order failed")
-                logger.warning("   Manual intervention may be required")
-                if not lim_result:
-                    logger.warning("   → Limitless order FAILED")
-                if not poly_result:
-                    logger.warning("   → Polymarket order FAILED")
-            
-            return ExecutionResult(
-                success=success,
-                limitless_order=lim_result,
-                polymarket_order=poly_result,
-                bet_size=bet_size
-            )
-        
         except asyncio.TimeoutError:
             logger.error(f"❌ EXECUTION TIMEOUT ({self.execution_timeout}s)")
             logger.error("   Orders may be partially filled - check manually!")
-            
-            return ExecutionResult(
-                success=False,
-                limitless_order=None,
-                polymarket_order=None,
-                error="Execution timeout",
-                bet_size=bet_size
-            )
+            self._resolve_failed(batch, "Execution timeout")
+            return
         
-        except Exception as e:
-            logger.error(f"❌ EXECUTION ERROR: {e}", exc_info=True)
-            
-            return ExecutionResult(
-                success=False,
-                limitless_order=None,
-                polymarket_order=None,
-                error=str(e),
-                bet_size=bet_size
-            )
+        for pending, lim_result, poly_result in zip(batch, lim_results, poly_results):
+            if not pending.future.done():
+                pending.future.set_result(
+                    self._build_result(lim_result, poly_result, pending.bet_size)
+                )
+    
+    @staticmethod
+    def _resolve_failed(batch: List[_PendingArbitrage], error: str) -> None:
+        for pending in batch:
+            if not pending.future.done():
+                pending.future.set_result(ExecutionResult(
+                    success=False,
+                    limitless_order=None,
+                    polymarket_order=None,
+                    error=error,
+                    bet_size=pending.bet_size
+                ))
+    
+    @staticmethod
+    def _build_result(
+        lim_result: Optional[Dict], 
+        poly_result: Optional[Dict], 
+        bet_size: Decimal
+    ) -> ExecutionResult:
+        """Log and wrap the outcome of one arbitrage's two legs"""
+        # Anything but a dict reply is an unreadable leg; keep it in the log only
+        if lim_result is not None and not isinstance(lim_result, dict):
+            logger.error(f"   Unexpected Limitless order reply: {lim_result!r}")
+            lim_result = None
+        if poly_result is not None and not isinstance(poly_result, dict):
+            logger.error(f"   Unexpected Polymarket order reply: {poly_result!r}")
+            poly_result = None
+        success = bool(lim_result and poly_result)
+        
+        if success:
+            logger.info("✅ ARBITRAGE EXECUTED SUCCESSFULLY!")
+            logger.info(f"   Limitless Order ID: {lim_result.get('id', 'N/A')}")
+            logger.info(f"   Polymarket Order ID: {poly_result.get('orderID', 'N/A')}")
+        else:
+            logger.warning("⚠️  PARTIAL EXECUTION - One order failed")
+            logger.warning("   Manual intervention may be required")
+            if not lim_result:
+                logger.warning("   → Limitless order FAILED")
+            if not poly_result:
+                logger.warning("   → Polymarket order FAILED")
+        
+        return ExecutionResult(
+            success=success,
+            limitless_order=lim_result,
+            polymarket_order=poly_result,
+            bet_size=bet_size
+        )
@@ -6,17 +6,26 @@ import asyncio
 import logging
 import signal
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
 from config.settings import BotConfig
 from config.credentials import Credentials
 from clients.limitless_client import LimitlessClient
+from clients.order_book import OrderBook
 from clients.polymarket_client import PolymarketClient
+from clients.signing_service import PolymarketSigningService
+from clients.transport import TRANSIENT_ERRORS, HttpTransport
 from core.market_monitor import MarketMonitor, MarketMatch
+from core.market_registry import LIMITLESS, POLYMARKET
+from core.match_index import MATCH_ADDED, MatchEvent
 from core.arbitrage_engine import ArbitrageEngine, Opportunity
 from core.order_executor import OrderExecutor
 from utils.logger import setup_logger
 from utils.cache import AsyncCache
+from utils.connection_warmer import ConnectionWarmer
+from utils.hedging import RequestHedger
+from utils.rate_limiter import PriorityRateLimiter
+from utils.retry import RetryPolicy
 
 logger = setup_logger()
 
@@ -35,6 +44,10 @@ class ArbitrageBot:
             'trades_successful': 0,
             'trades_failed': 0
         }
+        
+        # Match deltas since the last scan, drained by _apply_match_deltas
+        self._added_matches: List[MarketMatch] = []
+        self._removed_matches: List[MarketMatch] = []
     
     def _setup_signal_handlers(self):
         """Setup graceful shutdown handlers"""
@@ -45,30 +58,92 @@ class ArbitrageBot:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
     
+    def _make_hedger(self) -> Optional[RequestHedger]:
+        """Per-venue request hedger, if enabled"""
+        if not self.config.HEDGE_REQUESTS:
+            return None
+        return RequestHedger.from_config(self.config)
+    
+    def _make_signing_service(self) -> Optional[PolymarketSigningService]:
+        """Process-pool order signer, if enabled"""
+        if self.config.SIGNING_WORKERS <= 0:
+            return None
+        return PolymarketSigningService(
+            Credentials.get_polymarket_private_key(),
+            self.config.POLYMARKET_CHAIN_ID,
+            self.config.POLYMARKET_HOST,
+            workers=self.config.SIGNING_WORKERS
+        )
+    
     async def initialize_clients(self):
         """Initialize API clients"""
         logger.info("Initializing API clients...")
         
         try:
             self.limitless = LimitlessClient(
-                self.config.LIMITLESS_API_URL,
                 Credentials.get_limitless_key(),
                 Credentials.get_limitless_private_key(),
-                timeout=self.config.REQUEST_TIMEOUT,
-                max_concurrent=self.config.MAX_CONCURRENT_REQUESTS
+                host=self.config.LIMITLESS_API_URL,
+                transport=HttpTransport.from_config(
+                    self.config,
+                    self.config.LIMITLESS_API_URL,
+                    name="limitless",
+                    backend=self.config.LIMITLESS_HTTP_BACKEND,
+                    rate_limiter=PriorityRateLimiter(
+                        self.config.LIMITLESS_RATE_LIMIT,
+                        self.config.LIMITLESS_RATE_BURST,
+                        order_reserve=self.config.RATE_LIMIT_ORDER_RESERVE,
+                        name="limitless"
+                    )
+                ),
+                discovery_page_size=self.config.DISCOVERY_PAGE_SIZE,
+                discovery_prefetch=self.config.DISCOVERY_PREFETCH,
+                sync_mode=self.config.MARKET_SYNC_MODE,
+                ws_url=self.config.LIMITLESS_WS_URL,
+                retry_policy=RetryPolicy.from_config(
+                    self.config,
+                    retryable_exceptions=TRANSIENT_ERRORS,
+                    name="limitless"
+                ),
+                hedger=self._make_hedger()
             )
             
+            signing_service = self._make_signing_service()
             self.polymarket = PolymarketClient(
                 Credentials.get_polymarket_private_key(),
                 self.config.POLYMARKET_CHAIN_ID,
-                self.config.POLYMARKET_HOST
+                self.config.POLYMARKET_HOST,
+                transport=HttpTransport.from_config(
+                    self.config,
+                    self.config.POLYMARKET_HOST,
+                    name="polymarket",
+                    backend=self.config.POLYMARKET_HTTP_BACKEND,
+                    rate_limiter=PriorityRateLimiter(
+                        self.config.POLYMARKET_RATE_LIMIT,
+                        self.config.POLYMARKET_RATE_BURST,
+                        order_reserve=self.config.RATE_LIMIT_ORDER_RESERVE,
+                        name="polymarket"
+                    )
+                ),
+                discovery_prefetch=self.config.DISCOVERY_PREFETCH,
+                ws_url=self.config.POLYMARKET_WS_URL,
+                retry_policy=RetryPolicy.from_config(
+                    self.config,
+                    retryable_exceptions=TRANSIENT_ERRORS,
+                    name="polymarket"
+                ),
+                hedger=self._make_hedger(),
+                signing_service=signing_service
             )
+            if signing_service is not None:
+                await signing_service.start()
             
             self.monitor = MarketMonitor(
                 self.limitless,
                 self.polymarket,
                 self.config.MAX_STRIKE_DIFF
             )
+            self.monitor.on_match_event(self._on_match_event)
             
             self.arbitrage_engine = ArbitrageEngine(
                 self.config.MIN_SPREAD_PCT,
@@ -76,56 +151,113 @@ class ArbitrageBot:
                 self.config.SLIPPAGE_TOLERANCE
             )
             
+            if self.config.PRESIGN_ORDERS:
+                self.polymarket.enable_presigning(
+                    self.arbitrage_engine.shares_for,
+                    ticks=self.config.PRESIGN_LADDER_TICKS,
+                    ttl=self.config.PRESIGN_TTL
+                )
+            
             self.executor = OrderExecutor(
                 self.limitless, 
                 self.polymarket,
                 execution_timeout=self.config.REQUEST_TIMEOUT + 4
             )
             
+            self.warmer = ConnectionWarmer(
+                [
+                    ("limitless", self.limitless.warm_connections),
+                    ("polymarket", self.polymarket.warm_connections),
+                ],
+                connections=self.config.WARM_CONNECTIONS,
+                ping_interval=self.config.KEEPALIVE_PING_INTERVAL,
+                reprime_lead=self.config.REPRIME_LEAD
+            )
+            
             logger.info("✓ All clients initialized successfully")
         
         except Exception as e:
             logger.error(f"Failed to initialize clients: {e}", exc_info=True)
             raise
     
+    def _on_match_event(self, event: MatchEvent) -> None:
+        if event.kind == MATCH_ADDED:
+            self._added_matches.append(event.match)
+        else:
+            self._removed_matches.append(event.match)
+    
+    async def _apply_match_deltas(self):
+        """
+        Subscribe market data for new matches and release markets no longer matched
+        
+        Queued deltas are dropped only once handled, so a failed subscribe
+        or release is retried on the next scan.
+        """
+        index = self.monitor.index
+        
+        removed = list(self._removed_matches)
+        lim_gone = list({
+            m.limitless_id for m in removed if not index.is_matched(LIMITLESS, m.limitless_id)
+        })
+        poly_gone = list({
+            m.polymarket_condition_id for m in removed
+            if not index.is_matched(POLYMARKET, m.polymarket_condition_id)
+        })
+        try:
+            if lim_gone or poly_gone:
+                await asyncio.gather(
+                    self.limitless.release_orderbooks(lim_gone),
+                    self.polymarket.release_markets(poly_gone)
+                )
+                logger.info(f"Released {len(lim_gone)} Limitless / {len(poly_gone)} Polymarket market(s) no longer matched")
+            del self._removed_matches[:len(removed)]
+        except Exception as e:
+            logger.warning(f"Releasing unmatched markets failed, retrying next scan: {e}")
+        
+        added = list(self._added_matches)
+        live = [m for m in added if m.key in index]
+        try:
+            if live and self.config.STREAM_MARKET_DATA:
+                await asyncio.gather(
+                    self.limitless.subscribe_orderbooks(
+                        list({m.limitless_id for m in live})
+                    ),
+                    self.polymarket.start_stream(
+                        list({m.polymarket_condition_id for m in live})
+                    )
+                )
+            del self._added_matches[:len(added)]
+        except Exception as e:
+            logger.warning(f"Subscribing new matches failed, retrying next scan: {e}")
+    
     async def process_match(
         self, 
-        match: MarketMatch
+        match: MarketMatch,
+        opportunity: Opportunity,
+        lim_book: OrderBook,
+        poly_book: OrderBook
     ) -> bool:
         """
-        Process a single market match for arbitrage
+        Size and execute one opportunity found by the batch evaluation
         
         Returns:
             True if trade was executed, False otherwise
         """
         try:
-            # Fetch prices for both markets
-            lim_prices, poly_prices = await asyncio.gather(
-                self.limitless.get_market_prices(match.limitless_id),
-                self.polymarket.get_market_prices(match.polymarket_condition_id)
-            )
-            
-            if not lim_prices or not poly_prices:
-                logger.debug(f"Missing prices for {match.time} UTC")
-                return False
+            self.stats['opportunities_found'] += 1
             
-            # Check for arbitrage opportunity
-            opportunity = self.arbitrage_engine.find_arbitrage(
-                lim_prices, 
-                poly_prices
+            # Size against the depth on both books
+            sizing = self.arbitrage_engine.size_opportunity(
+                opportunity,
+                lim_book,
+                poly_book
             )
-            
-            if not opportunity:
+            if sizing is None:
+                logger.debug(f"No fillable depth for {match.time} UTC")
                 return False
             
-            self.stats['opportunities_found'] += 1
-            
-            # Calculate bet size
-            bet_size = self.arbitrage_engine.calculate_bet_size(opportunity)
-            estimated_profit = self.arbitrage_engine.estimate_profit(
-                opportunity, 
-                bet_size
-            )
+            lim_cost = sizing.size * sizing.limitless_vwap
+            poly_cost = sizing.size * sizing.polymarket_vwap
             
             logger.info(f"""
 ╔══════════════════════════════════════════════════════════╗
@@ -140,20 +272,20 @@ class ArbitrageBot:
 ║ Spread:           {opportunity.spread_pct:.2f}%
 ║ Profit Potential: {opportunity.profit_pct:.2f}%
 ╠══════════════════════════════════════════════════════════╣
-║ Limitless:        {opportunity.limitless_side} @ ${opportunity.limitless_price}
-║ Polymarket:       {opportunity.polymarket_side} @ ${opportunity.polymarket_price}
+║ Limitless:        {opportunity.limitless_side} @ ${opportunity.limitless_price} (VWAP ${sizing.limitless_vwap})
+║ Polymarket:       {opportunity.polymarket_side} @ ${opportunity.polymarket_price} (VWAP ${sizing.polymarket_vwap})
 ║ Total Cost:       ${opportunity.total_cost}
 ╠══════════════════════════════════════════════════════════╣
-║ Bet Size:         ${bet_size} per side
-║ Total Investment: ${bet_size * 2}
-║ Est. Profit:      ${estimated_profit}
+║ Size:             {sizing.size} shares per side ({sizing.levels} levels)
+║ Total Investment: ${(lim_cost + poly_cost).quantize(Decimal('0.01'))}
+║ Est. Profit:      ${sizing.expected_profit}
 ╚══════════════════════════════════════════════════════════╝
             """)
             
             # Execute arbitrage
             result = await self.executor.execute_arbitrage(
                 opportunity,
-                bet_size,
+                sizing,
                 match
             )
             
@@ -185,14 +317,49 @@ class ArbitrageBot:
             # Find matching markets
             matches = await self.monitor.find_matching_markets()
             
+            # Only matches that appeared or went away since the last scan
+            await self._apply_match_deltas()
+            
             if not matches:
                 logger.info("No matching markets found")
                 return
             
             logger.info(f"📊 Processing {len(matches)} market match(es)...")
             
-            # Process all matches concurrently
-            tasks = [self.process_match(match) for match in matches]
+            # Fetch all books in one batched pass per venue
+            lim_books, poly_books = await asyncio.gather(
+                self.limitless.get_market_books_batch(
+                    list({m.limitless_id for m in matches})
+                ),
+                self.polymarket.get_market_books_batch(
+                    list({m.polymarket_condition_id for m in matches})
+                )
+            )
+            
+            # Keep pre-signed Polymarket orders centred on the latest asks of both legs
+            pair_books = {}
+            for m in matches:
+                lim_book = lim_books.get(m.limitless_id)
+                if lim_book is not None:
+                    pair_books.setdefault(m.polymarket_condition_id, lim_book)
+            self.polymarket.refresh_presigned(poly_books, pair_books)
+            
+            # Evaluate every match in one batch; only candidates are processed
+            books = [
+                (lim_books.get(m.limitless_id), poly_books.get(m.polymarket_condition_id))
+                for m in matches
+            ]
+            candidates = self.arbitrage_engine.evaluate_batch(matches, books)
+            
+            tasks = [
+                self.process_match(
+                    match,
+                    opportunity,
+                    lim_books[match.limitless_id],
+                    poly_books[match.polymarket_condition_id]
+                )
+                for match, opportunity in candidates
+            ]
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # Count successful trades
@@ -228,6 +395,73 @@ class ArbitrageBot:
                           self.stats['trades_executed'] * 100)
             logger.info(f"Success Rate:         {success_rate:.1f}%")
         
+        registry = self.monitor.registry
+        logger.info(
+            f"Market Registry:      {len(registry)} markets | "
+            f"{registry.stats['parsed']} parsed | {registry.stats['unchanged']} unchanged"
+        )
+        index = self.monitor.index
+        logger.info(
+            f"Match Index:          {len(index)} matches | "
+            f"{index.stats['added']} added | {index.stats['removed']} removed | "
+            f"{index.stats['comparisons']} comparisons"
+        )
+        
+        # Polymarket orders go out through py_clob_client, not the pooled transport
+        for venue, client, pooled_orders in (
+            ('Limitless', self.limitless, True),
+            ('Polymarket', self.polymarket, False)
+        ):
+            pool = client.pool_stats()
+            logger.info(
+                f"{venue + ' Pool:':<22}{pool['requests']} requests | "
+                f"peak {pool['peak_in_flight']} in flight | "
+                f"{pool['timeouts']} timeouts"
+            )
+            handshakes = f"{venue + ' Handshakes:':<22}{pool['handshakes']} new | {pool['reused_connections']} reused"
+            if pooled_orders:
+                handshakes += f" | {pool['handshakes_by_operation'].get('order', 0)} on the order path"
+            logger.info(handshakes)
+            book_latency = pool['latency_ms'].get('orderbook')
+            if book_latency:
+                logger.info(
+                    f"{venue + ' Latency:':<22}{pool['backend']} | "
+                    f"book p50 {book_latency['p50']}ms p90 {book_latency['p90']}ms"
+                )
+            limiter = pool.get('rate_limiter')
+            if limiter:
+                logger.info(
+                    f"{venue + ' Rate Limit:':<22}{limiter['throttled']} throttles | "
+                    f"{limiter['paused_seconds']}s paused"
+                )
+            retries = client.retry_stats()
+            logger.info(
+                f"{venue + ' Retries:':<22}{retries['retries']} retries | "
+                f"{retries['give_ups']} give-ups "
+                f"({retries['deadline_exhausted']} past deadline)"
+            )
+            hedges = client.hedge_stats()
+            if hedges:
+                logger.info(
+                    f"{venue + ' Hedging:':<22}{hedges['hedge_rate']:.1%} hedged | "
+                    f"{hedges['win_ratio']:.1%} of hedges won"
+                )
+        
+        signing = self.polymarket.signing_stats()
+        if signing:
+            logger.info(
+                f"{'Signing Pool:':<22}{signing['completed']} signed | "
+                f"p50 {signing['p50_ms']}ms p90 {signing['p90_ms']}ms | "
+                f"peak queue {signing['peak_queue_depth']}"
+            )
+        
+        presign = self.polymarket.presign_stats()
+        if presign:
+            logger.info(
+                f"{'Pre-signed Orders:':<22}{presign['hit_rate']:.1%} hit rate | "
+                f"{presign['ready']} ready | {presign['signed']} signed"
+            )
+        
         logger.info("=" * 70)
     
     async def run(self):
@@ -244,8 +478,10 @@ class ArbitrageBot:
         logger.info(f"Slippage Tolerance:   {self.config.SLIPPAGE_TOLERANCE}%")
         logger.info("=" * 70)
         
-        async with self.limitless:
+        async with self.limitless, self.polymarket:
             try:
+                await self.warmer.start()
+                
                 while self.running:
                     await self.scan_and_execute()
                     
@@ -260,6 +496,7 @@ class ArbitrageBot:
                 logger.error(f"Fatal error: {e}", exc_info=True)
             
             finally:
+                await self.warmer.stop()
                 self.print_stats()
                 logger.info("🏁 Bot shutdown complete")
 
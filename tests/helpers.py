@@ -0,0 +1,10 @@
+"""Shared test helpers"""
+import asyncio
+
+
+async def wait_until(predicate, timeout: float = 2.0):
+    """Poll `predicate` until it is truthy, failing after `timeout` seconds"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
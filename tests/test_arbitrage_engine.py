@@ -0,0 +1,60 @@
+"""ArbitrageEngine.size_opportunity depth walk"""
+from decimal import Decimal
+
+from clients.order_book import OrderBook
+from core.arbitrage_engine import ArbitrageEngine
+
+
+def make_engine() -> ArbitrageEngine:
+    # 3% spread threshold, $10 max bet, 0.5% slippage -> $9.95 budget across both legs
+    return ArbitrageEngine(Decimal('3'), Decimal('10'), Decimal('0.5'))
+
+
+def size(engine, lim_yes_asks, poly_no_asks):
+    lim = OrderBook.from_levels('lim', yes_asks=lim_yes_asks, no_asks=[(0.70, 100)])
+    poly = OrderBook.from_levels('poly', yes_asks=[(0.70, 100)], no_asks=poly_no_asks)
+    opportunity = engine.find_arbitrage(lim, poly)
+    assert opportunity.type == 'YES_LIMITLESS_NO_POLYMARKET'
+    return engine.size_opportunity(opportunity, lim, poly)
+
+
+def test_deep_top_level_is_capped_by_budget_and_matches_shares_for():
+    engine = make_engine()
+    sizing = size(engine, [(0.40, 1000)], [(0.50, 1000)])
+    
+    assert sizing.size == Decimal('11.05')
+    assert sizing.size == engine.shares_for(Decimal('0.40'), Decimal('0.50'))
+    assert sizing.size * (sizing.limitless_vwap + sizing.polymarket_vwap) <= engine.bet_budget()
+    assert (sizing.limitless_limit, sizing.polymarket_limit) == (Decimal('0.4'), Decimal('0.5'))
+    assert sizing.levels == 1
+
+
+def test_walk_stops_at_first_level_pair_below_spread_threshold():
+    engine = make_engine()
+    # 0.40 + 0.50 clears; 0.49 + 0.50 costs under $1 but not by the 3% spread
+    sizing = size(engine, [(0.40, 4), (0.49, 100)], [(0.50, 100)])
+    
+    assert sizing.size == Decimal('4')
+    assert sizing.limitless_limit == Decimal('0.4')
+    assert sizing.levels == 1
+
+
+def test_walk_fills_across_levels_until_budget():
+    engine = make_engine()
+    sizing = size(engine, [(0.40, 4), (0.42, 100)], [(0.50, 6), (0.51, 100)])
+    
+    # 4 @ 0.90, 2 @ 0.92, then 0.93 pairs until the budget runs out
+    assert sizing.levels == 3
+    assert (sizing.limitless_limit, sizing.polymarket_limit) == (Decimal('0.42'), Decimal('0.51'))
+    spent = Decimal('4') * Decimal('0.90') + Decimal('2') * Decimal('0.92')
+    assert sizing.size == 6 + ((engine.bet_budget() - spent) / Decimal('0.93')).quantize(Decimal('0.01'), 'ROUND_FLOOR')
+    assert sizing.size * (sizing.limitless_vwap + sizing.polymarket_vwap) <= engine.bet_budget()
+
+
+def test_leg_without_depth_is_not_sized():
+    engine = make_engine()
+    lim = OrderBook.from_levels('lim', yes_asks=[(0.40, 100)])
+    poly = OrderBook.from_levels('poly', no_asks=[(0.50, 100)])
+    opportunity = engine.find_arbitrage(lim, poly)
+    
+    assert engine.size_opportunity(opportunity, lim, OrderBook.from_levels('poly')) is None
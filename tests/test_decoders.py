@@ -0,0 +1,32 @@
+"""Venue payload decoding"""
+from clients.decoders import LimitlessBook
+
+
+def test_limitless_book_with_yes_and_no_ladders():
+    book = LimitlessBook.from_dict({
+        'yes': {'bids': [{'price': '0.40', 'size': '5'}], 'asks': [{'price': '0.42', 'size': '7'}]},
+        'no': {'bids': [{'price': '0.57', 'size': '3'}], 'asks': [{'price': '0.60', 'size': '9'}]},
+    })
+    
+    assert book.yes_bids == ((0.40, 5.0),)
+    assert book.yes_asks == ((0.42, 7.0),)
+    assert book.no_bids == ((0.57, 3.0),)
+    assert book.no_asks == ((0.60, 9.0),)
+
+
+def test_flat_limitless_book_derives_no_as_complement_of_yes():
+    # Buying NO at 1 - p is selling YES to a bid at p, and vice versa
+    book = LimitlessBook.from_dict({
+        'bids': [{'price': '0.40', 'size': '5'}, {'price': 0.38, 'size': 2}],
+        'asks': [{'price': 0.45, 'size': 3}],
+    })
+    
+    assert book.yes_bids == ((0.40, 5.0), (0.38, 2.0))
+    assert book.yes_asks == ((0.45, 3.0),)
+    assert book.no_asks == ((0.60, 5.0), (0.62, 2.0))
+    assert book.no_bids == ((0.55, 3.0),)
+
+
+def test_empty_limitless_book_is_falsy():
+    assert not LimitlessBook.from_dict({})
+    assert not LimitlessBook.from_dict({'yes': {}, 'no': None})
@@ -0,0 +1,90 @@
+"""LimitlessOrderbookFeed against a local Socket.IO-style WebSocket stand-in"""
+import asyncio
+import json
+
+from aiohttp import WSMsgType, web
+
+from clients.limitless_client import LimitlessClient
+from clients.limitless_stream import LimitlessOrderbookFeed
+from tests.helpers import wait_until
+
+NAMESPACE = LimitlessOrderbookFeed.NAMESPACE
+
+
+class FakeMarketsSocket:
+    """Engine.IO v4 handshake plus the /markets namespace, recording emitted events"""
+    
+    def __init__(self):
+        self.events = []
+        self.ws = None
+        self._runner = None
+        self.url = None
+    
+    async def _handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.ws = ws
+        await ws.send_str('0{"sid":"test","pingInterval":25000,"pingTimeout":20000}')
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                continue
+            if msg.data == f"40{NAMESPACE},":
+                await ws.send_str(f'40{NAMESPACE},{{"sid":"ns"}}')
+            elif msg.data.startswith(f"42{NAMESPACE},"):
+                self.events.append(json.loads(msg.data[len(NAMESPACE) + 3:]))
+        return ws
+    
+    async def push(self, event: str, data) -> None:
+        await self.ws.send_str(f"42{NAMESPACE},{json.dumps([event, data])}")
+    
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/socket.io/', self._handler)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = f"ws://127.0.0.1:{self._runner.addresses[0][1]}"
+    
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+def test_pushes_are_keyed_by_slug_and_stored_by_market_id():
+    async def main():
+        socket = FakeMarketsSocket()
+        await socket.start()
+        
+        async def no_rest(market_id):
+            return None
+        
+        feed = LimitlessOrderbookFeed(no_rest, LimitlessClient.book_from_orderbook, ws_url=socket.url)
+        try:
+            await feed.subscribe({'101': 'btc-above-100k-1500', '102': None})
+            await feed.start()
+            await wait_until(lambda: socket.events)
+            assert socket.events[0] == ['subscribe_market_prices', {'marketSlugs': ['btc-above-100k-1500']}]
+            
+            await socket.push('orderbookUpdate', {
+                'marketSlug': 'btc-above-100k-1500',
+                'orderbook': {
+                    'yes': {'bids': [{'price': 0.40, 'size': 5}], 'asks': [{'price': 0.42, 'size': 7}]},
+                    'no': {'bids': [{'price': 0.57, 'size': 3}], 'asks': [{'price': 0.60, 'size': 9}]},
+                },
+            })
+            await wait_until(lambda: feed.get_book('101') is not None)
+            assert feed.get_book('101').yes_ask == 0.42
+            assert feed.get_book('101').no_ask == 0.60
+            assert feed.get_book('btc-above-100k-1500') is None
+            assert feed.stats['pushes'] == 1
+            
+            # Released markets are dropped from the socket's subscription too
+            await feed.unsubscribe(['101'])
+            await wait_until(lambda: len(socket.events) == 2)
+            assert socket.events[1] == ['subscribe_market_prices', {'marketSlugs': []}]
+            assert feed.get_book('101') is None
+        finally:
+            await feed.stop()
+            await socket.stop()
+    
+    asyncio.run(main())
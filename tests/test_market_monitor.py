@@ -0,0 +1,61 @@
+"""MarketMonitor discovery against a Polymarket listing whose second page fails"""
+import asyncio
+from decimal import Decimal
+
+from clients.decoders import PolymarketMarket
+from clients.polymarket_client import PolymarketClient
+from core.market_monitor import MarketMonitor
+from core.market_registry import POLYMARKET
+
+
+def hourly_market(n: int) -> PolymarketMarket:
+    return PolymarketMarket(
+        condition_id=f"cond-{n}",
+        question=f"BTC above ${100000 + n},000 at 15:00 UTC?",
+        active=True,
+        tokens=((f"yes-{n}", 'Yes'), (f"no-{n}", 'No'))
+    )
+
+
+class EmptyLimitless:
+    """Limitless side with nothing listed"""
+    
+    discovery_complete = True
+    
+    async def iter_active_hourly_markets(self):
+        return
+        yield
+
+
+def test_partial_listing_does_not_delist_markets_from_later_pages():
+    async def main():
+        polymarket = PolymarketClient("0x" + "11" * 32)
+        pages = {None: ([hourly_market(1)], 'page-2'), 'page-2': ([hourly_market(2)], None)}
+        
+        async def fetch_page(cursor):
+            page = pages[cursor]
+            if isinstance(page, Exception):
+                raise page
+            return page
+        
+        polymarket._fetch_markets_page = fetch_page
+        monitor = MarketMonitor(EmptyLimitless(), polymarket, Decimal('100'))
+        try:
+            await monitor.find_matching_markets()
+            assert polymarket.discovery_complete
+            assert {r.id for r in monitor.registry.records(POLYMARKET)} == {'cond-1', 'cond-2'}
+            
+            # Page 2 fails: the walk ends early and cond-2 must survive
+            pages['page-2'] = ConnectionError("page 2 timed out")
+            await monitor.find_matching_markets()
+            assert not polymarket.discovery_complete
+            assert {r.id for r in monitor.registry.records(POLYMARKET)} == {'cond-1', 'cond-2'}
+            
+            # A complete walk without cond-2 delists it
+            pages['page-2'] = ([], None)
+            await monitor.find_matching_markets()
+            assert {r.id for r in monitor.registry.records(POLYMARKET)} == {'cond-1'}
+        finally:
+            await polymarket.close()
+    
+    asyncio.run(main())
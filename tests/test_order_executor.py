@@ -0,0 +1,78 @@
+"""OrderExecutor grouped flush against fake venue clients"""
+import asyncio
+from decimal import Decimal
+
+from core.arbitrage_engine import Opportunity, Sizing
+from core.match_index import MarketMatch
+from core.order_executor import OrderExecutor
+
+
+class FakeVenue:
+    """Records each batch and answers with replies(orders)"""
+    
+    def __init__(self, replies):
+        self.replies = replies
+        self.batches = []
+    
+    async def place_orders_batch(self, orders):
+        self.batches.append(orders)
+        return self.replies(orders)
+
+
+def make_arbitrage(n: int):
+    match = MarketMatch(f"lim-{n}", f"cond-{n}", f"yes-{n}", f"no-{n}", Decimal(100000), Decimal(100000), "15:00")
+    opportunity = Opportunity('YES_LIMITLESS_NO_POLYMARKET', 'YES', 4000, 'NO', 5000, 9000)
+    sizing = Sizing(
+        size=Decimal('11.05'),
+        limitless_vwap=Decimal('0.4'),
+        polymarket_vwap=Decimal('0.5'),
+        limitless_limit=Decimal('0.4'),
+        polymarket_limit=Decimal('0.5'),
+        expected_profit=Decimal('1.10'),
+        levels=1
+    )
+    return opportunity, sizing, match
+
+
+def run(executor, count):
+    async def main():
+        return await asyncio.wait_for(
+            asyncio.gather(*(executor.execute_arbitrage(*make_arbitrage(n)) for n in range(count))),
+            timeout=2.0
+        )
+    return asyncio.run(main())
+
+
+def test_same_tick_arbitrages_share_one_batch_per_venue():
+    limitless = FakeVenue(lambda orders: [{'id': o['market_id']} for o in orders])
+    polymarket = FakeVenue(lambda orders: [{'orderID': o['token_id']} for o in orders])
+    
+    results = run(OrderExecutor(limitless, polymarket), 3)
+    
+    assert len(limitless.batches) == 1 and len(polymarket.batches) == 1
+    assert [o['market_id'] for o in limitless.batches[0]] == ['lim-0', 'lim-1', 'lim-2']
+    assert [o['token_id'] for o in polymarket.batches[0]] == ['no-0', 'no-1', 'no-2']
+    assert all(r.success for r in results)
+    assert [r.limitless_order['id'] for r in results] == ['lim-0', 'lim-1', 'lim-2']
+    assert [r.polymarket_order['orderID'] for r in results] == ['no-0', 'no-1', 'no-2']
+
+
+def test_malformed_reply_fails_the_leg_instead_of_hanging():
+    limitless = FakeVenue(lambda orders: [['not', 'a', 'dict'] for _ in orders])
+    polymarket = FakeVenue(lambda orders: [{'orderID': 'x'} for _ in orders])
+    
+    results = run(OrderExecutor(limitless, polymarket), 2)
+    
+    assert [r.success for r in results] == [False, False]
+    assert all(r.limitless_order is None and r.polymarket_order for r in results)
+
+
+def test_short_result_list_resolves_every_arbitrage():
+    limitless = FakeVenue(lambda orders: [{'id': 'only-one'}])
+    polymarket = FakeVenue(lambda orders: [{'orderID': 'x'} for _ in orders])
+    
+    results = run(OrderExecutor(limitless, polymarket), 3)
+    
+    assert results[0].success
+    assert [r.success for r in results[1:]] == [False, False]
+    assert results[2].error == "No result for this arbitrage"
@@ -0,0 +1,169 @@
+"""PolymarketMarketStream against a local aiohttp WebSocket stand-in for the market channel"""
+import asyncio
+import json
+
+from aiohttp import WSMsgType, web
+
+from clients.polymarket_stream import PolymarketMarketStream
+from tests.helpers import wait_until
+
+
+class FakeMarketChannel:
+    """Local market-channel server recording what each connection sent"""
+    
+    def __init__(self):
+        self.connections: asyncio.Queue = asyncio.Queue()
+        self.received = []  # (connection number, decoded message)
+        self._count = 0
+        self._runner = None
+        self.url = None
+    
+    async def _handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._count += 1
+        number = self._count
+        await self.connections.put(ws)
+        async for msg in ws:
+            if msg.type == WSMsgType.TEXT and msg.data != 'PING':
+                self.received.append((number, json.loads(msg.data)))
+        return ws
+    
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/ws/market', self._handler)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"ws://127.0.0.1:{port}/ws/market"
+    
+    async def stop(self):
+        await self._runner.cleanup()
+    
+    def messages(self, connection: int):
+        return [message for number, message in self.received if number == connection]
+
+
+def snapshot(asset_id, bids, asks):
+    return {
+        'event_type': 'book',
+        'asset_id': asset_id,
+        'bids': [{'price': p, 'size': s} for p, s in bids],
+        'asks': [{'price': p, 'size': s} for p, s in asks],
+    }
+
+
+def run_with_stream(scenario, heartbeat_interval: float = 60.0):
+    """Run scenario(channel, stream, ws) once the stream has connected and subscribed yes/no tokens"""
+    async def main():
+        channel = FakeMarketChannel()
+        await channel.start()
+        stream = PolymarketMarketStream(
+            url=channel.url,
+            heartbeat_interval=heartbeat_interval,
+            reconnect_min_wait=0.01,
+            reconnect_max_wait=0.02
+        )
+        try:
+            await stream.subscribe(['yes-token', 'no-token'])
+            await stream.start()
+            ws = await asyncio.wait_for(channel.connections.get(), 2.0)
+            await wait_until(lambda: channel.messages(1))
+            await scenario(channel, stream, ws)
+        finally:
+            await stream.stop()
+            await channel.stop()
+    
+    asyncio.run(main())
+
+
+def test_book_snapshot_builds_local_book():
+    async def scenario(channel, stream, ws):
+        assert channel.messages(1)[0] == {'assets_ids': ['no-token', 'yes-token'], 'type': 'market'}
+        
+        await ws.send_json(snapshot('yes-token', [('0.48', '100'), ('0.47', '50')], [('0.52', '80'), ('0.55', '10')]))
+        await wait_until(lambda: stream.get_book('yes-token') is not None)
+        
+        book = stream.get_book('yes-token')
+        assert book.best_bid == 0.48
+        assert book.best_ask == 0.52
+        assert list(book.asks.levels()) == [(0.52, 80.0), (0.55, 10.0)]
+        # The market book needs both tokens synced
+        assert stream.get_market_book('cond', 'yes-token', 'no-token') is None
+    
+    run_with_stream(scenario)
+
+
+def test_price_change_updates_local_book():
+    async def scenario(channel, stream, ws):
+        await ws.send_json([
+            snapshot('yes-token', [('0.48', '100')], [('0.52', '80'), ('0.55', '10')]),
+            snapshot('no-token', [('0.47', '60')], [('0.53', '40')]),
+        ])
+        await wait_until(lambda: stream.get_market_book('cond', 'yes-token', 'no-token') is not None)
+        
+        await ws.send_json({
+            'event_type': 'price_change',
+            'price_changes': [
+                {'asset_id': 'yes-token', 'side': 'SELL', 'price': '0.52', 'size': '0'},
+                {'asset_id': 'yes-token', 'side': 'SELL', 'price': '0.51', 'size': '25'},
+                {'asset_id': 'yes-token', 'side': 'BUY', 'price': '0.48', 'size': '70'},
+            ],
+        })
+        await wait_until(lambda: stream.get_book('yes-token').best_ask == 0.51)
+        
+        book = stream.get_book('yes-token')
+        assert list(book.asks.levels()) == [(0.51, 25.0), (0.55, 10.0)]
+        assert list(book.bids.levels()) == [(0.48, 70.0)]
+        market = stream.get_market_book('cond', 'yes-token', 'no-token')
+        assert market.yes_ask == 0.51
+        assert market.no_ask == 0.53
+    
+    run_with_stream(scenario)
+
+
+def test_reconnect_resubscribes_all_tracked_tokens():
+    async def scenario(channel, stream, ws):
+        await ws.send_json(snapshot('yes-token', [('0.48', '100')], [('0.52', '80')]))
+        await wait_until(lambda: stream.get_book('yes-token') is not None)
+        
+        await stream.subscribe(['late-token'])
+        await wait_until(lambda: len(channel.messages(1)) == 2)
+        assert channel.messages(1)[1] == {'assets_ids': ['late-token'], 'operation': 'subscribe'}
+        
+        # Forced disconnect: books go stale, the stream reconnects and resubscribes
+        await ws.close()
+        await wait_until(lambda: stream.get_book('yes-token') is None)
+        ws = await asyncio.wait_for(channel.connections.get(), 2.0)
+        await wait_until(lambda: channel.messages(2))
+        assert channel.messages(2)[0] == {
+            'assets_ids': ['late-token', 'no-token', 'yes-token'], 'type': 'market'
+        }
+        assert stream.stats['reconnects'] >= 1
+        
+        await ws.send_json(snapshot('yes-token', [('0.49', '10')], [('0.50', '10')]))
+        await wait_until(lambda: stream.get_book('yes-token') is not None)
+        assert stream.get_book('yes-token').best_ask == 0.50
+    
+    run_with_stream(scenario)
+
+
+def test_silent_connection_is_not_served_and_reconnects():
+    # The stand-in never answers PING, so the socket looks half-open
+    async def scenario(channel, stream, ws):
+        await ws.send_json([
+            snapshot('yes-token', [('0.48', '100')], [('0.52', '80')]),
+            snapshot('no-token', [('0.47', '60')], [('0.53', '40')]),
+        ])
+        await wait_until(lambda: stream.get_market_book('cond', 'yes-token', 'no-token') is not None)
+        
+        await wait_until(lambda: stream.get_book('yes-token') is None)
+        assert stream.get_market_book('cond', 'yes-token', 'no-token') is None
+        
+        await asyncio.wait_for(channel.connections.get(), 2.0)
+        await wait_until(lambda: channel.messages(2))
+        assert stream.stats['silent_drops'] >= 1
+    
+    run_with_stream(scenario, heartbeat_interval=0.1)
@@ -0,0 +1,65 @@
+"""HttpTransport hedging against a scripted backend"""
+import asyncio
+
+from clients.http_backends import HttpBackend
+from clients.transport import HttpTransport
+from utils.hedging import RequestHedger
+
+
+class ScriptedBackend(HttpBackend):
+    """Answers each send with the next (delay, status) from a script"""
+    
+    name = "scripted"
+    
+    def __init__(self, script):
+        super().__init__(
+            pool_size=10, pool_per_host=10, dns_cache_ttl=0, keepalive_timeout=1.0,
+            connect_timeout=1.0, default_timeout=1.0, default_headers={}, transport_name="test"
+        )
+        self.script = list(script)
+        self.sent = 0
+    
+    async def send(self, method, url, *, params, headers, data, json_body, timeout, operation="default"):
+        delay, status = self.script[min(self.sent, len(self.script) - 1)]
+        self.sent += 1
+        await asyncio.sleep(delay)
+        return status, {}, b'{}'
+
+
+def make_transport(backend, max_concurrent=20):
+    transport = HttpTransport("http://venue.test", max_concurrent=max_concurrent)
+    transport._backend = backend
+    return transport
+
+
+def test_hedge_latency_samples_exclude_queueing():
+    async def main():
+        backend = ScriptedBackend([(0.05, 200)])
+        transport = make_transport(backend, max_concurrent=1)
+        hedger = RequestHedger(min_samples=100)
+        await asyncio.gather(*(
+            transport.request("GET", "/book", operation="orderbook", hedger=hedger, hedge_key="book")
+            for _ in range(4)
+        ))
+        samples = hedger.latency._samples["book"]
+        # Requests 2-4 waited behind the gate; only their wire time counts
+        assert len(samples) == 4
+        assert max(samples) < 0.12
+    
+    asyncio.run(main())
+
+
+def test_fast_error_loses_the_hedge_race():
+    async def main():
+        # Primary is slow but fine, the hedge fails fast
+        backend = ScriptedBackend([(0.2, 200), (0.0, 503)])
+        transport = make_transport(backend)
+        hedger = RequestHedger(min_samples=1, min_delay=0.01)
+        hedger.latency.record("book", 0.01)
+        response = await transport.request("GET", "/book", operation="orderbook", hedger=hedger, hedge_key="book")
+        assert response.status == 200
+        assert backend.sent == 2
+        assert hedger.stats.hedges == 1
+        assert hedger.stats.hedge_wins == 0
+    
+    asyncio.run(main())
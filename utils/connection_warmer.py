@@ -0,0 +1,101 @@
+"""Connection pre-warming ahead of hour boundaries plus keep-alive pings"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# warm(connections) -> number of connections that answered
+WarmFn = Callable[[int], Awaitable[int]]
+
+
+@dataclass
+class WarmerStats:
+    """Warm-up and ping counters"""
+    primes: int = 0
+    pings: int = 0
+    failures: int = 0
+    last_prime_at: Optional[float] = None
+
+
+class ConnectionWarmer:
+    """
+    Keeps every venue's connection pool hot
+    
+    Hourly markets list on the hour and opportunities cluster right after,
+    so `reprime_lead` seconds before each hour every target opens
+    `connections` connections; in between, every `ping_interval` seconds
+    each target gets `connections` concurrent cheap requests, one per
+    pooled connection, so none of them sits idle long enough to be reaped.
+    """
+    
+    def __init__(
+        self,
+        targets: List[Tuple[str, WarmFn]],
+        connections: int = 4,
+        ping_interval: float = 20.0,
+        reprime_lead: float = 30.0
+    ):
+        self.targets = targets
+        self.connections = connections
+        self.ping_interval = ping_interval
+        self.reprime_lead = reprime_lead
+        self.stats = WarmerStats()
+        self._task: Optional[asyncio.Task] = None
+    
+    async def _touch(self, connections: int) -> None:
+        results = await asyncio.gather(
+            *(warm(connections) for _, warm in self.targets),
+            return_exceptions=True
+        )
+        for (name, _), result in zip(self.targets, results):
+            if isinstance(result, BaseException) or not result:
+                self.stats.failures += 1
+                logger.debug(f"{name} warm-up failed: {result}")
+    
+    async def prime(self) -> None:
+        """Open a full set of connections on every target"""
+        await self._touch(self.connections)
+        self.stats.primes += 1
+        self.stats.last_prime_at = time.time()
+        logger.info(f"Connection pools primed ({len(self.targets)} venues, {self.connections} connections each)")
+    
+    def _seconds_to_reprime(self) -> float:
+        now = time.time()
+        next_hour = (int(now) // 3600 + 1) * 3600
+        until = next_hour - self.reprime_lead - now
+        return until if until > 0 else until + 3600
+    
+    async def _run(self) -> None:
+        while True:
+            until_reprime = self._seconds_to_reprime()
+            if until_reprime <= self.ping_interval:
+                await asyncio.sleep(until_reprime)
+                await self.prime()
+                continue
+            
+            await asyncio.sleep(self.ping_interval)
+            await self._touch(self.connections)
+            self.stats.pings += 1
+    
+    async def start(self) -> None:
+        """Prime now, then keep the pools warm in the background"""
+        await self.prime()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'primes': self.stats.primes,
+            'pings': self.stats.pings,
+            'failures': self.stats.failures,
+            'seconds_to_reprime': round(self._seconds_to_reprime(), 1),
+        }
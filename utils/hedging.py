@@ -0,0 +1,135 @@
+"""Budgeted request hedging driven by rolling per-endpoint latency"""
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyTracker:
+    """Rolling window of request latencies per endpoint"""
+    
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+    
+    def record(self, key: str, latency: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(latency)
+    
+    def percentile(self, key: str, q: float) -> Optional[float]:
+        """q-quantile of the window, or None until enough samples exist"""
+        samples = self._samples.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@dataclass
+class HedgeStats:
+    """Hedge counters"""
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+
+
+class RequestHedger:
+    """
+    Fires a duplicate request when the first is slower than the endpoint's
+    rolling percentile; the first response wins and the other is cancelled
+    
+    Hedges are paid for from a token budget that refills by `budget_ratio`
+    per request, so at most that fraction of requests is ever duplicated.
+    """
+    
+    def __init__(
+        self,
+        percentile: float = 0.9,
+        budget_ratio: float = 0.1,
+        max_burst: float = 5.0,
+        min_delay: float = 0.005,
+        window: int = 200,
+        min_samples: int = 20
+    ):
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.max_burst = max_burst
+        self.min_delay = min_delay
+        self.latency = LatencyTracker(window=window, min_samples=min_samples)
+        self.stats = HedgeStats()
+        self._tokens = max_burst
+    
+    @classmethod
+    def from_config(cls, config) -> "RequestHedger":
+        return cls(percentile=config.HEDGE_PERCENTILE, budget_ratio=config.HEDGE_BUDGET_RATIO)
+    
+    def _take_budget(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        self.stats.budget_denied += 1
+        return False
+    
+    async def _timed(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.perf_counter()
+        result = await fn()
+        self.latency.record(key, time.perf_counter() - started)
+        return result
+    
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fn`, hedging it once if it outlives the endpoint's percentile latency"""
+        self.stats.requests += 1
+        self._tokens = min(self.max_burst, self._tokens + self.budget_ratio)
+        
+        delay = self.latency.percentile(key, self.percentile)
+        if delay is None:
+            return await self._timed(key, fn)
+        
+        primary = asyncio.create_task(self._timed(key, fn))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=max(self.min_delay, delay))
+            if done or not self._take_budget():
+                return await primary
+            
+            self.stats.hedges += 1
+            hedge = asyncio.create_task(self._timed(key, fn))
+            tasks.append(hedge)
+            pending = {primary, hedge}
+            error: Optional[BaseException] = None
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.stats.hedge_wins += 1
+                        for loser in pending:
+                            loser.cancel()
+                        return task.result()
+                    error = task.exception()
+            
+            raise error
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+    
+    def snapshot(self) -> Dict[str, Any]:
+        stats = self.stats
+        return {
+            'requests': stats.requests,
+            'hedges': stats.hedges,
+            'hedge_wins': stats.hedge_wins,
+            'hedge_rate': stats.hedges / stats.requests if stats.requests else 0.0,
+            'win_ratio': stats.hedge_wins / stats.hedges if stats.hedges else 0.0,
+            'budget_denied': stats.budget_denied,
+        }
@@ -0,0 +1,91 @@
+"""Async page walkers with bounded prefetch"""
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+async def iter_cursor_pages(
+    fetch_page: Callable[[Optional[str]], Awaitable[Tuple[List[Any], Optional[str]]]],
+    prefetch: int = 2,
+    first_cursor: Optional[str] = None
+) -> AsyncIterator[List[Any]]:
+    """
+    Walk a cursor-paginated endpoint, fetching ahead of the consumer
+    
+    fetch_page(cursor) returns (items, next_cursor); a falsy next_cursor
+    ends the walk. Up to `prefetch` pages are buffered while the consumer
+    is still processing earlier ones.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+    
+    async def producer():
+        cursor = first_cursor
+        seen = set()
+        try:
+            while True:
+                items, cursor = await fetch_page(cursor)
+                await queue.put(items)
+                if not cursor or cursor in seen:
+                    break
+                seen.add(cursor)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(_DONE)
+    
+    task = asyncio.create_task(producer())
+    try:
+        while True:
+            page = await queue.get()
+            if page is _DONE:
+                break
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+async def iter_numbered_pages(
+    fetch_page: Callable[[int], Awaitable[List[Any]]],
+    page_size: int,
+    prefetch: int = 3,
+    first_page: int = 1
+) -> AsyncIterator[List[Any]]:
+    """
+    Walk a page-number endpoint with up to `prefetch` requests in flight
+    
+    Pages are yielded in order; the walk ends at the first short page.
+    """
+    prefetch = max(1, prefetch)
+    next_page = first_page
+    pending: List[asyncio.Task] = []
+    
+    def schedule():
+        nonlocal next_page
+        pending.append(asyncio.create_task(fetch_page(next_page)))
+        next_page += 1
+    
+    try:
+        for _ in range(prefetch):
+            schedule()
+        
+        while pending:
+            items = await pending.pop(0)
+            yield items
+            if len(items) < page_size:
+                break
+            schedule()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
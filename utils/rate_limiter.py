@@ -0,0 +1,153 @@
+"""Per-venue token-bucket rate limiter with priority lanes"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Request lanes, lowest value served first"""
+    ORDER = 0
+    PRICE = 1
+    DISCOVERY = 2
+
+
+@dataclass
+class RateLimiterStats:
+    """Grant, wait and throttle counters"""
+    granted: Dict[str, int] = field(default_factory=dict)
+    waited: Dict[str, int] = field(default_factory=dict)
+    throttled: int = 0
+    paused_seconds: float = 0.0
+
+
+class PriorityRateLimiter:
+    """
+    Token bucket shared by all traffic to one venue
+    
+    Waiters are served strictly by priority (orders, then price reads, then
+    discovery). The last `order_reserve` tokens can only be spent by
+    orders, so market-data bursts can never leave an order waiting for a
+    refill. A `Retry-After` from the venue pauses every lane until it expires.
+    """
+    
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        order_reserve: int = 2,
+        name: str = "venue"
+    ):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.order_reserve = min(order_reserve, self.burst - 1)
+        self.name = name
+        self.stats = RateLimiterStats()
+        
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def _floor(self, priority: Priority) -> float:
+        """Tokens that must remain after a grant in this lane"""
+        return 0.0 if priority == Priority.ORDER else float(self.order_reserve)
+    
+    def _try_take(self, priority: Priority) -> bool:
+        if time.monotonic() < self._paused_until:
+            return False
+        self._refill()
+        if self._tokens - 1.0 >= self._floor(priority):
+            self._tokens -= 1.0
+            return True
+        return False
+    
+    def _count(self, bucket: Dict[str, int], priority: Priority) -> None:
+        bucket[priority.name] = bucket.get(priority.name, 0) + 1
+    
+    async def acquire(self, priority: Priority = Priority.PRICE) -> None:
+        """Wait for a token in the given lane"""
+        # Fast path: nobody of equal or higher priority is queued
+        if not any(p <= priority for p, _, fut in self._waiters if not fut.done()):
+            if self._try_take(priority):
+                self._count(self.stats.granted, priority)
+                return
+        
+        self._count(self.stats.waited, priority)
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), future))
+        self._ensure_dispatcher()
+        self._wakeup.set()
+        await future
+        self._count(self.stats.granted, priority)
+    
+    def pause(self, seconds: float) -> None:
+        """Stop granting tokens for `seconds` (venue sent Retry-After / 429)"""
+        if seconds <= 0:
+            return
+        until = time.monotonic() + seconds
+        if until > self._paused_until:
+            self.stats.paused_seconds += until - max(self._paused_until, time.monotonic())
+            self._paused_until = until
+        self.stats.throttled += 1
+        logger.warning(f"{self.name} rate limited, pausing {seconds:.2f}s")
+    
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+    
+    async def _dispatch(self) -> None:
+        while True:
+            while self._waiters and self._waiters[0][2].done():
+                heapq.heappop(self._waiters)
+            if not self._waiters:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            
+            priority, _, future = self._waiters[0]
+            if self._try_take(Priority(priority)):
+                heapq.heappop(self._waiters)
+                future.set_result(None)
+                continue
+            
+            # Sleep until the pause lifts or enough tokens accrue, or a new waiter arrives
+            now = time.monotonic()
+            needed = 1.0 + self._floor(Priority(priority)) - self._tokens
+            delay = max(self._paused_until - now, needed / self.rate if self.rate > 0 else 1.0, 0.001)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+    
+    def snapshot(self) -> Dict:
+        return {
+            'name': self.name,
+            'tokens': round(self._tokens, 2),
+            'queued': sum(1 for _, _, fut in self._waiters if not fut.done()),
+            'granted': dict(self.stats.granted),
+            'waited': dict(self.stats.waited),
+            'throttled': self.stats.throttled,
+            'paused_seconds': round(self.stats.paused_seconds, 2),
+        }
+    
+    async def close(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+            self._dispatcher = None
@@ -0,0 +1,181 @@
+"""Deadline-aware retry policy with jittered exponential backoff"""
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES: FrozenSet[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class RetryStats:
+    """Retry counters, overall and per operation"""
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    successes: int = 0
+    give_ups: int = 0
+    deadline_exhausted: int = 0
+    by_operation: Dict[str, int] = field(default_factory=dict)
+
+
+class RetryPolicy:
+    """
+    One retry engine per client
+    
+    Retries only transient failures (timeouts, connection errors and
+    retryable HTTP statuses), sleeps with full jitter, and never lets a
+    call run past its total deadline budget.
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        min_wait: float = 0.2,
+        max_wait: float = 2.0,
+        deadline: Optional[float] = 6.0,
+        retryable_statuses: FrozenSet[int] = RETRYABLE_STATUSES,
+        retryable_exceptions: Tuple[Type[BaseException], ...] = (asyncio.TimeoutError, ConnectionError),
+        name: str = "retry"
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self.deadline = deadline
+        self.retryable_statuses = retryable_statuses
+        self.retryable_exceptions = retryable_exceptions
+        self.name = name
+        self.stats = RetryStats()
+    
+    @classmethod
+    def from_config(
+        cls,
+        config,
+        retryable_exceptions: Tuple[Type[BaseException], ...] = (asyncio.TimeoutError, ConnectionError),
+        name: str = "retry"
+    ) -> "RetryPolicy":
+        """Build a policy from BotConfig retry settings"""
+        return cls(
+            max_attempts=config.MAX_RETRIES,
+            min_wait=config.RETRY_MIN_WAIT,
+            max_wait=config.RETRY_MAX_WAIT,
+            deadline=config.RETRY_DEADLINE,
+            retryable_exceptions=retryable_exceptions,
+            name=name
+        )
+    
+    @staticmethod
+    def _status_of(exc: BaseException) -> Optional[int]:
+        status = getattr(exc, 'status', None)
+        if status is None:
+            status = getattr(exc, 'status_code', None)
+        return status if isinstance(status, int) else None
+    
+    def is_retryable(
+        self,
+        exc: BaseException,
+        statuses: Optional[FrozenSet[int]] = None,
+        idempotent: bool = True
+    ) -> bool:
+        """
+        A status-less failure (timeout, dropped connection) of a non-idempotent
+        call may have reached the venue, so only an explicit status retries it
+        """
+        status = self._status_of(exc)
+        if status is not None:
+            return status in (self.retryable_statuses if statuses is None else statuses)
+        return idempotent and isinstance(exc, self.retryable_exceptions)
+    
+    def backoff(self, retry_number: int, exc: Optional[BaseException] = None) -> float:
+        """Full-jitter exponential backoff, honouring a server Retry-After hint"""
+        ceiling = min(self.max_wait, self.min_wait * (2 ** retry_number))
+        wait = random.uniform(0, ceiling)
+        retry_after = getattr(exc, 'retry_after', None)
+        if retry_after:
+            wait = max(wait, float(retry_after))
+        return wait
+    
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        *,
+        operation: str = "default",
+        deadline: Optional[float] = None,
+        statuses: Optional[FrozenSet[int]] = None,
+        max_attempts: Optional[int] = None,
+        idempotent: bool = True
+    ) -> Any:
+        """
+        Run `fn` until it succeeds, fails permanently, or the budget runs out
+        
+        Args:
+            fn: Zero-argument coroutine factory, called once per attempt
+            operation: Label for per-operation counters
+            deadline: Total budget in seconds (defaults to the policy's)
+            statuses: Override of the retryable HTTP statuses for this call
+            max_attempts: Override of the attempt cap for this call
+            idempotent: False for calls such as order POSTs that must not be
+                sent twice: attempts are never cut short by the deadline (an
+                abandoned attempt may still be in flight) and only failures
+                carrying one of `statuses` are retried
+        """
+        stats = self.stats
+        stats.calls += 1
+        budget = self.deadline if deadline is None else deadline
+        expires_at = time.monotonic() + budget if budget else None
+        attempts_allowed = self.max_attempts if max_attempts is None else max(1, max_attempts)
+        
+        attempt = 0
+        while True:
+            attempt += 1
+            stats.attempts += 1
+            stats.by_operation[operation] = stats.by_operation.get(operation, 0) + 1
+            try:
+                if expires_at is None:
+                    result = await fn()
+                else:
+                    remaining = expires_at - time.monotonic()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError(f"{self.name} deadline exhausted")
+                    if idempotent:
+                        result = await asyncio.wait_for(fn(), timeout=remaining)
+                    else:
+                        result = await fn()
+                stats.successes += 1
+                return result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempt >= attempts_allowed or not self.is_retryable(e, statuses, idempotent):
+                    stats.give_ups += 1
+                    raise
+                
+                wait = self.backoff(attempt - 1, e)
+                if expires_at is not None and time.monotonic() + wait >= expires_at:
+                    stats.give_ups += 1
+                    stats.deadline_exhausted += 1
+                    raise
+                
+                stats.retries += 1
+                logger.debug(
+                    f"{self.name}: {operation} attempt {attempt} failed ({e}); "
+                    f"retrying in {wait:.2f}s"
+                )
+                await asyncio.sleep(wait)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        stats = self.stats
+        return {
+            'name': self.name,
+            'calls': stats.calls,
+            'attempts': stats.attempts,
+            'retries': stats.retries,
+            'successes': stats.successes,
+            'give_ups': stats.give_ups,
+            'deadline_exhausted': stats.deadline_exhausted,
+            'by_operation': dict(stats.by_operation),
+        }